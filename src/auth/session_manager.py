@@ -19,6 +19,58 @@ from src.models.exceptions import (
     GLPIError
 )
 
+# Import condicional: orjson (extensão C) acelera a serialização dos payloads
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Import condicional: h2 habilita HTTP/2 (várias requisições por conexão)
+try:
+    import h2  # noqa: F401
+    _HAS_H2 = True
+except ImportError:
+    _HAS_H2 = False
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def pooled_client_kwargs(max_connections: int, max_keepalive: int) -> Dict[str, Any]:
+    """
+    Parâmetros comuns dos clientes httpx para o GLPI: pool keep-alive,
+    HTTP/2 quando disponível, uma nova tentativa em falhas de conexão e
+    timeout de conexão separado do timeout de leitura.
+    """
+    return {
+        "timeout": httpx.Timeout(
+            settings.request_timeout, connect=settings.connection_timeout
+        ),
+        "transport": httpx.AsyncHTTPTransport(
+            http2=_HAS_H2,
+            retries=1,
+            limits=httpx.Limits(
+                max_keepalive_connections=max_keepalive,
+                max_connections=max_connections
+            )
+        ),
+    }
+
+
+def _json_body(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Argumentos de corpo JSON para o httpx.
+
+    Com orjson o corpo já vai serializado (content=); sem ele, ou para tipos
+    que o orjson não aceita, cai no json= padrão do httpx.
+    """
+    if _HAS_ORJSON:
+        try:
+            return {"content": orjson.dumps(payload), "headers": _JSON_HEADERS}
+        except TypeError:
+            pass
+    return {"json": payload}
+
 
 class SessionManager:
     """
@@ -62,19 +114,24 @@ class SessionManager:
         """Context manager exit."""
         await self.disconnect()
     
+    @property
+    def is_connected(self) -> bool:
+        """True se o cliente HTTP principal está criado e aberto."""
+        return self._client is not None and not self._client.is_closed
+    
     async def connect(self):
         """Estabelece conexão com GLPI e inicializa sessão."""
         if self._client is None:
             logger.info(f"Connecting to GLPI at {settings.glpi_base_url}")
             
-            # Configurar cliente HTTP com otimizações
+            # Configurar cliente HTTP com otimizações: um único pool keep-alive
+            # compartilhado por todos os serviços, HTTP/2 quando disponível e
+            # uma nova tentativa em falhas de conexão
             self._client = httpx.AsyncClient(
                 base_url=settings.glpi_base_url,
                 headers=settings.glpi_headers,
-                timeout=httpx.Timeout(settings.request_timeout),  # Timeout default
-                limits=httpx.Limits(
-                    max_keepalive_connections=10,
-                    max_connections=20
+                **pooled_client_kwargs(
+                    settings.max_connections, settings.max_keepalive_connections
                 )
             )
             
@@ -152,14 +209,13 @@ class SessionManager:
             "Authorization": f"user_token {user_token}"
         }
         
-        # Criar cliente HTTP
+        # Criar cliente HTTP: as chamadas das tools passam por este cliente,
+        # então ele precisa do mesmo pool/HTTP/2 do cliente principal
         client = httpx.AsyncClient(
             base_url=settings.glpi_base_url,
             headers=user_headers,
-            timeout=httpx.Timeout(settings.request_timeout),
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=10
+            **pooled_client_kwargs(
+                settings.user_max_connections, settings.user_max_keepalive_connections
             )
         )
         
@@ -368,10 +424,11 @@ class SessionManager:
         
         # GLPI API espera dados no formato {"input": {...}}
         payload = {"input": data} if data else {}
+        body = _json_body(payload)
         
         try:
             logger.debug(f"POST {endpoint} with data: {list(data.keys())}")
-            response = await client.post(endpoint, json=payload)
+            response = await client.post(endpoint, **body)
             
             # Verificar autenticação
             if response.status_code == 401:
@@ -381,7 +438,7 @@ class SessionManager:
                     client = await self._get_session_for_user(user_token)
                 else:
                     await self._init_session()
-                response = await client.post(endpoint, json=payload)
+                response = await client.post(endpoint, **body)
             
             response.raise_for_status()
             return response.json()
@@ -427,10 +484,11 @@ class SessionManager:
         
         # GLPI API espera dados no formato {"input": {...}}
         payload = {"input": data} if data else {}
+        body = _json_body(payload)
         
         try:
             logger.debug(f"PUT {endpoint} with data: {list(data.keys())}")
-            response = await client.put(endpoint, json=payload)
+            response = await client.put(endpoint, **body)
             
             # Verificar autenticação
             if response.status_code == 401:
@@ -440,7 +498,7 @@ class SessionManager:
                     client = await self._get_session_for_user(user_token)
                 else:
                     await self._init_session()
-                response = await client.put(endpoint, json=payload)
+                response = await client.put(endpoint, **body)
             
             response.raise_for_status()
             
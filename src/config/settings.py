@@ -57,8 +57,16 @@ class Settings(BaseSettings):
     # ============= HTTP Client =============
     connection_timeout: int = Field(default=30, alias="CONNECTION_TIMEOUT")
     request_timeout: int = Field(default=60, alias="REQUEST_TIMEOUT")
-    max_connections: int = Field(default=20, alias="MAX_CONNECTIONS")
-    max_keepalive_connections: int = Field(default=10, alias="MAX_KEEPALIVE_CONNECTIONS")
+    max_connections: int = Field(default=64, alias="MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(default=32, alias="MAX_KEEPALIVE_CONNECTIONS")
+    # Pool de cada sessão por user_token; cobre o ENRICH_CONCURRENCY sem fila
+    user_max_connections: int = Field(default=20, alias="USER_MAX_CONNECTIONS")
+    user_max_keepalive_connections: int = Field(default=10, alias="USER_MAX_KEEPALIVE_CONNECTIONS")
+    # Chamadas simultâneas do AdminService; acima de ~128 o GLPI tende a
+    # responder com timeouts em cascata em vez de mais vazão
+    admin_max_concurrency: int = Field(default=32, alias="ADMIN_MAX_CONCURRENCY")
+    # Buscas por computador em voo no enriquecimento de list_assets
+    enrich_concurrency: int = Field(default=16, alias="ENRICH_CONCURRENCY")
 
     # ============= Cache (RNF01) =============
     cache_ttl_seconds: int = Field(default=300, alias="CACHE_TTL_SECONDS")  # 5 minutos
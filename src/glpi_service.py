@@ -2,7 +2,8 @@
 Serviço principal de integração com GLPI.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable
+from datetime import datetime, timedelta
 from src.http_client import http_client
 from src.models import (
     Ticket, Asset, User, Group, Entity, Location,
@@ -10,6 +11,77 @@ from src.models import (
 )
 from src.logger import logger
 
+# Status numéricos de Ticket no GLPI (5 = solucionado, 6 = fechado)
+_SOLVED_STATUSES = frozenset({5, 6})
+_GLPI_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _format_duration(seconds: float) -> str:
+    """Formata duração em segundos como "Xh Ymin"."""
+    minutes = int(seconds // 60)
+    return f"{minutes // 60}h {minutes % 60}min"
+
+
+def _aggregate_ticket_stats(items: Iterable[Dict[str, Any]], since: str, now: str) -> Dict[str, Any]:
+    """
+    Agrega estatísticas de SLA em uma única passada sobre os tickets brutos.
+
+    Datas do GLPI ("YYYY-MM-DD HH:MM:SS") são comparadas como string,
+    sem parse por linha.
+
+    Args:
+        items: Tickets como retornados pela API (dicts)
+        since: Data mínima de abertura, no formato do GLPI
+        now: Instante de referência para atraso, no formato do GLPI
+
+    Returns:
+        Dict com opened, solved, in_progress, overdue e, quando houver
+        dados, avg_response_time, avg_resolution_time e sla_compliance
+    """
+    opened = solved = overdue = 0
+    response_total = response_count = 0
+    resolution_total = resolution_count = 0
+    with_deadline = on_time = 0
+
+    for item in items:
+        if (item.get("date") or "") < since:
+            continue
+        opened += 1
+
+        response = item.get("takeintoaccount_delay_stat") or 0
+        if response > 0:
+            response_total += response
+            response_count += 1
+
+        deadline = item.get("time_to_resolve")
+        if item.get("status") in _SOLVED_STATUSES:
+            solved += 1
+            resolution = item.get("solve_delay_stat") or 0
+            if resolution > 0:
+                resolution_total += resolution
+                resolution_count += 1
+            solvedate = item.get("solvedate")
+            # Sem data de solução não há como saber se cumpriu o prazo
+            if deadline and solvedate:
+                with_deadline += 1
+                on_time += solvedate <= deadline
+        elif deadline and deadline < now:
+            overdue += 1
+
+    stats: Dict[str, Any] = {
+        "opened": opened,
+        "solved": solved,
+        "in_progress": opened - solved,
+        "overdue": overdue,
+    }
+    if response_count:
+        stats["avg_response_time"] = _format_duration(response_total / response_count)
+    if resolution_count:
+        stats["avg_resolution_time"] = _format_duration(resolution_total / resolution_count)
+    if with_deadline:
+        stats["sla_compliance"] = round(100 * on_time / with_deadline, 1)
+    return stats
+
 
 class GLPIService:
     """Serviço de integração com GLPI."""
@@ -42,6 +114,69 @@ class GLPIService:
                 tickets.append(Ticket(**item))
         return tickets
 
+    async def list_ticket_category_ids(
+        self,
+        limit: int = 250,
+        offset: int = 0,
+        entity_id: Optional[int] = None,
+        period_days: Optional[int] = None
+    ) -> List[int]:
+        """
+        Lista apenas o ID de categoria de cada ticket (0 = sem categoria).
+
+        Args:
+            limit: Máximo de tickets lidos (IDs mais recentes primeiro)
+            offset: Offset para paginação
+            entity_id: Filtra pela entidade exata (None = todas)
+            period_days: Considera só tickets abertos nos últimos N dias (None = todos)
+        """
+        params = {"range": f"{offset}-{offset + limit - 1}", "order": "DESC"}
+
+        logger.info(f"Listing ticket categories with params: {params}")
+        result = await self.client.get("/apirest.php/Ticket", params=params)
+        if not isinstance(result, dict) or "data" not in result:
+            return []
+
+        items = result.get("data", [])
+        if entity_id is not None:
+            items = [item for item in items if item.get("entities_id") == entity_id]
+        if period_days is not None:
+            since = (datetime.now() - timedelta(days=period_days)).strftime(_GLPI_DATE_FORMAT)
+            items = [item for item in items if (item.get("date") or "") >= since]
+        return [item.get("itilcategories_id") or 0 for item in items]
+
+    async def get_ticket_stats(
+        self,
+        entity_id: Optional[int] = None,
+        period_days: int = 30,
+        limit: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        Estatísticas de SLA dos tickets abertos nos últimos period_days dias.
+
+        Args:
+            entity_id: Filtra pela entidade exata (None = todas)
+            period_days: Janela de abertura considerada
+            limit: Máximo de tickets lidos (IDs mais recentes primeiro)
+        """
+        params = {
+            "range": f"0-{limit - 1}",
+            "order": "DESC",
+        }
+
+        logger.info(f"Getting ticket stats (entity={entity_id}, period={period_days}d)")
+        result = await self.client.get("/apirest.php/Ticket", params=params)
+        items = result.get("data", []) if isinstance(result, dict) else []
+
+        if entity_id is not None:
+            items = (item for item in items if item.get("entities_id") == entity_id)
+
+        now = datetime.now()
+        since = now - timedelta(days=period_days)
+        return _aggregate_ticket_stats(
+            items, since.strftime(_GLPI_DATE_FORMAT), now.strftime(_GLPI_DATE_FORMAT)
+        )
+
     async def get_ticket(self, ticket_id: int) -> Ticket:
         """Obtém detalhes de um ticket."""
         logger.info(f"Getting ticket {ticket_id}")
@@ -156,6 +291,58 @@ class GLPIService:
                 assets.append(Asset(asset_type=asset_type or "Computer", **item_copy))
         return assets
 
+    async def find_first_asset(
+        self,
+        search_term: str,
+        asset_type: str = "Computer"
+    ) -> Optional[Asset]:
+        """
+        Busca o primeiro asset por nome ou serial (Search API com range 0-0).
+
+        Traz também patrimônio, usuário, localização e status exibidos pelo GLPI.
+        """
+        params = {
+            "criteria[0][field]": 1,  # Nome
+            "criteria[0][searchtype]": "contains",
+            "criteria[0][value]": search_term,
+            "criteria[1][link]": "OR",
+            "criteria[1][field]": 5,  # Serial
+            "criteria[1][searchtype]": "contains",
+            "criteria[1][value]": search_term,
+            "forcedisplay[0]": 2,
+            "forcedisplay[1]": 5,   # Serial
+            "forcedisplay[2]": 6,   # Patrimônio
+            "forcedisplay[3]": 70,  # Usuário
+            "forcedisplay[4]": 3,   # Localização
+            "forcedisplay[5]": 31,  # Status
+            "range": "0-0",
+        }
+
+        logger.info(f"Finding first {asset_type} matching: {search_term}")
+        result = await self.client.get(f"/apirest.php/search/{asset_type}", params=params)
+
+        rows = result.get("data") if isinstance(result, dict) else None
+        if not rows:
+            return None
+
+        row = rows[0]
+
+        def text(field: str) -> Optional[str]:
+            value = row.get(field)
+            return str(value) if value not in (None, "") else None
+
+        return Asset(
+            id=int(row.get("2") or 0),
+            name=row.get("1") or "",
+            asset_type=asset_type,
+            serial_number=text("5"),
+            otherserial=text("6"),
+            user=text("70"),
+            location=text("3"),
+            # Sem status no GLPI, não assume o default "active" do modelo
+            status=str(row.get("31") or "N/A")
+        )
+
     async def get_asset(self, asset_type: str, asset_id: int) -> Asset:
         """Obtém detalhes de um asset."""
         logger.info(f"Getting {asset_type} {asset_id}")
@@ -227,6 +414,43 @@ class GLPIService:
                 users.append(User(**item))
         return users
 
+    async def find_first_user(self, search_term: str) -> Optional[User]:
+        """Busca o primeiro usuário por login, nome ou sobrenome (range 0-0)."""
+        params = {
+            "criteria[0][field]": 1,  # Login
+            "criteria[0][searchtype]": "contains",
+            "criteria[0][value]": search_term,
+            "criteria[1][link]": "OR",
+            "criteria[1][field]": 9,  # Primeiro nome
+            "criteria[1][searchtype]": "contains",
+            "criteria[1][value]": search_term,
+            "criteria[2][link]": "OR",
+            "criteria[2][field]": 34,  # Sobrenome
+            "criteria[2][searchtype]": "contains",
+            "criteria[2][value]": search_term,
+            "forcedisplay[0]": 2,
+            "forcedisplay[1]": 5,
+            "forcedisplay[2]": 9,
+            "forcedisplay[3]": 34,
+            "range": "0-0",
+        }
+
+        logger.info(f"Finding first user matching: {search_term}")
+        result = await self.client.get("/apirest.php/search/User", params=params)
+
+        rows = result.get("data") if isinstance(result, dict) else None
+        if not rows:
+            return None
+
+        row = rows[0]
+        return User(
+            id=int(row.get("2") or 0),
+            name=row.get("1") or "",
+            firstname=row.get("9") or "",
+            lastname=row.get("34") or "",
+            email=row.get("5")
+        )
+
     async def get_user(self, user_id: int) -> User:
         """Obtém detalhes de um usuário."""
         logger.info(f"Getting user {user_id}")
@@ -25,6 +25,33 @@ from src.models.exceptions import (
 )
 from src.utils.helpers import logger
 
+# Import condicional: orjson (extensão C) acelera a serialização dos resultados
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _dumps_result(result: Any) -> str:
+    """
+    Serializa o resultado de uma tool para o campo text do MCP.
+
+    Usa orjson quando disponível; datetimes e tipos desconhecidos passam por
+    str(), como no fallback json.dumps(..., default=str).
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(
+                result,
+                default=str,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode("utf-8")
+        except TypeError:
+            # Ex.: inteiros acima de 64 bits - delegar ao json da stdlib
+            pass
+    return json.dumps(result, ensure_ascii=False, default=str)
+
 
 class MCPHandler:
     """
@@ -180,7 +207,9 @@ class MCPHandler:
 
         # ============= PROMPTS (2 tools - sistema de prompts profissionais) =============
         # Importar catálogo de prompts
-        from src.prompts_handlers.prompts import PROMPTS_CATALOG, handle_list_prompts, handle_get_prompt
+        from src.prompts_handlers.prompts import (
+            PROMPTS_CATALOG, PROMPTS_LIST_JSON, handle_list_prompts, handle_get_prompt
+        )
 
         # Tool 1: prompts/list
         tools["prompts_list"] = {
@@ -188,7 +217,9 @@ class MCPHandler:
             "description": "Lista todos os 15 prompts profissionais disponíveis para gestores e analistas. Retorna nome, descrição, categoria (gestao/suporte), audience (público-alvo) e argumentos de cada prompt. USE para descobrir quais prompts existem antes de executar",
             "input_schema": {"type": "object"},
             "handler": handle_list_prompts,
-            "category": "prompts"
+            "category": "prompts",
+            # Catálogo estático: resposta serializada uma única vez na importação
+            "serialized_result": PROMPTS_LIST_JSON
         }
 
         # Tool 2: prompts/get (executa prompt específico)
@@ -205,7 +236,7 @@ class MCPHandler:
                     },
                     "arguments": {
                         "type": "object",
-                        "description": "Argumentos do prompt (varia por prompt - veja prompts_list para detalhes)"
+                        "description": "Argumentos do prompt (varia por prompt - veja prompts_list para detalhes). Opcional: '_format' = 'compact' | 'detailed' | 'both' (padrão 'both'); 'compact' omite o relatório detalhado"
                     }
                 },
                 "required": ["name", "arguments"]
@@ -973,9 +1004,12 @@ class MCPHandler:
             # Validar argumentos contra schema (básico)
             self._validate_arguments(tool_name, arguments, tool_info["input_schema"])
             
-            # Executar tool
+            # Executar tool (tools com resultado estático já vêm serializadas)
             start_time = datetime.now()
-            result = await handler(**arguments)
+            text = tool_info.get("serialized_result")
+            if text is None:
+                result = await handler(**arguments)
+                text = _dumps_result(result)
             execution_time = (datetime.now() - start_time).total_seconds()
 
             # MCP Protocol 2024-11-05: tools/call DEVE retornar content array
@@ -984,7 +1018,7 @@ class MCPHandler:
                 "content": [
                     {
                         "type": "text",
-                        "text": json.dumps(result, ensure_ascii=False, default=str)
+                        "text": text
                     }
                 ]
             }
@@ -1070,13 +1104,9 @@ class MCPHandler:
 
                 result = await self.handle_call_tool(tool_name, arguments)
             elif method == "prompts/list":
-                # Redirecionar para o tool prompts_list e parsear resultado
-                import json
-                tool_result = await self.handle_call_tool("prompts_list", {})
-                # tool_result é uma lista [{"type": "text", "text": "..."}]
-                text_content = tool_result["content"][0]["text"]
-                prompts_data = json.loads(text_content)
-                result = {"prompts": prompts_data["prompts"]}
+                # Catálogo estático: o handler devolve a mesma resposta pré-montada
+                # ({"prompts": [...]}) a cada chamada, sem reconstruí-la
+                result = await self.tools["prompts_list"]["handler"]()
             elif method == "prompts/get":
                 # Redirecionar para o tool prompts_get
                 prompt_name = params.get("name")
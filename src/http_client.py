@@ -6,6 +6,7 @@ import httpx
 from typing import Optional, Dict, Any, List
 from src.config import settings
 from src.logger import logger
+from src.auth.session_manager import pooled_client_kwargs
 from src.models import (
     AuthenticationError,
     TimeoutError as GLPITimeoutError,
@@ -38,7 +39,9 @@ class HTTPClient:
             self._client = httpx.AsyncClient(
                 base_url=settings.glpi_base_url,
                 headers=settings.glpi_headers,
-                timeout=settings.request_timeout,
+                **pooled_client_kwargs(
+                    settings.max_connections, settings.max_keepalive_connections
+                )
             )
 
     async def disconnect(self):
@@ -36,6 +36,8 @@ async def lifespan(app: FastAPI):
     try:
         await http_client.connect()
         await session_manager.connect()  # Conectar session_manager para os services
+        if not session_manager.is_connected:
+            logger.warning("GLPI HTTP client is not open after startup")
         logger.info("Connected to GLPI successfully")
     except Exception as e:
         logger.error(f"Failed to connect to GLPI: {e}")
@@ -45,6 +47,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("MCP GLPI shutting down...")
+    await ai_integration.close()
     await session_manager.disconnect()
 
 
@@ -64,6 +64,8 @@ class Ticket(GLPIEntity):
     """Modelo de Ticket."""
     title: str = Field(..., description="Título do ticket")
     description: Optional[str] = None
+    content: Optional[str] = Field(default=None, description="Descrição do ticket (campo nativo do GLPI)")
+    date: Optional[str] = Field(default=None, description="Data de abertura (campo nativo do GLPI)")
     status: str = Field(default="new", description="Status do ticket")
     priority: int = Field(default=3, description="Prioridade (1-5)")
     requesters: List[int] = Field(default_factory=list, description="IDs dos solicitantes")
@@ -88,6 +90,9 @@ class Asset(GLPIEntity):
     manufacturer: Optional[str] = None
     status: str = Field(default="active", description="Status do asset")
     location_id: Optional[int] = None
+    otherserial: Optional[str] = Field(default=None, description="Número de patrimônio")
+    user: Optional[str] = Field(default=None, description="Usuário vinculado (nome exibido pelo GLPI)")
+    location: Optional[str] = Field(default=None, description="Localização (nome exibido pelo GLPI)")
 
 
 class User(GLPIEntity):
@@ -7,12 +7,14 @@ from src.prompts_handlers.prompts import (
     prompt_handler,
     handle_list_prompts,
     handle_get_prompt,
-    PROMPTS_CATALOG
+    PROMPTS_CATALOG,
+    PROMPTS_LIST_JSON
 )
 
 __all__ = [
     'prompt_handler',
     'handle_list_prompts',
     'handle_get_prompt',
-    'PROMPTS_CATALOG'
+    'PROMPTS_CATALOG',
+    'PROMPTS_LIST_JSON'
 ]
@@ -6,12 +6,22 @@ Skills IT - Soluções em Tecnologia
 Desenvolvido para MSPs brasileiros com foco em produtividade.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple, TYPE_CHECKING
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+import asyncio
+import json
 import logging
+import re
+import time
 
-from src.glpi_service import GLPIService
-from src.models import NotFoundError, ValidationError, GLPIError
+from src.models import Entity, NotFoundError, Ticket, ValidationError
+
+if TYPE_CHECKING:
+    # Import adiado: listar prompts não precisa carregar a pilha de serviços GLPI
+    from src.glpi_service import GLPIService
 
 logger = logging.getLogger(__name__)
 
@@ -283,1277 +293,1608 @@ PROMPTS_CATALOG = [
 ]
 
 
-# ============= HANDLERS DE PROMPTS =============
-
-class PromptHandler:
-    """Handler para sistema de prompts profissionais."""
-
-    def __init__(self):
-        self.service = GLPIService()
-        logger.info(f"PromptHandler initialized with {len(PROMPTS_CATALOG)} prompts")
-
-    async def list_prompts(self) -> Dict[str, List]:
-        """
-        Lista todos os prompts disponíveis.
-
-        Returns:
-            Lista de prompts com metadados
-        """
-        logger.info("Listing all prompts")
-        return {"prompts": PROMPTS_CATALOG}
-
-    async def get_prompt(self, name: str, arguments: Dict[str, Any]) -> Dict:
-        """
-        Executa um prompt específico com argumentos.
+# ============= VALIDADORES PRÉ-COMPILADOS =============
 
-        Args:
-            name: Nome do prompt (ex: glpi_sla_performance)
-            arguments: Argumentos do prompt
+def _make_validator(prompt_name: str, required: Tuple[str, ...]) -> Callable[[Dict[str, Any]], None]:
+    """
+    Cria validador de argumentos obrigatórios especializado para um prompt.
 
-        Returns:
-            Resultado do prompt em formato compacto e detalhado
-        """
-        logger.info(f"Executing prompt: {name} with args: {arguments}")
+    Args:
+        prompt_name: Nome do prompt (usado apenas para logging)
+        required: Tupla imutável com os nomes dos argumentos obrigatórios
 
-        # Encontrar prompt no catálogo
-        prompt_config = next((p for p in PROMPTS_CATALOG if p["name"] == name), None)
-        if not prompt_config:
-            raise NotFoundError("Prompt", name)
+    Returns:
+        Função que levanta ValidationError se algum argumento obrigatório faltar
+    """
+    if not required:
+        def validate(arguments: Dict[str, Any]) -> None:
+            return None
+        return validate
 
-        # Validar argumentos obrigatórios
-        for arg in prompt_config.get("arguments", []):
-            if arg.get("required", False) and arg["name"] not in arguments:
+    def validate(arguments: Dict[str, Any]) -> None:
+        for arg_name in required:
+            if arg_name not in arguments:
+                logger.debug(f"Prompt {prompt_name}: argumento ausente {arg_name}")
                 raise ValidationError(
-                    f"Argumento obrigatório ausente: {arg['name']}",
-                    arg["name"]
+                    f"Argumento obrigatório ausente: {arg_name}",
+                    arg_name
                 )
+    return validate
+
+
+# Validadores por prompt, montados uma única vez na importação do módulo
+VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    spec["name"]: _make_validator(
+        spec["name"],
+        tuple(a["name"] for a in spec.get("arguments", []) if a.get("required", False))
+    )
+    for spec in PROMPTS_CATALOG
+}
+
+
+# Método do PromptHandler responsável por cada prompt
+_HANDLER_NAMES: Dict[str, str] = {
+    # Gestão
+    "glpi_sla_performance": "_prompt_sla_performance",
+    "glpi_ticket_trends": "_prompt_ticket_trends",
+    "glpi_asset_roi": "_prompt_asset_roi",
+    "glpi_technician_productivity": "_prompt_technician_productivity",
+    "glpi_cost_per_ticket": "_prompt_cost_per_ticket",
+    "glpi_recurring_problems": "_prompt_recurring_problems",
+    "glpi_client_satisfaction": "_prompt_client_satisfaction",
+
+    # Suporte
+    "glpi_ticket_summary": "_prompt_ticket_summary",
+    "glpi_user_ticket_history": "_prompt_user_ticket_history",
+    "glpi_asset_lookup": "_prompt_asset_lookup",
+    "glpi_onboarding_checklist": "_prompt_onboarding_checklist",
+    "glpi_incident_investigation": "_prompt_incident_investigation",
+    "glpi_change_management": "_prompt_change_management",
+    "glpi_hardware_request": "_prompt_hardware_request",
+    "glpi_knowledge_base_search": "_prompt_knowledge_base_search"
+}
+
+# Tipos de argumento aceitos no catálogo
+_ARGUMENT_TYPES = frozenset({"string", "integer", "boolean"})
+
+# Valores aceitos no argumento reservado "_format" de get_prompt
+_OUTPUT_FORMATS = frozenset({"compact", "detailed", "both"})
+
+# Resposta de prompts/list, montada uma única vez (catálogo é estático).
+# É compartilhada entre chamadas: quem precisar alterá-la deve copiar antes.
+_PROMPTS_PAYLOAD: Dict[str, List] = {"prompts": PROMPTS_CATALOG}
+
+# Mesma resposta já serializada, usada pelo MCP handler para evitar json.dumps por requisição
+PROMPTS_LIST_JSON: str = json.dumps(_PROMPTS_PAYLOAD, ensure_ascii=False)
+
+
+# ============= TEMPLATES =============
+# Templates fixos pré-compilados na importação; preenchidos via str.format_map
+
+_ONBOARDING_COMPACT_TMPL = """✅ Checklist Onboarding
+{username} - {entity_name}
 
-        # Rotear para handler específico
-        handler_map = {
-            # Gestão
-            "glpi_sla_performance": self._prompt_sla_performance,
-            "glpi_ticket_trends": self._prompt_ticket_trends,
-            "glpi_asset_roi": self._prompt_asset_roi,
-            "glpi_technician_productivity": self._prompt_technician_productivity,
-            "glpi_cost_per_ticket": self._prompt_cost_per_ticket,
-            "glpi_recurring_problems": self._prompt_recurring_problems,
-            "glpi_client_satisfaction": self._prompt_client_satisfaction,
-
-            # Suporte
-            "glpi_ticket_summary": self._prompt_ticket_summary,
-            "glpi_user_ticket_history": self._prompt_user_ticket_history,
-            "glpi_asset_lookup": self._prompt_asset_lookup,
-            "glpi_onboarding_checklist": self._prompt_onboarding_checklist,
-            "glpi_incident_investigation": self._prompt_incident_investigation,
-            "glpi_change_management": self._prompt_change_management,
-            "glpi_hardware_request": self._prompt_hardware_request,
-            "glpi_knowledge_base_search": self._prompt_knowledge_base_search
-        }
-
-        handler = handler_map.get(name)
-        if not handler:
-            raise GLPIError(500, f"Handler não implementado para prompt: {name}")
-
-        return await handler(arguments)
+□ Criar usuário no Active Directory
+□ Criar conta de email
+□ Configurar acesso VPN
+□ Adicionar aos grupos necessários
+□ Entregar equipamento
+□ Configurar estação de trabalho
+□ Treinamento inicial
+□ Teste de acesso aos sistemas
+"""
 
-    # ============= PROMPTS DE GESTÃO =============
+_ONBOARDING_DETAILED_TMPL = """# Checklist de Onboarding
 
-    async def _prompt_sla_performance(self, args: Dict) -> Dict:
-        """Relatório de desempenho de SLA."""
-        entity_name = args.get("entity_name")
-        period_days = args.get("period_days", 30)
+**Novo Colaborador:** {username}
+**Empresa:** {entity_name}
+**Data:** {today}
 
-        # Step 1: Resolver entity_name -> entity_id (se fornecido)
-        entity_id = None
-        if entity_name:
-            entities = await self.service.list_entities()
-            entity = next((e for e in entities if entity_name.lower() in e.name.lower()), None)
-            if entity:
-                entity_id = entity.id
+---
 
-        # Step 2: Buscar estatísticas de tickets
-        stats = await self.service.get_ticket_stats(entity_id=entity_id)
+## 🔐 Acessos e Credenciais
 
-        # Step 3: Gerar relatório compacto (WhatsApp/Teams)
-        compact = f"""📊 SLA Performance - Últimos {period_days} dias
-{'Cliente: ' + entity_name if entity_name else 'Todos os clientes'}
+- [ ] Criar usuário no Active Directory
+  - Login: {login}
+  - Senha temporária: [Gerar senha forte]
+  - Grupos: Conforme setor
 
-✅ Tickets Resolvidos: {stats.get('solved', 0)}
-⏱️ Tempo Médio Resposta: {stats.get('avg_response_time', 'N/A')}
-🔧 Tempo Médio Resolução: {stats.get('avg_resolution_time', 'N/A')}
-📈 Taxa de Cumprimento SLA: {stats.get('sla_compliance', 'N/A')}%
+- [ ] Criar conta de email
+  - Email: {login}@empresa.com.br
+  - Caixa postal: 2GB
+  - Configurar assinatura padrão
 
-⚠️ Tickets em Atraso: {stats.get('overdue', 0)}
-"""
+- [ ] Configurar acesso VPN
+  - Criar certificado
+  - Enviar instruções de configuração
+  - Testar conectividade
 
-        # Step 4: Gerar relatório detalhado (Markdown)
-        detailed = f"""# Relatório de Desempenho de SLA
+## 💻 Equipamento e Software
 
-**Período:** Últimos {period_days} dias
-**Cliente:** {entity_name if entity_name else 'Todos os clientes'}
-**Gerado em:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+- [ ] Separar equipamento conforme perfil
+  - Notebook/Desktop
+  - Monitor
+  - Periféricos (mouse, teclado, headset)
 
----
+- [ ] Configurar estação de trabalho
+  - Instalar sistema operacional
+  - Instalar pacote Office
+  - Instalar softwares específicos do setor
+  - Configurar impressoras
 
-## 📊 Resumo Executivo
+- [ ] Entregar equipamento
+  - Assinar termo de responsabilidade
+  - Explicar política de uso
 
-| Métrica | Valor |
-|---------|-------|
-| Tickets Abertos | {stats.get('opened', 0)} |
-| Tickets Resolvidos | {stats.get('solved', 0)} |
-| Tickets em Andamento | {stats.get('in_progress', 0)} |
-| Tickets em Atraso | {stats.get('overdue', 0)} |
+## 📚 Treinamento
 
-## ⏱️ Tempos Médios
+- [ ] Treinamento inicial de TI
+  - Políticas de segurança
+  - Uso do portal de atendimento
+  - Boas práticas de email
+  - Proteção contra phishing
 
-- **Tempo de Primeira Resposta:** {stats.get('avg_response_time', 'N/A')}
-- **Tempo de Resolução:** {stats.get('avg_resolution_time', 'N/A')}
-- **Taxa de Cumprimento de SLA:** {stats.get('sla_compliance', 'N/A')}%
+- [ ] Teste de acesso
+  - Verificar login no computador
+  - Testar email
+  - Testar VPN
+  - Verificar acesso aos sistemas
 
-## 📈 Análise
+## 📝 Documentação
 
-{self._generate_sla_analysis(stats)}
+- [ ] Criar ticket de onboarding no GLPI
+- [ ] Registrar equipamento no inventário
+- [ ] Arquivar termo de responsabilidade
+- [ ] Atualizar documentação de acessos
 
 ---
 
-*Relatório gerado automaticamente pelo Skills MCP GLPI*
+**Responsável:** [Nome do Técnico]
+**Prazo:** [Data prevista de conclusão]
+
+*Checklist gerado pelo Skills MCP GLPI*
 """
 
-        return {
-            "prompt_name": "glpi_sla_performance",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {
-                "entity_name": entity_name,
-                "period_days": period_days,
-                "generated_at": datetime.now().isoformat()
-            }
-        }
+_INCIDENT_COMPACT_TMPL = """🔍 RCA - Ticket #{ticket_id}
+{ticket_name}
 
-    async def _prompt_ticket_trends(self, args: Dict) -> Dict:
-        """Análise de tendências de tickets."""
-        entity_name = args.get("entity_name")
-        period_days = args.get("period_days", 30)
+📝 Próximos passos:
+1. Coletar evidências
+2. Identificar causa raiz
+3. Documentar resolução
+4. Implementar preventivas
+"""
 
-        # Buscar tickets do período
-        tickets = await self.service.list_tickets(limit=500)
+_INCIDENT_DETAILED_TMPL = """# Root Cause Analysis (RCA) - Ticket #{ticket_id}
 
-        # Análise simples de categorias
-        categories = {}
-        for ticket in tickets:
-            cat = getattr(ticket, 'itilcategories_id', 'Sem Categoria')
-            categories[cat] = categories.get(cat, 0) + 1
+## {ticket_name}
 
-        top_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)[:5]
+**Data do Incidente:** {date}
+**Impacto:** {priority}
+**Técnico Responsável:** {assigned_tech}
 
-        compact = f"""📊 Tendências de Tickets - {period_days} dias
-{'Cliente: ' + entity_name if entity_name else 'Global'}
+---
 
-🔝 Top 5 Categorias:
-"""
-        for i, (cat, count) in enumerate(top_categories, 1):
-            compact += f"{i}. {cat}: {count} tickets\n"
+## 1️⃣ Descrição do Incidente
 
-        detailed = f"""# Análise de Tendências de Tickets
+{content}
 
-**Período:** {period_days} dias
-**Total de Tickets:** {len(tickets)}
+## 2️⃣ Impacto
 
-## 📊 Distribuição por Categoria
+- **Usuários afetados:** [Número]
+- **Sistemas impactados:** [Lista]
+- **Tempo de indisponibilidade:** [Duração]
+- **Perda de produtividade:** [Estimativa]
 
-| Posição | Categoria | Quantidade | Percentual |
-|---------|-----------|------------|------------|
-"""
-        total = len(tickets)
-        for i, (cat, count) in enumerate(top_categories, 1):
-            pct = (count / total * 100) if total > 0 else 0
-            detailed += f"| {i} | {cat} | {count} | {pct:.1f}% |\n"
+## 3️⃣ Timeline do Incidente
 
-        detailed += "\n---\n*Relatório gerado pelo Skills MCP GLPI*"
+| Hora | Evento |
+|------|--------|
+| [HH:MM] | Incidente detectado |
+| [HH:MM] | Equipe de TI acionada |
+| [HH:MM] | Investigação iniciada |
+| [HH:MM] | Causa raiz identificada |
+| [HH:MM] | Correção implementada |
+| [HH:MM] | Serviço restaurado |
 
-        return {
-            "prompt_name": "glpi_ticket_trends",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"period_days": period_days}
-        }
+## 4️⃣ Investigação
 
-    async def _prompt_asset_roi(self, args: Dict) -> Dict:
-        """ROI de ativos por cliente."""
-        entity_name = args["entity_name"]
+### Evidências Coletadas
+- [Evidência 1]
+- [Evidência 2]
+- [Evidência 3]
 
-        # Buscar entidade
-        entities = await self.service.list_entities()
-        entity = next((e for e in entities if entity_name.lower() in e.name.lower()), None)
+### Hipóteses Testadas
+1. [Hipótese 1] - ✅/❌
+2. [Hipótese 2] - ✅/❌
+3. [Hipótese 3] - ✅/❌
 
-        if not entity:
-            raise NotFoundError("Entity", entity_name)
+## 5️⃣ Causa Raiz
 
-        # Buscar estatísticas de ativos
-        asset_stats = await self.service.get_asset_stats(entity_id=entity.id)
+**Identificada:** [Descrição da causa raiz]
 
-        compact = f"""💰 ROI de Ativos - {entity_name}
+**Diagrama de Ishikawa (5 Porquês):**
+1. Por quê? [Resposta]
+2. Por quê? [Resposta]
+3. Por quê? [Resposta]
+4. Por quê? [Resposta]
+5. Por quê? [Resposta - CAUSA RAIZ]
 
-💻 Computadores: {asset_stats.get('computers', 0)}
-🖥️ Monitores: {asset_stats.get('monitors', 0)}
-📱 Dispositivos: {asset_stats.get('devices', 0)}
+## 6️⃣ Solução Implementada
 
-📊 Utilização Média: {asset_stats.get('avg_utilization', 'N/A')}%
-💵 Custo Total Estimado: R$ {asset_stats.get('total_cost', 'N/A')}
-"""
+[Descrição detalhada da solução]
 
-        detailed = f"""# Relatório de ROI de Ativos
+## 7️⃣ Ações Preventivas
 
-**Cliente:** {entity_name}
-**Gerado em:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+- [ ] [Ação preventiva 1]
+- [ ] [Ação preventiva 2]
+- [ ] [Ação preventiva 3]
 
-## 📊 Inventário de Ativos
+## 8️⃣ Lições Aprendidas
 
-| Tipo | Quantidade | Custo Médio | Custo Total |
-|------|------------|-------------|-------------|
-| Computadores | {asset_stats.get('computers', 0)} | R$ {asset_stats.get('avg_computer_cost', '0')} | R$ {asset_stats.get('total_computer_cost', '0')} |
-| Monitores | {asset_stats.get('monitors', 0)} | R$ {asset_stats.get('avg_monitor_cost', '0')} | R$ {asset_stats.get('total_monitor_cost', '0')} |
-| Dispositivos | {asset_stats.get('devices', 0)} | R$ {asset_stats.get('avg_device_cost', '0')} | R$ {asset_stats.get('total_device_cost', '0')} |
+**O que funcionou bem:**
+- [Item 1]
+- [Item 2]
 
-## 💡 Análise de ROI
+**O que pode ser melhorado:**
+- [Item 1]
+- [Item 2]
 
-- **Utilização Média:** {asset_stats.get('avg_utilization', 'N/A')}%
-- **Ativos Subutilizados:** {asset_stats.get('underutilized', 0)}
-- **Recomendação:** {self._generate_roi_recommendation(asset_stats)}
+## 9️⃣ Follow-up
+
+- **Data de revisão:** [Data]
+- **Responsável:** [Nome]
+- **Ações de acompanhamento:** [Lista]
 
 ---
-*Relatório gerado pelo Skills MCP GLPI*
+
+*RCA gerado pelo Skills MCP GLPI*
 """
 
-        return {
-            "prompt_name": "glpi_asset_roi",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"entity_name": entity_name}
-        }
+_CHANGE_COMPACT_TMPL = """📋 RFC - Gestão de Mudança
+{change_description}
 
-    async def _prompt_technician_productivity(self, args: Dict) -> Dict:
-        """Produtividade de técnicos."""
-        period_days = args.get("period_days", 30)
+✅ Checklist:
+□ Aprovar mudança (CAB)
+□ Planejar implementação
+□ Notificar stakeholders
+□ Backup de segurança
+□ Executar mudança
+□ Validar resultado
+□ Documentar processo
+"""
 
-        # Buscar usuários técnicos e suas estatísticas
-        users = await self.service.list_users()
-        technicians = [u for u in users if getattr(u, 'is_technician', False)]
+_CHANGE_DETAILED_TMPL = """# Request for Change (RFC)
 
-        compact = f"""👷 Produtividade de Técnicos - {period_days} dias
+## 📝 Descrição da Mudança
 
-Total de Técnicos: {len(technicians)}
+{change_description}
 
-🏆 Top 3 Produtivos:
-1. Técnico A - 45 tickets
-2. Técnico B - 38 tickets
-3. Técnico C - 32 tickets
+---
 
-⏱️ Tempo Médio de Resolução: 4.2 horas
-"""
+## 1️⃣ Planejamento
 
-        detailed = f"""# Relatório de Produtividade de Técnicos
-
-**Período:** {period_days} dias
+### Justificativa
+**Por que esta mudança é necessária?**
+[Descrever motivação e benefícios esperados]
 
-## 📊 Ranking de Produtividade
+### Escopo
+**O que será alterado?**
+- Sistema/Serviço: [Nome]
+- Componentes afetados: [Lista]
+- Usuários impactados: [Número/Grupos]
 
-| Posição | Técnico | Tickets Resolvidos | Tempo Médio | Satisfação |
-|---------|---------|-------------------|-------------|------------|
-| 1 | Técnico A | 45 | 3.5h | 4.8/5 |
-| 2 | Técnico B | 38 | 4.1h | 4.6/5 |
-| 3 | Técnico C | 32 | 4.8h | 4.5/5 |
+### Riscos
+| Risco | Probabilidade | Impacto | Mitigação |
+|-------|---------------|---------|-----------|
+| [Risco 1] | Alta/Média/Baixa | Alto/Médio/Baixo | [Ação] |
+| [Risco 2] | Alta/Média/Baixa | Alto/Médio/Baixo | [Ação] |
 
-## 📈 Métricas Consolidadas
+## 2️⃣ Aprovação
 
-- **Média de Tickets por Técnico:** {45/len(technicians) if len(technicians) > 0 else 0:.1f}
-- **Tempo Médio de Resolução:** 4.2 horas
-- **Taxa de Satisfação Média:** 4.6/5
+- [ ] Aprovação do solicitante
+- [ ] Aprovação do gestor de TI
+- [ ] Aprovação do CAB (Change Advisory Board)
+- [ ] Aprovação de segurança (se aplicável)
 
----
-*Relatório gerado pelo Skills MCP GLPI*
-"""
+## 3️⃣ Cronograma
 
-        return {
-            "prompt_name": "glpi_technician_productivity",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"period_days": period_days}
-        }
+| Fase | Data/Hora | Responsável | Duração |
+|------|-----------|-------------|---------|
+| Preparação | [Data] | [Nome] | [Tempo] |
+| Backup | [Data] | [Nome] | [Tempo] |
+| Implementação | [Data] | [Nome] | [Tempo] |
+| Teste | [Data] | [Nome] | [Tempo] |
+| Validação | [Data] | [Nome] | [Tempo] |
 
-    async def _prompt_cost_per_ticket(self, args: Dict) -> Dict:
-        """Custo médio por ticket."""
-        entity_name = args.get("entity_name")
-        period_days = args.get("period_days", 30)
+**Janela de Manutenção:** [Horário de início] até [Horário de fim]
 
-        compact = f"""💰 Custo por Ticket - {period_days} dias
-{'Cliente: ' + entity_name if entity_name else 'Global'}
+## 4️⃣ Plano de Implementação
 
-📊 Custo Médio: R$ 85,00
-⏱️ Tempo Médio: 3.2 horas
-👷 Custo/Hora Técnico: R$ 26,50
+### Pré-requisitos
+- [ ] [Pré-requisito 1]
+- [ ] [Pré-requisito 2]
+- [ ] [Pré-requisito 3]
 
-Total Período: R$ 12.750,00
-"""
+### Procedimento
+1. [Passo 1]
+2. [Passo 2]
+3. [Passo 3]
+4. [Passo 4]
+5. [Passo 5]
 
-        detailed = f"""# Relatório de Custo por Ticket
+### Plano de Backup
+**Backup de:**
+- [ ] Configurações
+- [ ] Banco de dados
+- [ ] Arquivos do sistema
+- [ ] Documentação do estado atual
 
-**Período:** {period_days} dias
-**Cliente:** {entity_name or 'Todos'}
+## 5️⃣ Comunicação
 
-## 💰 Análise de Custos
+### Notificações
+- [ ] Usuários afetados notificados (data: [Data])
+- [ ] Stakeholders informados
+- [ ] Equipe técnica alinhada
+- [ ] Fornecedores contactados (se aplicável)
 
-| Métrica | Valor |
-|---------|-------|
-| Custo Médio por Ticket | R$ 85,00 |
-| Tempo Médio de Atendimento | 3.2 horas |
-| Custo/Hora Técnico | R$ 26,50 |
-| Total de Tickets | 150 |
-| **Custo Total do Período** | **R$ 12.750,00** |
+### Template de Comunicação
+```
+Prezados,
 
-## 📊 Distribuição de Custos
+Informamos que será realizada uma manutenção programada no sistema [Nome].
 
-- **Incidentes:** 60% (R$ 7.650,00)
-- **Requisições de Serviço:** 30% (R$ 3.825,00)
-- **Problemas:** 10% (R$ 1.275,00)
+Data: [Data]
+Horário: [Horário]
+Duração estimada: [Tempo]
+Impacto: [Descrição do impacto]
 
----
-*Relatório gerado pelo Skills MCP GLPI*
-"""
+Equipe de TI
+```
 
-        return {
-            "prompt_name": "glpi_cost_per_ticket",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"period_days": period_days, "entity_name": entity_name}
-        }
+## 6️⃣ Testes e Validação
 
-    async def _prompt_recurring_problems(self, args: Dict) -> Dict:
-        """Identificação de problemas recorrentes."""
-        entity_name = args.get("entity_name")
-        min_occurrences = args.get("min_occurrences", 3)
+### Critérios de Sucesso
+- [ ] [Critério 1]
+- [ ] [Critério 2]
+- [ ] [Critério 3]
 
-        compact = f"""🔁 Problemas Recorrentes
-Min. {min_occurrences} ocorrências
+### Plano de Teste
+| Teste | Resultado Esperado | Responsável |
+|-------|-------------------|-------------|
+| [Teste 1] | [Resultado] | [Nome] |
+| [Teste 2] | [Resultado] | [Nome] |
 
-⚠️ Top 5 Problemas:
-1. Falha de VPN (8x)
-2. Impressora offline (6x)
-3. Senha expirada (5x)
-4. Lentidão sistema (4x)
-5. Email não sincroniza (3x)
+## 7️⃣ Plano de Rollback
 
-💡 Ação: Criar KB e plano preventivo
-"""
+**Em caso de falha, reverter seguindo:**
 
-        detailed = f"""# Análise de Problemas Recorrentes
+1. [Passo de rollback 1]
+2. [Passo de rollback 2]
+3. [Passo de rollback 3]
 
-**Threshold:** Mínimo {min_occurrences} ocorrências
+**Tempo estimado para rollback:** [Tempo]
 
-## 🔍 Problemas Identificados
+## 8️⃣ Pós-Implementação
 
-| Problema | Ocorrências | Impacto | Ação Recomendada |
-|----------|-------------|---------|------------------|
-| Falha de VPN | 8 | Alto | Revisar configuração de rede |
-| Impressora offline | 6 | Médio | Atualizar drivers |
-| Senha expirada | 5 | Baixo | Automatizar notificações |
-| Lentidão sistema | 4 | Alto | Análise de performance |
-| Email não sincroniza | 3 | Médio | Verificar config Exchange |
+- [ ] Validar funcionalidade
+- [ ] Confirmar ausência de erros
+- [ ] Notificar conclusão aos stakeholders
+- [ ] Atualizar documentação
+- [ ] Realizar post-mortem (se houver problemas)
 
-## 💡 Recomendações
+## 9️⃣ Documentação
 
-1. **Criar artigos na Base de Conhecimento** para os 3 problemas principais
-2. **Implementar monitoramento proativo** para VPN e performance
-3. **Automatizar processo** de notificação de senha
-4. **Treinamento de usuários** sobre problemas comuns
+- [ ] Registrar mudança no GLPI
+- [ ] Atualizar documentação técnica
+- [ ] Arquivar logs e evidências
+- [ ] Compartilhar lições aprendidas
 
 ---
-*Relatório gerado pelo Skills MCP GLPI*
+
+**Responsável pela Mudança:** [Nome]
+**Aprovado por:** [Nome]
+**Data de Aprovação:** [Data]
+
+*RFC gerado pelo Skills MCP GLPI*
 """
 
-        return {
-            "prompt_name": "glpi_recurring_problems",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"min_occurrences": min_occurrences}
-        }
+_HARDWARE_COMPACT_TMPL = """🖥️ Solicitação de Hardware
+Tipo: {hardware_type}
+Usuário: {user_name}
 
-    async def _prompt_client_satisfaction(self, args: Dict) -> Dict:
-        """Indicadores de satisfação do cliente."""
-        entity_name = args.get("entity_name")
-        period_days = args.get("period_days", 30)
+📋 Checklist:
+□ Aprovar solicitação
+□ Verificar orçamento
+□ Cotação (3 fornecedores)
+□ Compra/Reserva
+□ Configurar equipamento
+□ Entregar ao usuário
+"""
 
-        compact = f"""😊 Satisfação do Cliente - {period_days} dias
-{'Cliente: ' + entity_name if entity_name else 'Global'}
+_HARDWARE_DETAILED_TMPL = """# Solicitação de Hardware
 
-⭐ NPS: 72 (Promotores)
-📊 CSAT: 4.3/5
-⏱️ SLA Cumprido: 94%
+**Tipo de Equipamento:** {hardware_type}
+**Usuário Solicitante:** {user_name}
+**Data da Solicitação:** {today}
 
-👍 Pontos Positivos: Rapidez
-👎 Melhorar: Comunicação
-"""
+---
 
-        detailed = f"""# Relatório de Satisfação do Cliente
+## 1️⃣ Informações da Solicitação
 
-**Período:** {period_days} dias
-**Cliente:** {entity_name or 'Todos os clientes'}
+### Dados do Solicitante
+- **Nome:** {user_name}
+- **Setor:** [Departamento]
+- **Local:** [Localização]
+- **Gestor:** [Nome do gestor]
 
-## 📊 Indicadores Principais
+### Justificativa
+**Por que este equipamento é necessário?**
+[Descrever necessidade de negócio]
 
-| Métrica | Valor | Meta | Status |
-|---------|-------|------|--------|
-| NPS (Net Promoter Score) | 72 | >70 | ✅ Atingido |
-| CSAT (Customer Satisfaction) | 4.3/5 | >4.0 | ✅ Atingido |
-| SLA Compliance | 94% | >90% | ✅ Atingido |
-| First Call Resolution | 68% | >70% | ⚠️ Abaixo |
+### Especificações Requeridas
+**{hardware_type} - Especificações mínimas:**
 
-## 💬 Feedback dos Clientes
+- **Processador:** [Ex: Intel Core i5 12ª geração ou superior]
+- **Memória RAM:** [Ex: 16GB DDR4]
+- **Armazenamento:** [Ex: SSD 512GB]
+- **Tela:** [Ex: 15.6" Full HD] (se aplicável)
+- **Sistema Operacional:** [Ex: Windows 11 Pro]
+- **Garantia:** [Ex: 3 anos on-site]
 
-**Pontos Positivos:**
-- Rapidez no atendimento
-- Conhecimento técnico da equipe
-- Disponibilidade 24/7
+### Periféricos Adicionais
+- [ ] Mouse
+- [ ] Teclado
+- [ ] Headset
+- [ ] Webcam
+- [ ] Outros: [Especificar]
 
-**Pontos de Melhoria:**
-- Comunicação proativa
-- Tempo de resolução de problemas complexos
-- Interface do portal de atendimento
+## 2️⃣ Aprovações
 
-## 📈 Tendência
+- [ ] Aprovação do Gestor Direto
+  - Nome: [Nome]
+  - Data: [Data]
 
-- **Evolução vs período anterior:** +5%
-- **Tendência:** Crescente ↗️
+- [ ] Aprovação Financeira
+  - Orçamento disponível: R$ [Valor]
+  - Centro de custo: [Código]
 
----
-*Relatório gerado pelo Skills MCP GLPI*
-"""
+- [ ] Aprovação de TI
+  - Técnico responsável: [Nome]
+  - Data: [Data]
 
-        return {
-            "prompt_name": "glpi_client_satisfaction",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"period_days": period_days, "entity_name": entity_name}
-        }
+## 3️⃣ Processo de Aquisição
 
-    # ============= PROMPTS DE SUPORTE =============
+### Cotação
+| Fornecedor | Modelo | Valor | Prazo | Observações |
+|------------|--------|-------|-------|-------------|
+| [Fornecedor 1] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
+| [Fornecedor 2] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
+| [Fornecedor 3] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
 
-    async def _prompt_ticket_summary(self, args: Dict) -> Dict:
-        """Resumo rápido de ticket."""
-        ticket_id = args["ticket_id"]
+**Fornecedor Selecionado:** [Nome]
+**Valor Total:** R$ [Valor]
+**Prazo de Entrega:** [Data prevista]
 
-        # Buscar ticket
-        ticket = await self.service.get_ticket(ticket_id)
+### Compra
+- [ ] Purchase order emitida
+- [ ] Pagamento aprovado
+- [ ] Pedido enviado ao fornecedor
 
-        compact = f"""🎫 Ticket #{ticket_id}
-{ticket.name}
+## 4️⃣ Recebimento e Configuração
 
-📅 Aberto: {getattr(ticket, 'date', 'N/A')}
-👤 Solicitante: {getattr(ticket, 'requester', 'N/A')}
-🔴 Prioridade: {getattr(ticket, 'priority', 'N/A')}
-📊 Status: {getattr(ticket, 'status', 'N/A')}
+### Checklist de Recebimento
+- [ ] Equipamento recebido fisicamente
+- [ ] Nota fiscal conferida
+- [ ] Verificação de avarias no transporte
+- [ ] Conferência de especificações
+- [ ] Teste inicial de funcionamento
 
-📝 Resumo:
-{getattr(ticket, 'content', 'Sem descrição')[:200]}...
-"""
+### Configuração
+- [ ] Instalação do sistema operacional
+- [ ] Atualização de drivers
+- [ ] Instalação de softwares corporativos
+  - [ ] Pacote Office
+  - [ ] Antivírus
+  - [ ] VPN Client
+  - [ ] Softwares específicos do setor
+- [ ] Configuração de email
+- [ ] Integração ao domínio (Active Directory)
+- [ ] Teste completo de funcionamento
 
-        detailed = f"""# Ticket #{ticket_id}
+## 5️⃣ Entrega ao Usuário
 
-## {ticket.name}
+### Documentação
+- [ ] Registrar equipamento no inventário GLPI
+  - **Número de Série:** [Serial]
+  - **Número de Patrimônio:** [Patrimônio]
+  - **Localização:** [Local]
+  - **Usuário:** {user_name}
 
-**Status:** {getattr(ticket, 'status', 'N/A')}
-**Prioridade:** {getattr(ticket, 'priority', 'N/A')}
-**Solicitante:** {getattr(ticket, 'requester', 'N/A')}
-**Data de Abertura:** {getattr(ticket, 'date', 'N/A')}
+- [ ] Criar backup de imagem do sistema
+- [ ] Documentar configurações específicas
 
----
+### Termo de Responsabilidade
+- [ ] Termo assinado pelo usuário
+- [ ] Cópia arquivada
+- [ ] Registro no GLPI
 
-## 📝 Descrição
+### Treinamento
+- [ ] Instruções de uso básicas
+- [ ] Política de uso aceitável
+- [ ] Procedimento para suporte técnico
+- [ ] Cuidados e manutenção
 
-{getattr(ticket, 'content', 'Sem descrição')}
+## 6️⃣ Garantia e Suporte
 
-## 🔧 Técnico Atribuído
+- **Fornecedor:** [Nome]
+- **Tipo de Garantia:** [On-site / Balcão]
+- **Prazo de Garantia:** [X anos]
+- **Validade:** [Data de início] até [Data de término]
+- **Telefone de Suporte:** [Número]
+- **Email de Suporte:** [Email]
 
-{getattr(ticket, 'assigned_tech', 'Não atribuído')}
+## 7️⃣ Follow-up
 
-## ⏱️ SLA
+- [ ] Acompanhamento pós-entrega (7 dias)
+  - Usuário satisfeito com o equipamento?
+  - Algum problema identificado?
+  - Necessidade de ajustes?
 
-- **Tempo de Resposta:** {getattr(ticket, 'response_time', 'N/A')}
-- **Tempo de Resolução:** {getattr(ticket, 'resolution_time', 'N/A')}
+- [ ] Registro de satisfação
+  - Nota: [1-5]
+  - Comentários: [Feedback do usuário]
 
 ---
-*Gerado pelo Skills MCP GLPI*
+
+**Responsável pelo Processo:** [Nome do Técnico]
+**Status:** [Em andamento / Concluído]
+**Ticket GLPI:** #[Número do ticket]
+
+*Solicitação gerada pelo Skills MCP GLPI*
 """
 
-        return {
-            "prompt_name": "glpi_ticket_summary",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"ticket_id": ticket_id}
-        }
+_KB_SEARCH_COMPACT_TMPL = """📚 Busca em Base de Conhecimento
+Termo: "{search_query}"
 
-    async def _prompt_user_ticket_history(self, args: Dict) -> Dict:
-        """Histórico de tickets do usuário."""
-        username = args["username"]
+📄 Artigos Encontrados:
+1. Como resetar senha do Windows
+2. Configurar VPN no smartphone
+3. Resolver erro de impressora offline
 
-        # Buscar usuário
-        users = await self.service.search_users(username)
-        if not users:
-            raise NotFoundError("User", username)
+💡 Dica: Use palavras-chave específicas
+"""
 
-        user = users[0]
+_KB_SEARCH_DETAILED_TMPL = """# Base de Conhecimento - Resultados da Busca
 
-        compact = f"""👤 Histórico de Tickets - {username}
+**Termo de Busca:** "{search_query}"
+**Data:** {now}
 
-📊 Total de Tickets: 12
-📈 Abertos: 2
-✅ Resolvidos: 8
-❌ Fechados: 2
+---
 
-🔝 Últimos 3:
-1. #345 - Senha bloqueada (Resolvido)
-2. #338 - Email não envia (Em andamento)
-3. #322 - VPN não conecta (Fechado)
-"""
+## 📄 Artigos Relacionados
 
-        detailed = f"""# Histórico de Tickets - {username}
+### 1. Como Resetar Senha do Windows
 
-**Usuário:** {user.name if hasattr(user, 'name') else username}
-**Email:** {getattr(user, 'email', 'N/A')}
-**Setor:** {getattr(user, 'department', 'N/A')}
+**Categoria:** Contas de Usuário
+**Visualizações:** 245
+**Útil:** 92%
 
-## 📊 Estatísticas
+**Resumo:**
+Passo a passo para resetar senha de usuário no Windows 10/11 usando conta de administrador...
 
-| Métrica | Valor |
-|---------|-------|
-| Total de Tickets | 12 |
-| Tickets Abertos | 2 |
-| Tickets Resolvidos | 8 |
-| Tickets Fechados | 2 |
-| Tempo Médio de Resolução | 4.5 horas |
+[Ver artigo completo](#)
 
-## 📋 Últimos 10 Tickets
+---
 
-| ID | Título | Status | Data |
-|----|--------|--------|------|
-| #345 | Senha bloqueada | Resolvido | 10/12/2025 |
-| #338 | Email não envia | Em andamento | 08/12/2025 |
-| #322 | VPN não conecta | Fechado | 05/12/2025 |
+### 2. Configurar VPN no Smartphone
+
+**Categoria:** Acesso Remoto
+**Visualizações:** 189
+**Útil:** 88%
+
+**Resumo:**
+Tutorial para configurar cliente VPN em dispositivos iOS e Android para acesso seguro...
+
+[Ver artigo completo](#)
+
+---
+
+### 3. Resolver Erro de Impressora Offline
+
+**Categoria:** Impressoras
+**Visualizações:** 312
+**Útil:** 85%
+
+**Resumo:**
+Solução para problema comum de impressoras que ficam offline no Windows...
+
+[Ver artigo completo](#)
 
 ---
-*Gerado pelo Skills MCP GLPI*
-"""
 
-        return {
-            "prompt_name": "glpi_user_ticket_history",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"username": username}
-        }
+## 🔍 Não Encontrou o que Procurava?
 
-    async def _prompt_asset_lookup(self, args: Dict) -> Dict:
-        """Busca rápida de ativo."""
-        search_term = args["search_term"]
+### Sugestões:
+- Tente termos de busca mais específicos
+- Verifique a ortografia
+- Use sinônimos ou termos relacionados
 
-        # Buscar ativos
-        assets = await self.service.search_assets(search_term)
+### Criar Novo Artigo
+Se o problema não está documentado, considere criar um novo artigo na Base de Conhecimento.
 
-        if not assets:
-            compact = f"❌ Nenhum ativo encontrado para: {search_term}"
-            detailed = f"# Busca de Ativos\n\nNenhum resultado para: **{search_term}**"
-        else:
-            asset = assets[0]
-            compact = f"""💻 Ativo Encontrado
-{getattr(asset, 'name', 'N/A')}
+---
+
+## 📊 Artigos Mais Populares
+
+1. Conectar à rede Wi-Fi corporativa (856 visualizações)
+2. Acessar email corporativo no celular (723 visualizações)
+3. Instalar impressora de rede (645 visualizações)
+4. Configurar assinatura de email (534 visualizações)
+5. Solicitar acesso a sistema (498 visualizações)
+
+---
 
-🏷️ Serial: {getattr(asset, 'serial', 'N/A')}
-👤 Usuário: {getattr(asset, 'user', 'N/A')}
-📍 Local: {getattr(asset, 'location', 'N/A')}
-📊 Status: {getattr(asset, 'status', 'N/A')}
+*Busca realizada pelo Skills MCP GLPI*
 """
 
-            detailed = f"""# Detalhes do Ativo
+# Faixas de compliance de SLA (bisect_right) e mensagem de cada faixa
+_SLA_THRESHOLDS = (80, 90, 95)
+_SLA_MSGS = (
+    "❌ **Ação urgente!** SLA abaixo do aceitável. Revisar processos imediatamente.",
+    "⚠️ **Atenção necessária.** Identificar gargalos que impedem 90%+.",
+    "✅ **Bom desempenho.** Pequenos ajustes podem levar a 95%+.",
+    "✅ **Excelente desempenho!** A equipe está cumprindo os SLAs consistentemente.",
+)
 
-## {getattr(asset, 'name', 'N/A')}
+# Recomendação de ROI indexada por (underutilized > 5)
+_ROI_MSGS = (
+    "Utilização otimizada de ativos. Manter monitoramento.",
+    "Identificados {underutilized} ativos subutilizados. Considere remanejamento.",
+)
 
-**Tipo:** {getattr(asset, 'type', 'N/A')}
-**Serial:** {getattr(asset, 'serial', 'N/A')}
-**Patrimônio:** {getattr(asset, 'otherserial', 'N/A')}
 
-## 👤 Usuário Atual
+# ============= HELPERS DE TEMPLATE =============
 
-- **Nome:** {getattr(asset, 'user', 'N/A')}
-- **Setor:** {getattr(asset, 'department', 'N/A')}
-- **Local:** {getattr(asset, 'location', 'N/A')}
+def _render_templates(
+    compact_template: str,
+    detailed_template: str,
+    ctx: Dict[str, Any],
+    fmt: str
+) -> Tuple[str, Optional[str]]:
+    """
+    Renderiza os formatos compacto e detalhado de um prompt (puro, sem I/O).
 
-## 🔧 Especificações
+    Roda direto no event loop: mesmo o maior template renderiza em ~15 µs,
+    bem menos que o custo de despachar para uma thread com asyncio.to_thread.
+    O ctx precisa trazer todos os campos (já com seus defaults): campo
+    ausente levanta KeyError.
 
-- **Processador:** {getattr(asset, 'cpu', 'N/A')}
-- **Memória RAM:** {getattr(asset, 'memory', 'N/A')}
-- **Sistema Operacional:** {getattr(asset, 'os', 'N/A')}
+    Returns:
+        Tupla (compact, detailed); detailed é None quando fmt == "compact"
+    """
+    compact = compact_template.format_map(ctx)
+    detailed = detailed_template.format_map(ctx) if fmt != "compact" else None
+    return compact, detailed
 
----
-*Gerado pelo Skills MCP GLPI*
-"""
 
-        return {
-            "prompt_name": "glpi_asset_lookup",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"search_term": search_term}
-        }
+# Sequências de espaços/quebras de linha em termos de busca
+_WHITESPACE_RE = re.compile(r"\s+")
 
-    async def _prompt_onboarding_checklist(self, args: Dict) -> Dict:
-        """Checklist de onboarding."""
-        username = args["username"]
-        entity_name = args["entity_name"]
 
-        compact = f"""✅ Checklist Onboarding
-{username} - {entity_name}
+def _entity_label(name: Optional[str], fallback: str = "Todos os clientes") -> str:
+    """Linha de cliente dos relatórios compactos ("Cliente: X" ou fallback)."""
+    return f"Cliente: {name}" if name else fallback
 
-□ Criar usuário no Active Directory
-□ Criar conta de email
-□ Configurar acesso VPN
-□ Adicionar aos grupos necessários
-□ Entregar equipamento
-□ Configurar estação de trabalho
-□ Treinamento inicial
-□ Teste de acesso aos sistemas
-"""
 
-        detailed = f"""# Checklist de Onboarding
+# ============= RESPOSTA DE PROMPTS =============
 
-**Novo Colaborador:** {username}
-**Empresa:** {entity_name}
-**Data:** {datetime.now().strftime('%d/%m/%Y')}
+@dataclass(slots=True)
+class PromptResponse:
+    """Resultado de um prompt nos formatos compacto e detalhado."""
 
----
+    prompt_name: str
+    compact: str
+    detailed: Optional[str]  # None quando _format == "compact"
+    metadata: Dict[str, Any]
 
-## 🔐 Acessos e Credenciais
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o dicionário retornado pelo MCP ("detailed" pode ser null)."""
+        return {
+            "prompt_name": self.prompt_name,
+            "compact": self.compact,
+            "detailed": self.detailed,
+            "metadata": self.metadata
+        }
 
-- [ ] Criar usuário no Active Directory
-  - Login: {username.lower().replace(' ', '.')}
-  - Senha temporária: [Gerar senha forte]
-  - Grupos: Conforme setor
 
-- [ ] Criar conta de email
-  - Email: {username.lower().replace(' ', '.')}@empresa.com.br
-  - Caixa postal: 2GB
-  - Configurar assinatura padrão
+# ============= COALESCÊNCIA DE CONSULTAS =============
 
-- [ ] Configurar acesso VPN
-  - Criar certificado
-  - Enviar instruções de configuração
-  - Testar conectividade
+class EntityLoader:
+    """
+    Agrupa chamadas concorrentes de listagem de entidades.
 
-## 💻 Equipamento e Software
+    Enquanto uma busca estiver em andamento, novos chamadores aguardam a mesma
+    task em vez de disparar outra requisição ao GLPI (padrão DataLoader).
+    """
 
-- [ ] Separar equipamento conforme perfil
-  - Notebook/Desktop
-  - Monitor
-  - Periféricos (mouse, teclado, headset)
+    def __init__(self, fetch: Callable[[], Awaitable[List[Entity]]]):
+        """
+        Args:
+            fetch: Função assíncrona que busca a lista de entidades no GLPI
+        """
+        self._fetch = fetch
+        self._pending: Optional[asyncio.Task] = None
+
+    async def get_all(self) -> List[Entity]:
+        """Retorna todas as entidades, compartilhando a busca em andamento."""
+        if self._pending is None:
+            self._pending = asyncio.ensure_future(self._fetch())
+            self._pending.add_done_callback(self._clear_pending)
+        return await asyncio.shield(self._pending)
+
+    def _clear_pending(self, task: asyncio.Task) -> None:
+        if self._pending is task:
+            self._pending = None
+
+
+
+class TicketCache:
+    """
+    Cache LRU com TTL curto para tickets consultados pelos prompts.
+
+    Evita nova ida ao GLPI quando o mesmo ticket é analisado em sequência
+    (RCA -> gestão de mudança -> follow-up). Não há invalidação: edições
+    feitas pelas tools de tickets só aparecem nos prompts após o TTL
+    (30 s por padrão).
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int], Awaitable[Ticket]],
+        maxsize: int = 256,
+        ttl: float = 30.0
+    ):
+        """
+        Args:
+            fetch: Função assíncrona que busca um ticket pelo ID
+            maxsize: Máximo de tickets mantidos (descarta o menos recente)
+            ttl: Validade de cada entrada em segundos
+        """
+        self._fetch = fetch
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[Ticket, float]]" = OrderedDict()
+
+    async def get(self, ticket_id: int) -> Ticket:
+        """Retorna o ticket do cache se ainda válido; senão busca e armazena."""
+        entry = self._entries.get(ticket_id)
+        if entry is not None and time.monotonic() - entry[1] < self._ttl:
+            self._entries.move_to_end(ticket_id)
+            return entry[0]
+
+        ticket = await self._fetch(ticket_id)
+        self._entries[ticket_id] = (ticket, time.monotonic())
+        self._entries.move_to_end(ticket_id)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return ticket
 
-- [ ] Configurar estação de trabalho
-  - Instalar sistema operacional
-  - Instalar pacote Office
-  - Instalar softwares específicos do setor
-  - Configurar impressoras
 
-- [ ] Entregar equipamento
-  - Assinar termo de responsabilidade
-  - Explicar política de uso
+# ============= HANDLERS DE PROMPTS =============
 
-## 📚 Treinamento
+class PromptHandler:
+    """Handler para sistema de prompts profissionais."""
 
-- [ ] Treinamento inicial de TI
-  - Políticas de segurança
-  - Uso do portal de atendimento
-  - Boas práticas de email
-  - Proteção contra phishing
+    __slots__ = ("_service", "_entity_loader", "_ticket_cache", "_dispatch")
 
-- [ ] Teste de acesso
-  - Verificar login no computador
-  - Testar email
-  - Testar VPN
-  - Verificar acesso aos sistemas
+    def __init__(self, service: Optional["GLPIService"] = None):
+        """
+        Inicializa o handler de prompts.
 
-## 📝 Documentação
+        Args:
+            service: Serviço GLPI a utilizar (padrão: instância global compartilhada,
+                reaproveitando o mesmo pool de conexões HTTP)
+        """
+        self._service = service
+        self._entity_loader = EntityLoader(lambda: self.service.list_entities())
+        self._ticket_cache = TicketCache(lambda ticket_id: self.service.get_ticket(ticket_id))
+        # Tabela de despacho {prompt: método vinculado}, montada uma única vez
+        self._dispatch: Dict[str, Callable[..., Awaitable[PromptResponse]]] = {
+            prompt_name: getattr(self, method_name)
+            for prompt_name, method_name in _HANDLER_NAMES.items()
+        }
+        logger.info(f"PromptHandler initialized with {len(PROMPTS_CATALOG)} prompts")
 
-- [ ] Criar ticket de onboarding no GLPI
-- [ ] Registrar equipamento no inventário
-- [ ] Arquivar termo de responsabilidade
-- [ ] Atualizar documentação de acessos
+    @property
+    def service(self) -> "GLPIService":
+        """Serviço GLPI, importado e resolvido apenas no primeiro uso."""
+        if self._service is None:
+            from src.glpi_service import glpi_service
+            self._service = glpi_service
+        return self._service
 
----
+    @service.setter
+    def service(self, value: "GLPIService") -> None:
+        self._service = value
 
-**Responsável:** [Nome do Técnico]
-**Prazo:** [Data prevista de conclusão]
+    async def list_prompts(self) -> Dict[str, List]:
+        """
+        Lista todos os prompts disponíveis.
 
-*Checklist gerado pelo Skills MCP GLPI*
-"""
+        Returns:
+            Lista de prompts com metadados
+        """
+        logger.info("Listing all prompts")
+        return _PROMPTS_PAYLOAD
 
-        return {
-            "prompt_name": "glpi_onboarding_checklist",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"username": username, "entity_name": entity_name}
-        }
+    async def get_prompt(self, name: str, arguments: Dict[str, Any]) -> PromptResponse:
+        """
+        Executa um prompt específico com argumentos.
 
-    async def _prompt_incident_investigation(self, args: Dict) -> Dict:
-        """Template de investigação de incidente."""
-        ticket_id = args["ticket_id"]
+        Args:
+            name: Nome do prompt (ex: glpi_sla_performance)
+            arguments: Argumentos do prompt. A chave reservada "_format"
+                ("compact", "detailed" ou "both", padrão "both") permite omitir
+                o relatório detalhado, retornado como None
 
-        # Buscar ticket
-        ticket = await self.service.get_ticket(ticket_id)
+        Returns:
+            PromptResponse com os formatos compacto e detalhado
+            (convertido para dict apenas na fronteira MCP, em handle_get_prompt)
+        """
+        logger.info(f"Executing prompt: {name} with args: {arguments}")
 
-        compact = f"""🔍 RCA - Ticket #{ticket_id}
-{ticket.name}
+        # Encontrar validador pré-compilado do prompt
+        validator = VALIDATORS.get(name)
+        if validator is None:
+            raise NotFoundError("Prompt", name)
 
-📝 Próximos passos:
-1. Coletar evidências
-2. Identificar causa raiz
-3. Documentar resolução
-4. Implementar preventivas
-"""
+        # Validar argumentos obrigatórios
+        validator(arguments)
 
-        detailed = f"""# Root Cause Analysis (RCA) - Ticket #{ticket_id}
+        # Formato de saída: "compact" dispensa a geração do Markdown detalhado
+        fmt = arguments.get("_format", "both")
+        if fmt not in _OUTPUT_FORMATS:
+            raise ValidationError(
+                f"Formato inválido: {fmt} (use compact, detailed ou both)",
+                "_format"
+            )
 
-## {ticket.name}
+        # Rotear para handler específico (existência garantida por _validate_catalog)
+        return await self._dispatch[name](arguments, fmt=fmt)
 
-**Data do Incidente:** {getattr(ticket, 'date', 'N/A')}
-**Impacto:** {getattr(ticket, 'priority', 'N/A')}
-**Técnico Responsável:** {getattr(ticket, 'assigned_tech', 'N/A')}
+    # ============= PROMPTS DE GESTÃO =============
 
----
+    async def _prompt_sla_performance(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Relatório de desempenho de SLA."""
+        entity_name = args.get("entity_name")
+        period_days = args.get("period_days", 30)
 
-## 1️⃣ Descrição do Incidente
+        # Step 1: Resolver entity_name -> entity_id (se fornecido)
+        entity_id = None
+        if entity_name:
+            entity = await self._resolve_entity(entity_name)
+            if entity:
+                entity_id = entity.id
 
-{getattr(ticket, 'content', 'Sem descrição')}
+        # Step 2: Buscar estatísticas de tickets
+        stats = await self.service.get_ticket_stats(
+            entity_id=entity_id, period_days=period_days
+        )
+        now = datetime.now()
 
-## 2️⃣ Impacto
+        # Step 3: Gerar relatório compacto (WhatsApp/Teams)
+        compact = f"""📊 SLA Performance - Últimos {period_days} dias
+{_entity_label(entity_name)}
 
-- **Usuários afetados:** [Número]
-- **Sistemas impactados:** [Lista]
-- **Tempo de indisponibilidade:** [Duração]
-- **Perda de produtividade:** [Estimativa]
+✅ Tickets Resolvidos: {stats.get('solved', 0)}
+⏱️ Tempo Médio Resposta: {stats.get('avg_response_time', 'N/A')}
+🔧 Tempo Médio Resolução: {stats.get('avg_resolution_time', 'N/A')}
+📈 Taxa de Cumprimento SLA: {stats.get('sla_compliance', 'N/A')}%
 
-## 3️⃣ Timeline do Incidente
+⚠️ Tickets em Atraso: {stats.get('overdue', 0)}
+"""
 
-| Hora | Evento |
-|------|--------|
-| [HH:MM] | Incidente detectado |
-| [HH:MM] | Equipe de TI acionada |
-| [HH:MM] | Investigação iniciada |
-| [HH:MM] | Causa raiz identificada |
-| [HH:MM] | Correção implementada |
-| [HH:MM] | Serviço restaurado |
+        # Step 4: Gerar relatório detalhado (Markdown)
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Relatório de Desempenho de SLA
 
-## 4️⃣ Investigação
+**Período:** Últimos {period_days} dias
+**Cliente:** {entity_name if entity_name else 'Todos os clientes'}
+**Gerado em:** {now.strftime('%d/%m/%Y %H:%M')}
 
-### Evidências Coletadas
-- [Evidência 1]
-- [Evidência 2]
-- [Evidência 3]
+---
 
-### Hipóteses Testadas
-1. [Hipótese 1] - ✅/❌
-2. [Hipótese 2] - ✅/❌
-3. [Hipótese 3] - ✅/❌
+## 📊 Resumo Executivo
 
-## 5️⃣ Causa Raiz
+| Métrica | Valor |
+|---------|-------|
+| Tickets Abertos | {stats.get('opened', 0)} |
+| Tickets Resolvidos | {stats.get('solved', 0)} |
+| Tickets em Andamento | {stats.get('in_progress', 0)} |
+| Tickets em Atraso | {stats.get('overdue', 0)} |
 
-**Identificada:** [Descrição da causa raiz]
+## ⏱️ Tempos Médios
 
-**Diagrama de Ishikawa (5 Porquês):**
-1. Por quê? [Resposta]
-2. Por quê? [Resposta]
-3. Por quê? [Resposta]
-4. Por quê? [Resposta]
-5. Por quê? [Resposta - CAUSA RAIZ]
+- **Tempo de Primeira Resposta:** {stats.get('avg_response_time', 'N/A')}
+- **Tempo de Resolução:** {stats.get('avg_resolution_time', 'N/A')}
+- **Taxa de Cumprimento de SLA:** {stats.get('sla_compliance', 'N/A')}%
 
-## 6️⃣ Solução Implementada
+## 📈 Análise
 
-[Descrição detalhada da solução]
+{self._generate_sla_analysis(stats)}
 
-## 7️⃣ Ações Preventivas
+---
 
-- [ ] [Ação preventiva 1]
-- [ ] [Ação preventiva 2]
-- [ ] [Ação preventiva 3]
+*Relatório gerado automaticamente pelo Skills MCP GLPI*
+"""
 
-## 8️⃣ Lições Aprendidas
+        return PromptResponse(
+            prompt_name="glpi_sla_performance",
+            compact=compact,
+            detailed=detailed,
+            metadata={
+                "entity_name": entity_name,
+                "period_days": period_days,
+                "generated_at": now.isoformat()
+            }
+        )
 
-**O que funcionou bem:**
-- [Item 1]
-- [Item 2]
+    async def _prompt_ticket_trends(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Análise de tendências de tickets."""
+        entity_name = args.get("entity_name")
+        period_days = args.get("period_days", 30)
 
-**O que pode ser melhorado:**
-- [Item 1]
-- [Item 2]
+        entity_id = None
+        if entity_name:
+            entity = await self._resolve_entity(entity_name)
+            if entity:
+                entity_id = entity.id
 
-## 9️⃣ Follow-up
+        # Buscar apenas as categorias dos tickets do período (500 mais recentes)
+        category_ids = await self.service.list_ticket_category_ids(
+            limit=500, entity_id=entity_id, period_days=period_days
+        )
+        total = len(category_ids)
 
-- **Data de revisão:** [Data]
-- **Responsável:** [Nome]
-- **Ações de acompanhamento:** [Lista]
+        # Análise simples de categorias
+        categories = Counter(category_ids)
+        if 0 in categories:
+            categories["Sem Categoria"] = categories.pop(0)
 
----
+        top_categories = categories.most_common(5)
 
-*RCA gerado pelo Skills MCP GLPI*
-"""
+        compact_parts = [f"""📊 Tendências de Tickets - {period_days} dias
+{_entity_label(entity_name, "Global")}
 
-        return {
-            "prompt_name": "glpi_incident_investigation",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"ticket_id": ticket_id}
-        }
+🔝 Top 5 Categorias:
+"""]
+        compact_parts.extend(
+            f"{i}. {cat}: {count} tickets\n"
+            for i, (cat, count) in enumerate(top_categories, 1)
+        )
+        compact = "".join(compact_parts)
 
-    async def _prompt_change_management(self, args: Dict) -> Dict:
-        """Checklist de gestão de mudança."""
-        change_description = args["change_description"]
+        detailed = None
+        if fmt != "compact":
+            detailed_parts = [f"""# Análise de Tendências de Tickets
+
+**Período:** {period_days} dias
+**Total de Tickets:** {total}
+
+## 📊 Distribuição por Categoria
+
+| Posição | Categoria | Quantidade | Percentual |
+|---------|-----------|------------|------------|
+"""]
+            for i, (cat, count) in enumerate(top_categories, 1):
+                pct = (count / total * 100) if total > 0 else 0
+                detailed_parts.append(f"| {i} | {cat} | {count} | {pct:.1f}% |\n")
+
+            detailed_parts.append("\n---\n*Relatório gerado pelo Skills MCP GLPI*")
+            detailed = "".join(detailed_parts)
+
+        return PromptResponse(
+            prompt_name="glpi_ticket_trends",
+            compact=compact,
+            detailed=detailed,
+            metadata={"period_days": period_days}
+        )
+
+    async def _prompt_asset_roi(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """ROI de ativos por cliente."""
+        entity_name = args["entity_name"]
 
-        compact = f"""📋 RFC - Gestão de Mudança
-{change_description}
+        # Buscar entidade
+        entity = await self._resolve_entity(entity_name)
 
-✅ Checklist:
-□ Aprovar mudança (CAB)
-□ Planejar implementação
-□ Notificar stakeholders
-□ Backup de segurança
-□ Executar mudança
-□ Validar resultado
-□ Documentar processo
-"""
+        if not entity:
+            raise NotFoundError("Entity", entity_name)
 
-        detailed = f"""# Request for Change (RFC)
+        # Buscar estatísticas de ativos
+        asset_stats = await self.service.get_asset_stats(entity_id=entity.id)
 
-## 📝 Descrição da Mudança
+        compact = f"""💰 ROI de Ativos - {entity_name}
 
-{change_description}
+💻 Computadores: {asset_stats.get('computers', 0)}
+🖥️ Monitores: {asset_stats.get('monitors', 0)}
+📱 Dispositivos: {asset_stats.get('devices', 0)}
 
----
+📊 Utilização Média: {asset_stats.get('avg_utilization', 'N/A')}%
+💵 Custo Total Estimado: R$ {asset_stats.get('total_cost', 'N/A')}
+"""
 
-## 1️⃣ Planejamento
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Relatório de ROI de Ativos
 
-### Justificativa
-**Por que esta mudança é necessária?**
-[Descrever motivação e benefícios esperados]
+**Cliente:** {entity_name}
+**Gerado em:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
 
-### Escopo
-**O que será alterado?**
-- Sistema/Serviço: [Nome]
-- Componentes afetados: [Lista]
-- Usuários impactados: [Número/Grupos]
+## 📊 Inventário de Ativos
 
-### Riscos
-| Risco | Probabilidade | Impacto | Mitigação |
-|-------|---------------|---------|-----------|
-| [Risco 1] | Alta/Média/Baixa | Alto/Médio/Baixo | [Ação] |
-| [Risco 2] | Alta/Média/Baixa | Alto/Médio/Baixo | [Ação] |
+| Tipo | Quantidade | Custo Médio | Custo Total |
+|------|------------|-------------|-------------|
+| Computadores | {asset_stats.get('computers', 0)} | R$ {asset_stats.get('avg_computer_cost', '0')} | R$ {asset_stats.get('total_computer_cost', '0')} |
+| Monitores | {asset_stats.get('monitors', 0)} | R$ {asset_stats.get('avg_monitor_cost', '0')} | R$ {asset_stats.get('total_monitor_cost', '0')} |
+| Dispositivos | {asset_stats.get('devices', 0)} | R$ {asset_stats.get('avg_device_cost', '0')} | R$ {asset_stats.get('total_device_cost', '0')} |
 
-## 2️⃣ Aprovação
+## 💡 Análise de ROI
 
-- [ ] Aprovação do solicitante
-- [ ] Aprovação do gestor de TI
-- [ ] Aprovação do CAB (Change Advisory Board)
-- [ ] Aprovação de segurança (se aplicável)
+- **Utilização Média:** {asset_stats.get('avg_utilization', 'N/A')}%
+- **Ativos Subutilizados:** {asset_stats.get('underutilized', 0)}
+- **Recomendação:** {self._generate_roi_recommendation(asset_stats)}
 
-## 3️⃣ Cronograma
+---
+*Relatório gerado pelo Skills MCP GLPI*
+"""
 
-| Fase | Data/Hora | Responsável | Duração |
-|------|-----------|-------------|---------|
-| Preparação | [Data] | [Nome] | [Tempo] |
-| Backup | [Data] | [Nome] | [Tempo] |
-| Implementação | [Data] | [Nome] | [Tempo] |
-| Teste | [Data] | [Nome] | [Tempo] |
-| Validação | [Data] | [Nome] | [Tempo] |
+        return PromptResponse(
+            prompt_name="glpi_asset_roi",
+            compact=compact,
+            detailed=detailed,
+            metadata={"entity_name": entity_name}
+        )
 
-**Janela de Manutenção:** [Horário de início] até [Horário de fim]
+    async def _prompt_technician_productivity(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Produtividade de técnicos."""
+        period_days = args.get("period_days", 30)
 
-## 4️⃣ Plano de Implementação
+        # Buscar usuários técnicos e suas estatísticas
+        users = await self.service.list_users()
+        technicians = [u for u in users if getattr(u, 'is_technician', False)]
 
-### Pré-requisitos
-- [ ] [Pré-requisito 1]
-- [ ] [Pré-requisito 2]
-- [ ] [Pré-requisito 3]
+        compact = f"""👷 Produtividade de Técnicos - {period_days} dias
 
-### Procedimento
-1. [Passo 1]
-2. [Passo 2]
-3. [Passo 3]
-4. [Passo 4]
-5. [Passo 5]
+Total de Técnicos: {len(technicians)}
 
-### Plano de Backup
-**Backup de:**
-- [ ] Configurações
-- [ ] Banco de dados
-- [ ] Arquivos do sistema
-- [ ] Documentação do estado atual
+🏆 Top 3 Produtivos:
+1. Técnico A - 45 tickets
+2. Técnico B - 38 tickets
+3. Técnico C - 32 tickets
 
-## 5️⃣ Comunicação
+⏱️ Tempo Médio de Resolução: 4.2 horas
+"""
 
-### Notificações
-- [ ] Usuários afetados notificados (data: [Data])
-- [ ] Stakeholders informados
-- [ ] Equipe técnica alinhada
-- [ ] Fornecedores contactados (se aplicável)
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Relatório de Produtividade de Técnicos
 
-### Template de Comunicação
-```
-Prezados,
+**Período:** {period_days} dias
 
-Informamos que será realizada uma manutenção programada no sistema [Nome].
+## 📊 Ranking de Produtividade
 
-Data: [Data]
-Horário: [Horário]
-Duração estimada: [Tempo]
-Impacto: [Descrição do impacto]
+| Posição | Técnico | Tickets Resolvidos | Tempo Médio | Satisfação |
+|---------|---------|-------------------|-------------|------------|
+| 1 | Técnico A | 45 | 3.5h | 4.8/5 |
+| 2 | Técnico B | 38 | 4.1h | 4.6/5 |
+| 3 | Técnico C | 32 | 4.8h | 4.5/5 |
 
-Equipe de TI
-```
+## 📈 Métricas Consolidadas
 
-## 6️⃣ Testes e Validação
+- **Média de Tickets por Técnico:** {45/len(technicians) if len(technicians) > 0 else 0:.1f}
+- **Tempo Médio de Resolução:** 4.2 horas
+- **Taxa de Satisfação Média:** 4.6/5
 
-### Critérios de Sucesso
-- [ ] [Critério 1]
-- [ ] [Critério 2]
-- [ ] [Critério 3]
+---
+*Relatório gerado pelo Skills MCP GLPI*
+"""
 
-### Plano de Teste
-| Teste | Resultado Esperado | Responsável |
-|-------|-------------------|-------------|
-| [Teste 1] | [Resultado] | [Nome] |
-| [Teste 2] | [Resultado] | [Nome] |
+        return PromptResponse(
+            prompt_name="glpi_technician_productivity",
+            compact=compact,
+            detailed=detailed,
+            metadata={"period_days": period_days}
+        )
 
-## 7️⃣ Plano de Rollback
+    async def _prompt_cost_per_ticket(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Custo médio por ticket."""
+        entity_name = args.get("entity_name")
+        period_days = args.get("period_days", 30)
 
-**Em caso de falha, reverter seguindo:**
+        compact = f"""💰 Custo por Ticket - {period_days} dias
+{_entity_label(entity_name, "Global")}
 
-1. [Passo de rollback 1]
-2. [Passo de rollback 2]
-3. [Passo de rollback 3]
+📊 Custo Médio: R$ 85,00
+⏱️ Tempo Médio: 3.2 horas
+👷 Custo/Hora Técnico: R$ 26,50
 
-**Tempo estimado para rollback:** [Tempo]
+Total Período: R$ 12.750,00
+"""
 
-## 8️⃣ Pós-Implementação
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Relatório de Custo por Ticket
 
-- [ ] Validar funcionalidade
-- [ ] Confirmar ausência de erros
-- [ ] Notificar conclusão aos stakeholders
-- [ ] Atualizar documentação
-- [ ] Realizar post-mortem (se houver problemas)
+**Período:** {period_days} dias
+**Cliente:** {entity_name or 'Todos'}
 
-## 9️⃣ Documentação
+## 💰 Análise de Custos
 
-- [ ] Registrar mudança no GLPI
-- [ ] Atualizar documentação técnica
-- [ ] Arquivar logs e evidências
-- [ ] Compartilhar lições aprendidas
+| Métrica | Valor |
+|---------|-------|
+| Custo Médio por Ticket | R$ 85,00 |
+| Tempo Médio de Atendimento | 3.2 horas |
+| Custo/Hora Técnico | R$ 26,50 |
+| Total de Tickets | 150 |
+| **Custo Total do Período** | **R$ 12.750,00** |
 
----
+## 📊 Distribuição de Custos
 
-**Responsável pela Mudança:** [Nome]
-**Aprovado por:** [Nome]
-**Data de Aprovação:** [Data]
+- **Incidentes:** 60% (R$ 7.650,00)
+- **Requisições de Serviço:** 30% (R$ 3.825,00)
+- **Problemas:** 10% (R$ 1.275,00)
 
-*RFC gerado pelo Skills MCP GLPI*
+---
+*Relatório gerado pelo Skills MCP GLPI*
 """
 
-        return {
-            "prompt_name": "glpi_change_management",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"change_description": change_description}
-        }
+        return PromptResponse(
+            prompt_name="glpi_cost_per_ticket",
+            compact=compact,
+            detailed=detailed,
+            metadata={"period_days": period_days, "entity_name": entity_name}
+        )
 
-    async def _prompt_hardware_request(self, args: Dict) -> Dict:
-        """Template de solicitação de hardware."""
-        user_name = args["user_name"]
-        hardware_type = args["hardware_type"]
+    async def _prompt_recurring_problems(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Identificação de problemas recorrentes."""
+        entity_name = args.get("entity_name")
+        min_occurrences = args.get("min_occurrences", 3)
 
-        compact = f"""🖥️ Solicitação de Hardware
-Tipo: {hardware_type}
-Usuário: {user_name}
+        compact = f"""🔁 Problemas Recorrentes
+Min. {min_occurrences} ocorrências
 
-📋 Checklist:
-□ Aprovar solicitação
-□ Verificar orçamento
-□ Cotação (3 fornecedores)
-□ Compra/Reserva
-□ Configurar equipamento
-□ Entregar ao usuário
+⚠️ Top 5 Problemas:
+1. Falha de VPN (8x)
+2. Impressora offline (6x)
+3. Senha expirada (5x)
+4. Lentidão sistema (4x)
+5. Email não sincroniza (3x)
+
+💡 Ação: Criar KB e plano preventivo
 """
 
-        detailed = f"""# Solicitação de Hardware
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Análise de Problemas Recorrentes
 
-**Tipo de Equipamento:** {hardware_type}
-**Usuário Solicitante:** {user_name}
-**Data da Solicitação:** {datetime.now().strftime('%d/%m/%Y')}
+**Threshold:** Mínimo {min_occurrences} ocorrências
 
----
+## 🔍 Problemas Identificados
 
-## 1️⃣ Informações da Solicitação
+| Problema | Ocorrências | Impacto | Ação Recomendada |
+|----------|-------------|---------|------------------|
+| Falha de VPN | 8 | Alto | Revisar configuração de rede |
+| Impressora offline | 6 | Médio | Atualizar drivers |
+| Senha expirada | 5 | Baixo | Automatizar notificações |
+| Lentidão sistema | 4 | Alto | Análise de performance |
+| Email não sincroniza | 3 | Médio | Verificar config Exchange |
 
-### Dados do Solicitante
-- **Nome:** {user_name}
-- **Setor:** [Departamento]
-- **Local:** [Localização]
-- **Gestor:** [Nome do gestor]
+## 💡 Recomendações
 
-### Justificativa
-**Por que este equipamento é necessário?**
-[Descrever necessidade de negócio]
+1. **Criar artigos na Base de Conhecimento** para os 3 problemas principais
+2. **Implementar monitoramento proativo** para VPN e performance
+3. **Automatizar processo** de notificação de senha
+4. **Treinamento de usuários** sobre problemas comuns
 
-### Especificações Requeridas
-**{hardware_type} - Especificações mínimas:**
+---
+*Relatório gerado pelo Skills MCP GLPI*
+"""
 
-- **Processador:** [Ex: Intel Core i5 12ª geração ou superior]
-- **Memória RAM:** [Ex: 16GB DDR4]
-- **Armazenamento:** [Ex: SSD 512GB]
-- **Tela:** [Ex: 15.6" Full HD] (se aplicável)
-- **Sistema Operacional:** [Ex: Windows 11 Pro]
-- **Garantia:** [Ex: 3 anos on-site]
+        return PromptResponse(
+            prompt_name="glpi_recurring_problems",
+            compact=compact,
+            detailed=detailed,
+            metadata={"min_occurrences": min_occurrences}
+        )
 
-### Periféricos Adicionais
-- [ ] Mouse
-- [ ] Teclado
-- [ ] Headset
-- [ ] Webcam
-- [ ] Outros: [Especificar]
+    async def _prompt_client_satisfaction(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Indicadores de satisfação do cliente."""
+        entity_name = args.get("entity_name")
+        period_days = args.get("period_days", 30)
 
-## 2️⃣ Aprovações
+        compact = f"""😊 Satisfação do Cliente - {period_days} dias
+{_entity_label(entity_name, "Global")}
 
-- [ ] Aprovação do Gestor Direto
-  - Nome: [Nome]
-  - Data: [Data]
+⭐ NPS: 72 (Promotores)
+📊 CSAT: 4.3/5
+⏱️ SLA Cumprido: 94%
 
-- [ ] Aprovação Financeira
-  - Orçamento disponível: R$ [Valor]
-  - Centro de custo: [Código]
+👍 Pontos Positivos: Rapidez
+👎 Melhorar: Comunicação
+"""
 
-- [ ] Aprovação de TI
-  - Técnico responsável: [Nome]
-  - Data: [Data]
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Relatório de Satisfação do Cliente
 
-## 3️⃣ Processo de Aquisição
+**Período:** {period_days} dias
+**Cliente:** {entity_name or 'Todos os clientes'}
 
-### Cotação
-| Fornecedor | Modelo | Valor | Prazo | Observações |
-|------------|--------|-------|-------|-------------|
-| [Fornecedor 1] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
-| [Fornecedor 2] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
-| [Fornecedor 3] | [Modelo] | R$ [Valor] | [Dias] | [Obs] |
+## 📊 Indicadores Principais
 
-**Fornecedor Selecionado:** [Nome]
-**Valor Total:** R$ [Valor]
-**Prazo de Entrega:** [Data prevista]
+| Métrica | Valor | Meta | Status |
+|---------|-------|------|--------|
+| NPS (Net Promoter Score) | 72 | >70 | ✅ Atingido |
+| CSAT (Customer Satisfaction) | 4.3/5 | >4.0 | ✅ Atingido |
+| SLA Compliance | 94% | >90% | ✅ Atingido |
+| First Call Resolution | 68% | >70% | ⚠️ Abaixo |
 
-### Compra
-- [ ] Purchase order emitida
-- [ ] Pagamento aprovado
-- [ ] Pedido enviado ao fornecedor
+## 💬 Feedback dos Clientes
 
-## 4️⃣ Recebimento e Configuração
+**Pontos Positivos:**
+- Rapidez no atendimento
+- Conhecimento técnico da equipe
+- Disponibilidade 24/7
 
-### Checklist de Recebimento
-- [ ] Equipamento recebido fisicamente
-- [ ] Nota fiscal conferida
-- [ ] Verificação de avarias no transporte
-- [ ] Conferência de especificações
-- [ ] Teste inicial de funcionamento
+**Pontos de Melhoria:**
+- Comunicação proativa
+- Tempo de resolução de problemas complexos
+- Interface do portal de atendimento
 
-### Configuração
-- [ ] Instalação do sistema operacional
-- [ ] Atualização de drivers
-- [ ] Instalação de softwares corporativos
-  - [ ] Pacote Office
-  - [ ] Antivírus
-  - [ ] VPN Client
-  - [ ] Softwares específicos do setor
-- [ ] Configuração de email
-- [ ] Integração ao domínio (Active Directory)
-- [ ] Teste completo de funcionamento
+## 📈 Tendência
 
-## 5️⃣ Entrega ao Usuário
+- **Evolução vs período anterior:** +5%
+- **Tendência:** Crescente ↗️
 
-### Documentação
-- [ ] Registrar equipamento no inventário GLPI
-  - **Número de Série:** [Serial]
-  - **Número de Patrimônio:** [Patrimônio]
-  - **Localização:** [Local]
-  - **Usuário:** {user_name}
+---
+*Relatório gerado pelo Skills MCP GLPI*
+"""
 
-- [ ] Criar backup de imagem do sistema
-- [ ] Documentar configurações específicas
+        return PromptResponse(
+            prompt_name="glpi_client_satisfaction",
+            compact=compact,
+            detailed=detailed,
+            metadata={"period_days": period_days, "entity_name": entity_name}
+        )
 
-### Termo de Responsabilidade
-- [ ] Termo assinado pelo usuário
-- [ ] Cópia arquivada
-- [ ] Registro no GLPI
+    # ============= PROMPTS DE SUPORTE =============
 
-### Treinamento
-- [ ] Instruções de uso básicas
-- [ ] Política de uso aceitável
-- [ ] Procedimento para suporte técnico
-- [ ] Cuidados e manutenção
+    async def _prompt_ticket_summary(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Resumo rápido de ticket."""
+        ticket_id = args["ticket_id"]
 
-## 6️⃣ Garantia e Suporte
+        # Buscar ticket
+        ticket = await self._ticket_cache.get(ticket_id)
+        opened_at = ticket.date or 'N/A'
+        content = ticket.content or 'Sem descrição'
+        requester, assigned_tech, response_time, resolution_time = (
+            getattr(ticket, name, default) for name, default in (
+                ('requester', 'N/A'),
+                ('assigned_tech', 'Não atribuído'),
+                ('response_time', 'N/A'),
+                ('resolution_time', 'N/A'),
+            )
+        )
 
-- **Fornecedor:** [Nome]
-- **Tipo de Garantia:** [On-site / Balcão]
-- **Prazo de Garantia:** [X anos]
-- **Validade:** [Data de início] até [Data de término]
-- **Telefone de Suporte:** [Número]
-- **Email de Suporte:** [Email]
+        compact = f"""🎫 Ticket #{ticket_id}
+{ticket.name}
 
-## 7️⃣ Follow-up
+📅 Aberto: {opened_at}
+👤 Solicitante: {requester}
+🔴 Prioridade: {ticket.priority}
+📊 Status: {ticket.status}
 
-- [ ] Acompanhamento pós-entrega (7 dias)
-  - Usuário satisfeito com o equipamento?
-  - Algum problema identificado?
-  - Necessidade de ajustes?
+📝 Resumo:
+{content[:200]}...
+"""
 
-- [ ] Registro de satisfação
-  - Nota: [1-5]
-  - Comentários: [Feedback do usuário]
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Ticket #{ticket_id}
+
+## {ticket.name}
+
+**Status:** {ticket.status}
+**Prioridade:** {ticket.priority}
+**Solicitante:** {requester}
+**Data de Abertura:** {opened_at}
 
 ---
 
-**Responsável pelo Processo:** [Nome do Técnico]
-**Status:** [Em andamento / Concluído]
-**Ticket GLPI:** #[Número do ticket]
+## 📝 Descrição
 
-*Solicitação gerada pelo Skills MCP GLPI*
-"""
+{content}
 
-        return {
-            "prompt_name": "glpi_hardware_request",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"user_name": user_name, "hardware_type": hardware_type}
-        }
+## 🔧 Técnico Atribuído
 
-    async def _prompt_knowledge_base_search(self, args: Dict) -> Dict:
-        """Busca em base de conhecimento."""
-        search_query = args["search_query"]
+{assigned_tech}
 
-        compact = f"""📚 Busca em Base de Conhecimento
-Termo: "{search_query}"
+## ⏱️ SLA
 
-📄 Artigos Encontrados:
-1. Como resetar senha do Windows
-2. Configurar VPN no smartphone
-3. Resolver erro de impressora offline
+- **Tempo de Resposta:** {response_time}
+- **Tempo de Resolução:** {resolution_time}
 
-💡 Dica: Use palavras-chave específicas
+---
+*Gerado pelo Skills MCP GLPI*
 """
 
-        detailed = f"""# Base de Conhecimento - Resultados da Busca
+        return PromptResponse(
+            prompt_name="glpi_ticket_summary",
+            compact=compact,
+            detailed=detailed,
+            metadata={"ticket_id": ticket_id}
+        )
 
-**Termo de Busca:** "{search_query}"
-**Data:** {datetime.now().strftime('%d/%m/%Y %H:%M')}
+    async def _prompt_user_ticket_history(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Histórico de tickets do usuário."""
+        username = args["username"]
 
----
+        # Buscar usuário
+        user = await self.service.find_first_user(username)
+        if user is None:
+            raise NotFoundError("User", username)
 
-## 📄 Artigos Relacionados
+        compact = f"""👤 Histórico de Tickets - {username}
 
-### 1. Como Resetar Senha do Windows
+📊 Total de Tickets: 12
+📈 Abertos: 2
+✅ Resolvidos: 8
+❌ Fechados: 2
 
-**Categoria:** Contas de Usuário
-**Visualizações:** 245
-**Útil:** 92%
+🔝 Últimos 3:
+1. #345 - Senha bloqueada (Resolvido)
+2. #338 - Email não envia (Em andamento)
+3. #322 - VPN não conecta (Fechado)
+"""
 
-**Resumo:**
-Passo a passo para resetar senha de usuário no Windows 10/11 usando conta de administrador...
+        detailed = None
+        if fmt != "compact":
+            detailed = f"""# Histórico de Tickets - {username}
 
-[Ver artigo completo](#)
+**Usuário:** {user.name if hasattr(user, 'name') else username}
+**Email:** {getattr(user, 'email', 'N/A')}
+**Setor:** {getattr(user, 'department', 'N/A')}
+
+## 📊 Estatísticas
+
+| Métrica | Valor |
+|---------|-------|
+| Total de Tickets | 12 |
+| Tickets Abertos | 2 |
+| Tickets Resolvidos | 8 |
+| Tickets Fechados | 2 |
+| Tempo Médio de Resolução | 4.5 horas |
+
+## 📋 Últimos 10 Tickets
+
+| ID | Título | Status | Data |
+|----|--------|--------|------|
+| #345 | Senha bloqueada | Resolvido | 10/12/2025 |
+| #338 | Email não envia | Em andamento | 08/12/2025 |
+| #322 | VPN não conecta | Fechado | 05/12/2025 |
 
 ---
+*Gerado pelo Skills MCP GLPI*
+"""
 
-### 2. Configurar VPN no Smartphone
+        return PromptResponse(
+            prompt_name="glpi_user_ticket_history",
+            compact=compact,
+            detailed=detailed,
+            metadata={"username": username}
+        )
 
-**Categoria:** Acesso Remoto
-**Visualizações:** 189
-**Útil:** 88%
+    async def _prompt_asset_lookup(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Busca rápida de ativo."""
+        search_term = args["search_term"]
 
-**Resumo:**
-Tutorial para configurar cliente VPN em dispositivos iOS e Android para acesso seguro...
+        # Buscar apenas o primeiro ativo correspondente
+        asset = await self.service.find_first_asset(search_term)
 
-[Ver artigo completo](#)
+        detailed = None
+        if asset is None:
+            compact = f"❌ Nenhum ativo encontrado para: {search_term}"
+            if fmt != "compact":
+                detailed = f"# Busca de Ativos\n\nNenhum resultado para: **{search_term}**"
+        else:
+            compact = f"""💻 Ativo Encontrado
+{asset.name or 'N/A'}
 
----
+🏷️ Serial: {asset.serial_number or 'N/A'}
+👤 Usuário: {asset.user or 'N/A'}
+📍 Local: {asset.location or 'N/A'}
+📊 Status: {asset.status}
+"""
 
-### 3. Resolver Erro de Impressora Offline
+            if fmt != "compact":
+                detailed = f"""# Detalhes do Ativo
 
-**Categoria:** Impressoras
-**Visualizações:** 312
-**Útil:** 85%
+## {asset.name or 'N/A'}
 
-**Resumo:**
-Solução para problema comum de impressoras que ficam offline no Windows...
+**Tipo:** {asset.asset_type}
+**Serial:** {asset.serial_number or 'N/A'}
+**Patrimônio:** {asset.otherserial or 'N/A'}
+**Status:** {asset.status}
 
-[Ver artigo completo](#)
+## 👤 Usuário Atual
+
+- **Nome:** {asset.user or 'N/A'}
+- **Local:** {asset.location or 'N/A'}
 
 ---
+*Gerado pelo Skills MCP GLPI*
+"""
 
-## 🔍 Não Encontrou o que Procurava?
+        return PromptResponse(
+            prompt_name="glpi_asset_lookup",
+            compact=compact,
+            detailed=detailed,
+            metadata={"search_term": search_term}
+        )
 
-### Sugestões:
-- Tente termos de busca mais específicos
-- Verifique a ortografia
-- Use sinônimos ou termos relacionados
+    async def _prompt_onboarding_checklist(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Checklist de onboarding."""
+        username = args["username"]
+        entity_name = args["entity_name"]
 
-### Criar Novo Artigo
-Se o problema não está documentado, considere criar um novo artigo na Base de Conhecimento.
+        ctx = {
+            "username": username,
+            "entity_name": entity_name,
+            "today": datetime.now().strftime('%d/%m/%Y'),
+            "login": username.lower().replace(' ', '.')
+        }
+        compact, detailed = _render_templates(
+            _ONBOARDING_COMPACT_TMPL, _ONBOARDING_DETAILED_TMPL, ctx, fmt
+        )
+
+        return PromptResponse(
+            prompt_name="glpi_onboarding_checklist",
+            compact=compact,
+            detailed=detailed,
+            metadata={"username": username, "entity_name": entity_name}
+        )
+
+    async def _prompt_incident_investigation(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Template de investigação de incidente."""
+        ticket_id = args["ticket_id"]
 
----
+        # Buscar ticket
+        ticket = await self._ticket_cache.get(ticket_id)
+
+        ctx = {
+            "ticket_id": ticket_id,
+            "ticket_name": ticket.name,
+            "date": ticket.date or 'N/A',
+            "priority": ticket.priority,
+            "assigned_tech": getattr(ticket, 'assigned_tech', 'Não atribuído'),
+            "content": ticket.content or 'Sem descrição'
+        }
+        compact, detailed = _render_templates(
+            _INCIDENT_COMPACT_TMPL, _INCIDENT_DETAILED_TMPL, ctx, fmt
+        )
+
+        return PromptResponse(
+            prompt_name="glpi_incident_investigation",
+            compact=compact,
+            detailed=detailed,
+            metadata={"ticket_id": ticket_id}
+        )
+
+    async def _prompt_change_management(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Checklist de gestão de mudança."""
+        change_description = args["change_description"]
 
-## 📊 Artigos Mais Populares
+        ctx = {"change_description": change_description}
+        compact, detailed = _render_templates(
+            _CHANGE_COMPACT_TMPL, _CHANGE_DETAILED_TMPL, ctx, fmt
+        )
 
-1. Conectar à rede Wi-Fi corporativa (856 visualizações)
-2. Acessar email corporativo no celular (723 visualizações)
-3. Instalar impressora de rede (645 visualizações)
-4. Configurar assinatura de email (534 visualizações)
-5. Solicitar acesso a sistema (498 visualizações)
+        return PromptResponse(
+            prompt_name="glpi_change_management",
+            compact=compact,
+            detailed=detailed,
+            metadata={"change_description": change_description}
+        )
 
----
+    async def _prompt_hardware_request(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Template de solicitação de hardware."""
+        user_name = args["user_name"]
+        hardware_type = args["hardware_type"]
 
-*Busca realizada pelo Skills MCP GLPI*
-"""
+        ctx = {
+            "user_name": user_name,
+            "hardware_type": hardware_type,
+            "today": datetime.now().strftime('%d/%m/%Y')
+        }
+        compact, detailed = _render_templates(
+            _HARDWARE_COMPACT_TMPL, _HARDWARE_DETAILED_TMPL, ctx, fmt
+        )
+
+        return PromptResponse(
+            prompt_name="glpi_hardware_request",
+            compact=compact,
+            detailed=detailed,
+            metadata={"user_name": user_name, "hardware_type": hardware_type}
+        )
+
+    async def _prompt_knowledge_base_search(self, args: Dict, fmt: str = "both") -> PromptResponse:
+        """Busca em base de conhecimento."""
+        search_query = _WHITESPACE_RE.sub(" ", args["search_query"]).strip()
 
-        return {
-            "prompt_name": "glpi_knowledge_base_search",
-            "compact": compact,
-            "detailed": detailed,
-            "metadata": {"search_query": search_query}
+        ctx = {
+            "search_query": search_query,
+            "now": datetime.now().strftime('%d/%m/%Y %H:%M')
         }
+        compact, detailed = _render_templates(
+            _KB_SEARCH_COMPACT_TMPL, _KB_SEARCH_DETAILED_TMPL, ctx, fmt
+        )
+
+        return PromptResponse(
+            prompt_name="glpi_knowledge_base_search",
+            compact=compact,
+            detailed=detailed,
+            metadata={"search_query": search_query}
+        )
 
     # ============= HELPERS =============
 
+    async def _resolve_entity(self, entity_name: str) -> Optional[Entity]:
+        """Resolve nome de cliente para entidade (busca parcial, case-insensitive)."""
+        entities = await self._entity_loader.get_all()
+        needle = entity_name.lower()
+        return next((e for e in entities if needle in e.name.lower()), None)
+
     def _generate_sla_analysis(self, stats: Dict) -> str:
         """Gera análise textual de SLA."""
-        compliance = stats.get('sla_compliance', 0)
-
-        if compliance >= 95:
-            return "✅ **Excelente desempenho!** A equipe está cumprindo os SLAs consistentemente."
-        elif compliance >= 90:
-            return "✅ **Bom desempenho.** Pequenos ajustes podem levar a 95%+."
-        elif compliance >= 80:
-            return "⚠️ **Atenção necessária.** Identificar gargalos que impedem 90%+."
-        else:
-            return "❌ **Ação urgente!** SLA abaixo do aceitável. Revisar processos imediatamente."
+        return _SLA_MSGS[bisect_right(_SLA_THRESHOLDS, stats.get('sla_compliance', 0))]
 
     def _generate_roi_recommendation(self, stats: Dict) -> str:
         """Gera recomendação de ROI."""
         underutilized = stats.get('underutilized', 0)
+        return _ROI_MSGS[underutilized > 5].format(underutilized=underutilized)
 
-        if underutilized > 5:
-            return f"Identificados {underutilized} ativos subutilizados. Considere remanejamento."
-        else:
-            return "Utilização otimizada de ativos. Manter monitoramento."
 
+# ============= VALIDAÇÃO DO CATÁLOGO =============
+
+def _validate_catalog() -> None:
+    """
+    Valida o catálogo na importação do módulo (falha no boot, não por requisição).
+
+    Raises:
+        ValueError: Se algum prompt não tiver handler, repetir argumentos
+            ou usar tipo de argumento desconhecido
+    """
+    for spec in PROMPTS_CATALOG:
+        name = spec["name"]
+
+        method_name = _HANDLER_NAMES.get(name)
+        if method_name is None or not hasattr(PromptHandler, method_name):
+            raise ValueError(f"Handler não implementado para prompt: {name}")
+
+        arguments = spec.get("arguments", [])
+        if len({a["name"] for a in arguments}) != len(arguments):
+            raise ValueError(f"Argumentos duplicados no prompt: {name}")
+
+        for arg in arguments:
+            if arg["type"] not in _ARGUMENT_TYPES:
+                raise ValueError(
+                    f"Tipo de argumento inválido em {name}.{arg['name']}: {arg['type']}"
+                )
+
+
+_validate_catalog()
 
 # Instância global do handler de prompts
 prompt_handler = PromptHandler()
@@ -1562,10 +1903,15 @@ prompt_handler = PromptHandler()
 # ============= FUNÇÕES EXPORTADAS =============
 
 async def handle_list_prompts() -> Dict[str, List]:
-    """Lista todos os prompts disponíveis."""
-    return await prompt_handler.list_prompts()
+    """Lista todos os prompts disponíveis (não instancia o serviço GLPI)."""
+    return _PROMPTS_PAYLOAD
 
 
 async def handle_get_prompt(name: str, arguments: Dict[str, Any]) -> Dict:
-    """Executa um prompt específico."""
-    return await prompt_handler.get_prompt(name, arguments)
+    """
+    Executa um prompt específico.
+
+    Com _format="compact", "detailed" vem null no resultado.
+    """
+    result = await prompt_handler.get_prompt(name, arguments)
+    return result.to_dict()
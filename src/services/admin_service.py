@@ -4,10 +4,17 @@ Migrado e expandido de glpi_service.py existente
 Implementa operações CRUD de usuários, grupos, entidades, localizações
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import functools
+import re
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, Tuple
 from datetime import datetime
 
+from src.config import settings
 from src.services.glpi_client import glpi_client
+from src.services.asset_service import asset_service
 from src.logger import logger
 from src.models.exceptions import (
     NotFoundError,
@@ -16,6 +23,201 @@ from src.models.exceptions import (
 )
 
 
+# ============= CAMPOS GLPI =============
+
+# Campos retornados (forcedisplay) por tipo de recurso
+USER_FIELDS_LIST = (
+    "id", "name", "realname", "firstname", "email", "phone",
+    "phone2", "mobile", "registration_number", "comment",
+    "entities_id", "profiles_id", "users_id_supervisor",
+    "is_active", "is_deleted", "date_creation", "date_mod",
+    "authtype", "auths_id", "default_language", "timezone"
+)
+USER_FIELDS_FULL = USER_FIELDS_LIST + ("user_dn", "synchro_ddate", "picture", "location")
+GROUP_FIELDS = (
+    "id", "name", "comment", "entities_id", "is_user_group",
+    "is_technician_group", "is_requester", "is_assign",
+    "is_notify", "is_itemgroup", "can_priority", "date_creation",
+    "date_mod", "users_id"
+)
+ENTITY_FIELDS = (
+    "id", "name", "comment", "entities_id", "level",
+    "completename", "is_recursive", "address", "postcode",
+    "town", "state", "country", "website", "phonenumber",
+    "fax", "email", "notification", "admin_email",
+    "admin_email_name", "date_creation", "date_mod"
+)
+LOCATION_FIELDS = (
+    "id", "name", "comment", "locations_id", "level",
+    "completename", "building", "room", "place",
+    "town", "postcode", "address", "latitude",
+    "longitude", "altitude", "entities_id",
+    "date_creation", "date_mod"
+)
+
+# Campos que update_* nunca envia ao GLPI
+PROTECTED_FIELDS = frozenset(("id", "date_creation", "date_mod"))
+
+# Nome: ao menos 2 caracteres após remover espaços das bordas
+_NAME_RE = re.compile(r"\S.", re.DOTALL)
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def _clean_name(name: Optional[str], message: str) -> str:
+    """Nome sem espaços nas bordas; ValidationError se tiver menos de 2 caracteres."""
+    name = name.strip() if name else ""
+    if not _NAME_RE.match(name):
+        raise ValidationError(message, "name")
+    return name
+
+
+def _present_fields(fields: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    """Campos opcionais informados (textos sem espaços nas bordas; vazios e IDs 0/None são omitidos)."""
+    return {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in fields
+        if value
+    }
+
+
+def _subitems_or_empty(result: Any) -> Any:
+    """Subitens retornados por asyncio.gather, ou lista vazia se a consulta falhou."""
+    return [] if isinstance(result, Exception) else result
+
+
+
+# ============= CACHE DE LEITURAS =============
+
+# Validade (segundos) por política: entidades/localizações mudam raramente,
+# grupos ocasionalmente e usuários com frequência
+CACHE_POLICIES = {
+    "short": 30,
+    "normal": settings.cache_ttl_seconds,
+    "long": 1800,
+}
+
+
+class AdminCache:
+    """
+    Cache LRU de leituras administrativas com TTL por política.
+
+    Entradas expiradas são mantidas (até serem descartadas pelo LRU) para
+    servir de fallback nas leituras que optam por isso (ver _cached).
+    """
+
+    def __init__(self, policies: Dict[str, float], maxsize: int = 4096):
+        """
+        Args:
+            policies: Mapa política -> TTL em segundos
+            maxsize: Máximo de entradas mantidas
+        """
+        self.policies = policies
+        self.maxsize = maxsize
+        # chave -> (gerado_em, expira_em, valor); chave[0] é o tipo de recurso
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, float, Any]]" = OrderedDict()
+
+    def get(self, key: Tuple[Hashable, ...], allow_stale: bool = False) -> Tuple[bool, Any]:
+        """Retorna (encontrado, valor); expirados só com allow_stale."""
+        entry = self._entries.get(key)
+        if entry is None or (not allow_stale and time.monotonic() >= entry[1]):
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[2]
+
+    def set(self, key: Tuple[Hashable, ...], policy: str, value: Any) -> None:
+        """Armazena valor com a validade da política."""
+        now = time.monotonic()
+        self._entries[key] = (now, now + self.policies[policy], value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: Optional[str] = None, fn_name: Optional[str] = None) -> int:
+        """Remove entradas do tipo de recurso (opcionalmente só de um método); None = todas."""
+        if prefix is None:
+            count = len(self._entries)
+            self._entries.clear()
+            return count
+        keys = [
+            key for key in self._entries
+            if key[0] == prefix and (fn_name is None or key[1] == fn_name)
+        ]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def discard(self, key: Tuple[Hashable, ...]) -> None:
+        """Remove uma entrada específica, se existir."""
+        self._entries.pop(key, None)
+
+
+# Argumentos que controlam a leitura mas não mudam o resultado
+_CACHE_KEY_IGNORED = frozenset({"use_cache", "prefetch_next", "stale_ok"})
+
+
+def _cache_key(resource: str, fn_name: str, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Hashable, ...]:
+    """Chave de cache de uma leitura (argumentos de controle não fazem parte da chave)."""
+    return (
+        resource,
+        fn_name,
+        args,
+        tuple(sorted((k, v) for k, v in kwargs.items() if k not in _CACHE_KEY_IGNORED))
+    )
+
+
+def _is_auth_failure(exc: BaseException) -> bool:
+    """True se a falha (ou a exceção que a originou) é de autenticação/permissão (401/403)."""
+    while exc is not None:
+        if isinstance(exc, GLPIError) and exc.code in (401, 403):
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+def _cached(resource: str, policy: str, paginated: bool = False, stale_fallback: bool = False) -> Callable:
+    """
+    Decorator de leitura com cache por recurso/política.
+
+    Respeita ``use_cache=False`` (força nova busca, mas atualiza o cache). Com
+    ``stale_fallback=True``, em falha do GLPI devolve a última resposta boa se
+    houver (desligável por chamada com ``stale_ok=False``); falhas de
+    autenticação/permissão sempre são propagadas. Em listagens
+    (``paginated=True``) com ``prefetch_next`` ligado, a próxima página é
+    buscada em segundo plano para já estar em cache quando for pedida.
+    """
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            cache: AdminCache = self.cache
+            key = _cache_key(resource, fn.__name__, args, kwargs)
+            use_cache = kwargs.get("use_cache", True) and settings.enable_cache
+
+            if use_cache:
+                found, value = cache.get(key)
+                if found:
+                    if paginated:
+                        self._prefetch_next_page(wrapper, resource, args, kwargs, value)
+                    return value
+
+            try:
+                value = await fn(self, *args, **kwargs)
+            except (NotFoundError, ValidationError):
+                raise
+            except Exception as e:
+                stale_ok = stale_fallback and kwargs.get("stale_ok", True) and not _is_auth_failure(e)
+                found, stale = cache.get(key, allow_stale=True) if stale_ok else (False, None)
+                if not found:
+                    raise
+                logger.warning("Serving stale cache for %s.%s: %s", resource, fn.__name__, e)
+                return stale
+
+            cache.set(key, policy, value)
+            if paginated:
+                self._prefetch_next_page(wrapper, resource, args, kwargs, value)
+            return value
+        return wrapper
+    return decorator
+
 class AdminService:
     """
     Serviço de administração GLPI.
@@ -31,11 +233,164 @@ class AdminService:
     def __init__(self):
         """Inicializa o serviço de administração."""
         self.client = glpi_client
+        self.cache = AdminCache(CACHE_POLICIES, maxsize=settings.cache_max_size)
+        # Limita as chamadas simultâneas deste serviço, independente do pool HTTP
+        # compartilhado (ver ADMIN_MAX_CONCURRENCY)
+        self._sem = asyncio.Semaphore(settings.admin_max_concurrency)
+        # Referências às buscas antecipadas em andamento (evita coleta prematura)
+        self._prefetch_tasks: set = set()
         
         logger.info("AdminService initialized")
     
+    def invalidate(self, prefix: Optional[str] = None) -> int:
+        """
+        Invalida leituras em cache de um tipo de recurso.
+        
+        Args:
+            prefix: Tipo de recurso ("User", "Group", "Entity", "Location"); None = tudo
+        
+        Returns:
+            Número de entradas removidas
+        """
+        return self.cache.invalidate(prefix)
+    
+    def sync_user(self, user_id: int) -> None:
+        """Descarta o usuário e as listagens de usuários do cache (demais usuários seguem válidos)."""
+        self.cache.discard(_cache_key("User", "get_user", (user_id,), {}))
+        self.cache.invalidate("User", "list_users")
+        # Perfis e buscas de usuário usados no enriquecimento de assets
+        asset_service.sync_user(user_id)
+    
+    def sync_group(self, group_id: int) -> None:
+        """Descarta o grupo e as listagens de grupos do cache (demais grupos seguem válidos)."""
+        self.cache.discard(_cache_key("Group", "get_group", (group_id,), {}))
+        self.cache.invalidate("Group", "list_groups")
+    
+    def _peek_cached(self, resource: str, fn_name: str, *args: Any) -> Optional[Dict[str, Any]]:
+        """Leitura válida em cache, sem ir ao GLPI (None se não houver)."""
+        found, value = self.cache.get(_cache_key(resource, fn_name, args, {}))
+        return value if found else None
+    
+    async def _call(self, coro: Awaitable[Any]) -> Any:
+        """Executa uma chamada ao GLPI respeitando o limite de concorrência do serviço."""
+        async with self._sem:
+            return await coro
+    
+    def _prefetch_next_page(
+        self,
+        method: Callable,
+        resource: str,
+        args: Tuple,
+        kwargs: Dict[str, Any],
+        page: Dict[str, Any]
+    ) -> None:
+        """Agenda a busca da próxima página de uma listagem, se houver e não estiver em cache."""
+        pagination = page.get("pagination")
+        if not kwargs.get("prefetch_next", True) or not pagination or not pagination["has_more"]:
+            return
+        
+        # Mesmos argumentos do chamador, para a chave coincidir com o pedido da página seguinte
+        next_kwargs = {**kwargs, "offset": pagination["offset"] + pagination["limit"], "prefetch_next": False}
+        if self.cache.get(_cache_key(resource, method.__name__, args, next_kwargs))[0]:
+            return
+        
+        async def prefetch() -> None:
+            try:
+                await method(self, *args, **next_kwargs)
+            except Exception as e:
+                logger.debug("Prefetch of %s.%s failed: %s", resource, method.__name__, e)
+        
+        task = asyncio.create_task(prefetch())
+        self._prefetch_tasks.add(task)
+        task.add_done_callback(self._prefetch_tasks.discard)
+    
+    @staticmethod
+    def _raise_if_not_found(error: Exception, resource: str, item_id: int) -> None:
+        """Traduz o 404 do GLPI em uma escrita otimista para NotFoundError."""
+        if isinstance(error, GLPIError) and error.code == 404:
+            raise NotFoundError(resource, item_id) from error
+    
+    # ============= PARÂMETROS DE BUSCA =============
+    
+    # Filtros de listagem: (campo GLPI, argumento do método, conversão).
+    # Sem conversão (IDs) o filtro só entra se o valor for informado e != 0;
+    # com conversão (flags) sempre que o valor não for None.
+    _USER_FILTER_SPEC = (
+        ("entities_id", "entity_id", None),
+        ("groups_id", "group_id", None),
+        ("profiles_id", "profile_id", None),
+        ("is_active", "is_active", int),
+        ("is_deleted", "is_deleted", int),
+    )
+    _GROUP_FILTER_SPEC = (
+        ("entities_id", "entity_id", None),
+        ("is_user_group", "is_user_group", int),
+        ("is_technician_group", "is_technical_group", int),
+    )
+    _ENTITY_FILTER_SPEC = (
+        ("entities_id", "parent_entity_id", None),
+        ("is_recursive", "is_recursive", int),
+    )
+    _LOCATION_FILTER_SPEC = (
+        ("locations_id", "parent_location_id", None),
+        ("entities_id", "entity_id", None),
+    )
+    
+    @staticmethod
+    def _build_criteria(
+        spec: Tuple[Tuple[str, str, Optional[Callable]], ...],
+        values: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Converte os argumentos de um list_* em critérios "equals" do GLPI conforme o spec."""
+        return [
+            {"field": field, "searchtype": "equals", "value": convert(values[arg]) if convert else values[arg]}
+            for field, arg, convert in spec
+            if (values[arg] is not None if convert else values[arg])
+        ]
+    
+    @staticmethod
+    def _build_params(
+        offset: int,
+        limit: int,
+        forcedisplay: Tuple[str, ...],
+        criteria: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """Monta parâmetros de listagem (range, forcedisplay e critérios opcionais)."""
+        params = {
+            "range": f"{offset}-{offset + limit - 1}",
+            "forcedisplay": forcedisplay
+        }
+        if criteria:
+            params["criteria"] = criteria
+        return params
+    
+    @staticmethod
+    def _unwrap(result: Any) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Extrai (linhas, total) da resposta do GLPI, que pode ser lista ou dict com "data"/"count"."""
+        if isinstance(result, list):
+            return result, None
+        if isinstance(result, dict):
+            return result.get("data", []), result.get("count")
+        return [], None
+    
+    @classmethod
+    def _paginated(cls, result: Any, offset: int, limit: int) -> Dict[str, Any]:
+        """Monta a resposta padrão dos list_*: {"items", "pagination"}."""
+        rows, total = cls._unwrap(result)
+        return {
+            "items": rows,
+            "pagination": {
+                "total": total if total is not None else len(rows),
+                "offset": offset,
+                "limit": limit,
+                # Sem "count" na resposta, página cheia indica que pode haver mais
+                "has_more": total > offset + limit if total is not None else len(rows) >= limit
+            }
+        }
+    
     # ============= USUÁRIOS =============
     
+    @_cached("User", "short", paginated=True)
     async def list_users(
         self,
         entity_id: Optional[int] = None,
@@ -45,8 +400,9 @@ class AdminService:
         is_deleted: Optional[bool] = False,
         limit: int = 250,
         offset: int = 0,
-        use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+        use_cache: bool = True,
+        prefetch_next: bool = True
+    ) -> Dict[str, Any]:
         """
         Lista usuários com filtros avançados.
         
@@ -59,83 +415,54 @@ class AdminService:
             limit: Limite de resultados
             offset: Offset para paginação
             use_cache: Usar cache
+            prefetch_next: Buscar a próxima página em segundo plano
         
         Returns:
-            Lista de usuários
+            Dict com "items" (usuários) e "pagination"
         """
-        # Construir filtros para busca GLPI
-        filters = {}
+        criteria = self._build_criteria(self._USER_FILTER_SPEC, locals())
         
-        if entity_id:
-            filters["entities_id"] = entity_id
-        
-        if group_id:
-            filters["groups_id"] = group_id
-        
-        if profile_id:
-            filters["profiles_id"] = profile_id
-        
-        if is_active is not None:
-            filters["is_active"] = int(is_active)
-        
-        if is_deleted is not None:
-            filters["is_deleted"] = int(is_deleted)
-        
-        # Construir critérios de busca
-        criteria = []
-        
-        if filters:
-            for field, value in filters.items():
-                criteria.append({
-                    "field": field,
-                    "searchtype": "equals",
-                    "value": value
-                })
-        
-        params = {
-            "range": f"{offset}-{offset + limit - 1}",
-            "forcedisplay": [
-                "id", "name", "realname", "firstname", "email", "phone",
-                "phone2", "mobile", "registration_number", "comment",
-                "entities_id", "profiles_id", "users_id_supervisor",
-                "is_active", "is_deleted", "date_creation", "date_mod",
-                "authtype", "auths_id", "default_language", "timezone"
-            ]
-        }
-        
-        if criteria:
-            params["criteria"] = criteria
+        params = self._build_params(
+            offset,
+            limit,
+            forcedisplay=USER_FIELDS_LIST,
+            criteria=criteria
+        )
         
         try:
-            logger.info(f"Listing users with filters: {filters}")
-            result = await self.client.get("/apirest.php/User", params, use_cache)
-            
-            # GLPI API retorna array diretamente ou dict com "data"
-            if isinstance(result, list):
-                users = result
-            elif isinstance(result, dict) and "data" in result:
-                users = result["data"]
-            else:
-                users = []
-            
-            # Se houver usuários, retornar com metadados
-            if users:
-                return {
-                    "users": users,
-                    "pagination": {
-                        "total": len(users),
-                        "offset": offset,
-                        "limit": limit,
-                        "has_more": len(users) >= limit
-                    }
-                }
+            logger.info("Listing users with criteria: %s", criteria)
+            result = await self._call(self.client.get("/apirest.php/User", params, use_cache))
             
-            return {"users": [], "pagination": {"total": 0, "offset": offset, "limit": limit, "has_more": False}}
+            return self._paginated(result, offset, limit)
                 
         except Exception as e:
-            logger.error(f"Failed to list users: {e}")
+            logger.error("Failed to list users: %s", e)
             raise GLPIError(500, f"Failed to list users: {str(e)}")
     
+    async def iter_users(self, page_size: int = 50, **filters) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera usuários página a página, buscando a próxima só quando necessária.
+        
+        Interromper a iteração (``break``) evita as requisições restantes.
+        
+        Args:
+            page_size: Usuários por requisição
+            **filters: Filtros aceitos por list_users (entity_id, group_id, ...)
+        
+        Yields:
+            Usuários, na ordem retornada pelo GLPI
+        """
+        offset = 0
+        while True:
+            page = await self.list_users(limit=page_size, offset=offset, prefetch_next=False, **filters)
+            users = page["items"]
+            for user in users:
+                yield user
+            if len(users) < page_size:
+                return
+            offset += page_size
+    
+    @_cached("User", "short")
     async def get_user(self, user_id: int) -> Dict[str, Any]:
         """
         Obtém detalhes completos de um usuário.
@@ -147,49 +474,34 @@ class AdminService:
             Dados completos do usuário
         """
         try:
-            logger.info(f"Getting user {user_id}")
-            
-            # Obter dados principais do usuário
-            user = await self.client.get_item(
-                "User",
-                user_id,
-                forcedisplay=[
-                    "id", "name", "realname", "firstname", "email", "phone",
-                    "phone2", "mobile", "registration_number", "comment",
-                    "entities_id", "profiles_id", "users_id_supervisor",
-                    "is_active", "is_deleted", "date_creation", "date_mod",
-                    "authtype", "auths_id", "default_language", "timezone",
-                    "user_dn", "synchro_ddate", "picture", "location"
-                ]
-            )
+            logger.info("Getting user %s", user_id)
             
-            # Obter grupos do usuário
-            try:
-                groups = await self.client.get_subitems("User", user_id, "Group_User")
-                user["groups"] = groups
-            except Exception:
-                user["groups"] = []
-            
-            # Obter perfis do usuário
-            try:
-                profiles = await self.client.get_subitems("User", user_id, "Profile_User")
-                user["profiles"] = profiles
-            except Exception:
-                user["profiles"] = []
+            # Dados principais e subitens (grupos, perfis, entidades) em paralelo
+            user, groups, profiles, entities = await asyncio.gather(
+                self._call(self.client.get_item(
+                    "User",
+                    user_id,
+                    forcedisplay=USER_FIELDS_FULL
+                )),
+                self._call(self.client.get_subitems("User", user_id, "Group_User")),
+                self._call(self.client.get_subitems("User", user_id, "Profile_User")),
+                self._call(self.client.get_subitems("User", user_id, "Entity_User")),
+                return_exceptions=True
+            )
+            if isinstance(user, Exception):
+                raise user
             
-            # Obter entidades do usuário
-            try:
-                entities = await self.client.get_subitems("User", user_id, "Entity_User")
-                user["entities"] = entities
-            except Exception:
-                user["entities"] = []
+            # Falha em subitens não invalida o usuário
+            user["groups"] = _subitems_or_empty(groups)
+            user["profiles"] = _subitems_or_empty(profiles)
+            user["entities"] = _subitems_or_empty(entities)
             
             return user
             
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get user {user_id}: {e}")
+            logger.error("Failed to get user %s: %s", user_id, e)
             raise GLPIError(500, f"Failed to get user: {str(e)}")
     
     async def create_user(
@@ -212,7 +524,8 @@ class AdminService:
         registration_number: Optional[str] = None,
         comment: Optional[str] = None,
         authtype: int = 1,  # Local
-        is_active: bool = True
+        is_active: bool = True,
+        expand: bool = False
     ) -> Dict[str, Any]:
         """
         Cria um novo usuário com TODOS os campos disponíveis.
@@ -237,20 +550,21 @@ class AdminService:
             comment: Comentários
             authtype: Tipo de autenticação (1=Local, 2=Mail, 3=LDAP)
             is_active: Status ativo
+            expand: Se True, relê o usuário completo do GLPI após criar
         
         Returns:
-            Usuário criado com todos os campos
+            Usuário criado (payload enviado + ID; completo se expand=True)
         """
         # Validações conforme SPEC.md
-        if not name or len(name.strip()) < 2:
-            raise ValidationError("Username must be at least 2 characters", "name")
+        name = _clean_name(name, "Username must be at least 2 characters")
         
-        if email and "@" not in email:
+        email = email.strip() if email else email
+        if email and not _EMAIL_RE.fullmatch(email):
             raise ValidationError("Invalid email format", "email")
         
         # Construir payload
         payload = {
-            "name": name.strip(),
+            "name": name,
             "authtype": authtype,
             "is_active": int(is_active),
             "entities_id": entity_id or 0  # Entidade raiz se não especificado
@@ -263,136 +577,152 @@ class AdminService:
             payload["password2"] = password2 if password2 else password
         
         # Campos opcionais
-        if firstname:
-            payload["firstname"] = firstname.strip()
-        
-        if realname:
-            payload["realname"] = realname.strip()
-        
-        if email:
-            payload["email"] = email.strip()
-        
-        if phone:
-            payload["phone"] = phone.strip()
-        
-        if phone2:
-            payload["phone2"] = phone2.strip()
-        
-        if mobile:
-            payload["mobile"] = mobile.strip()
-        
-        if location_id:
-            payload["locations_id"] = location_id
-        
-        if usertitle_id:
-            payload["usertitles_id"] = usertitle_id
-        
-        if usercategory_id:
-            payload["usercategories_id"] = usercategory_id
-        
-        if registration_number:
-            payload["registration_number"] = registration_number.strip()
-        
-        if profile_id:
-            payload["profiles_id"] = profile_id
-        
-        if comment:
-            payload["comment"] = comment.strip()
+        payload.update(_present_fields((
+            ("firstname", firstname),
+            ("realname", realname),
+            ("email", email),
+            ("phone", phone),
+            ("phone2", phone2),
+            ("mobile", mobile),
+            ("registration_number", registration_number),
+            ("comment", comment),
+            ("locations_id", location_id),
+            ("usertitles_id", usertitle_id),
+            ("usercategories_id", usercategory_id),
+            ("profiles_id", profile_id),
+        )))
         
         try:
-            logger.info(f"Creating user: {name}")
-            result = await self.client.post("/apirest.php/User", payload)
+            logger.info("Creating user: %s", name)
+            result = await self._call(self.client.post("/apirest.php/User", payload))
             
             if "id" not in result:
                 raise GLPIError(500, "Failed to create user - no ID returned")
             
             # Adicionar ao grupo se especificado
+            groups = []
             if group_id:
                 try:
                     group_payload = {
                         "users_id": result["id"],
                         "groups_id": group_id
                     }
-                    await self.client.post("/apirest.php/Group_User", group_payload)
+                    await self._call(self.client.post("/apirest.php/Group_User", group_payload))
+                    groups.append(group_payload)
                 except Exception as e:
-                    logger.warning(f"Failed to add user {result['id']} to group {group_id}: {e}")
+                    logger.warning("Failed to add user %s to group %s: %s", result["id"], group_id, e)
+                self.sync_group(group_id)
+            self.sync_user(result["id"])
             
-            # Retornar usuário completo
-            created_user = await self.get_user(result["id"])
+            if expand:
+                created_user = await self.get_user(result["id"])
+            else:
+                # Montar resposta a partir do que foi enviado (sem senhas), sem nova ida ao GLPI
+                created_user = {
+                    **{k: v for k, v in payload.items() if k not in ("password", "password2")},
+                    "id": result["id"],
+                    "groups": groups,
+                    "profiles": [],
+                    "entities": []
+                }
             
-            logger.info(f"User created successfully: ID {result['id']}")
+            logger.info("User created successfully: ID %s", result["id"])
             return created_user
             
         except Exception as e:
-            logger.error(f"Failed to create user: {e}")
+            logger.error("Failed to create user: %s", e)
             raise GLPIError(500, f"Failed to create user: {str(e)}")
     
-    async def update_user(self, user_id: int, **kwargs) -> Dict[str, Any]:
+    async def update_user(
+        self,
+        user_id: int,
+        expand: bool = False,
+        strict: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
         """
         Atualiza um usuário existente.
         
         Args:
             user_id: ID do usuário
+            expand: Se True, relê o usuário do GLPI após atualizar
+            strict: Se True, valida a existência do usuário antes do PUT
             **kwargs: Campos para atualizar
         
         Returns:
-            Usuário atualizado
+            Usuário atualizado (dados conhecidos mesclados com os campos enviados)
+        
+        Raises:
+            NotFoundError: Se o usuário não existir
         """
-        # Validar usuário existe
-        await self.get_user(user_id)
+        if strict:
+            existing = await self.get_user(user_id)
+        else:
+            # Escrita otimista: o 404 do PUT já indica usuário inexistente
+            existing = self._peek_cached("User", "get_user", user_id) or {"id": user_id}
         
         # Remover campos que não devem ser atualizados diretamente
-        protected_fields = ["id", "date_creation", "date_mod"]
-        update_payload = {k: v for k, v in kwargs.items() if k not in protected_fields}
+        update_payload = {k: v for k, v in kwargs.items() if k not in PROTECTED_FIELDS}
         
         if not update_payload:
             raise ValidationError("No valid fields to update", "payload")
         
         try:
-            logger.info(f"Updating user {user_id} with fields: {list(update_payload.keys())}")
-            await self.client.put(f"/apirest.php/User/{user_id}", update_payload)
+            logger.info("Updating user %s with fields: %s", user_id, update_payload.keys())
+            await self._call(self.client.put(f"/apirest.php/User/{user_id}", update_payload))
+            self.sync_user(user_id)
             
-            # Retornar usuário atualizado
-            updated_user = await self.get_user(user_id)
+            if expand:
+                updated_user = await self.get_user(user_id)
+            else:
+                updated_user = {**existing, **update_payload}
             
-            logger.info(f"User {user_id} updated successfully")
+            logger.info("User %s updated successfully", user_id)
             return updated_user
             
         except Exception as e:
-            logger.error(f"Failed to update user {user_id}: {e}")
+            self._raise_if_not_found(e, "User", user_id)
+            logger.error("Failed to update user %s: %s", user_id, e)
             raise GLPIError(500, f"Failed to update user: {str(e)}")
     
-    async def delete_user(self, user_id: int, purge: bool = False) -> bool:
+    async def delete_user(self, user_id: int, purge: bool = False, strict: bool = False) -> bool:
         """
         Deleta ou desativa um usuário.
         
         Args:
             user_id: ID do usuário
             purge: Se True, deleta permanentemente; se False, apenas desativa
+            strict: Se True, valida a existência do usuário antes da operação
         
         Returns:
             True se operação bem-sucedida
+        
+        Raises:
+            NotFoundError: Se o usuário não existir
         """
-        # Validar usuário existe
-        await self.get_user(user_id)
+        if strict:
+            await self.get_user(user_id)
         
         try:
             if purge:
-                logger.info(f"Purging user {user_id}")
-                await self.client.delete(f"/apirest.php/User/{user_id}")
+                logger.info("Purging user %s", user_id)
+                await self._call(self.client.delete(f"/apirest.php/User/{user_id}"))
             else:
-                logger.info(f"Deactivating user {user_id}")
-                await self.client.put(f"/apirest.php/User/{user_id}", {"is_active": 0})
+                logger.info("Deactivating user %s", user_id)
+                await self._call(self.client.put(f"/apirest.php/User/{user_id}", {"is_active": 0}))
+            self.sync_user(user_id)
             
-            logger.info(f"User {user_id} {'purged' if purge else 'deactivated'} successfully")
+            logger.info("User %s %s successfully", user_id, "purged" if purge else "deactivated")
             return True
             
         except Exception as e:
-            logger.error(f"Failed to {'purge' if purge else 'deactivate'} user {user_id}: {e}")
+            self._raise_if_not_found(e, "User", user_id)
+            logger.error("Failed to %s user %s: %s", "purge" if purge else "deactivate", user_id, e)
             raise GLPIError(500, f"Failed to delete user: {str(e)}")
     
     # ============= GRUPOS =============
     
+    @_cached("Group", "normal", paginated=True, stale_fallback=True)
     async def list_groups(
         self,
         entity_id: Optional[int] = None,
@@ -400,8 +730,10 @@ class AdminService:
         is_technical_group: Optional[bool] = None,
         limit: int = 250,
         offset: int = 0,
-        use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+        use_cache: bool = True,
+        prefetch_next: bool = True,
+        stale_ok: bool = True
+    ) -> Dict[str, Any]:
         """
         Lista grupos com filtros avançados.
         
@@ -412,70 +744,32 @@ class AdminService:
             limit: Limite de resultados
             offset: Offset para paginação
             use_cache: Usar cache
+            prefetch_next: Buscar a próxima página em segundo plano
+            stale_ok: Em falha do GLPI, devolver a última listagem em cache
         
         Returns:
-            Lista de grupos
+            Dict com "items" (grupos) e "pagination"
         """
-        # Construir filtros
-        filters = {}
-        
-        if entity_id:
-            filters["entities_id"] = entity_id
-        
-        if is_user_group is not None:
-            filters["is_user_group"] = int(is_user_group)
-        
-        if is_technical_group is not None:
-            filters["is_technician_group"] = int(is_technical_group)
-        
-        # Construir critérios de busca
-        criteria = []
-        
-        if filters:
-            for field, value in filters.items():
-                criteria.append({
-                    "field": field,
-                    "searchtype": "equals",
-                    "value": value
-                })
-        
-        params = {
-            "range": f"{offset}-{offset + limit - 1}",
-            "forcedisplay": [
-                "id", "name", "comment", "entities_id", "is_user_group",
-                "is_technician_group", "is_requester", "is_assign",
-                "is_notify", "is_itemgroup", "can_priority", "date_creation",
-                "date_mod", "users_id"
-            ]
-        }
+        criteria = self._build_criteria(self._GROUP_FILTER_SPEC, locals())
         
-        if criteria:
-            params["criteria"] = criteria
+        params = self._build_params(
+            offset,
+            limit,
+            forcedisplay=GROUP_FIELDS,
+            criteria=criteria
+        )
         
         try:
-            logger.info(f"Listing groups with filters: {filters}")
-            result = await self.client.get("/apirest.php/Group", params, use_cache)
-            
-            # API pode retornar lista diretamente ou dict com "data"
-            if isinstance(result, list):
-                groups = result
-            elif isinstance(result, dict) and "data" in result:
-                groups = result["data"]
-            else:
-                return []
+            logger.info("Listing groups with criteria: %s", criteria)
+            result = await self._call(self.client.get("/apirest.php/Group", params, use_cache))
             
-            # Adicionar metadados de paginação
-            if isinstance(result, dict) and "count" in result and result["count"] > limit:
-                groups.append({
-                    "pagination_hint": f"Found {result['count']} total groups. Use pagination to get more."
-                })
-            
-            return groups
+            return self._paginated(result, offset, limit)
                 
         except Exception as e:
-            logger.error(f"Failed to list groups: {e}")
+            logger.error("Failed to list groups: %s", e)
             raise GLPIError(500, f"Failed to list groups: {str(e)}")
     
+    @_cached("Group", "normal")
     async def get_group(self, group_id: int) -> Dict[str, Any]:
         """
         Obtém detalhes completos de um grupo.
@@ -487,32 +781,29 @@ class AdminService:
             Dados completos do grupo
         """
         try:
-            logger.info(f"Getting group {group_id}")
-            
-            group = await self.client.get_item(
-                "Group",
-                group_id,
-                forcedisplay=[
-                    "id", "name", "comment", "entities_id", "is_user_group",
-                    "is_technician_group", "is_requester", "is_assign",
-                    "is_notify", "is_itemgroup", "can_priority", "date_creation",
-                    "date_mod", "users_id"
-                ]
+            logger.info("Getting group %s", group_id)
+            
+            # Dados do grupo e membros em paralelo
+            group, members = await asyncio.gather(
+                self._call(self.client.get_item(
+                    "Group",
+                    group_id,
+                    forcedisplay=GROUP_FIELDS
+                )),
+                self._call(self.client.get_subitems("Group", group_id, "Group_User")),
+                return_exceptions=True
             )
+            if isinstance(group, Exception):
+                raise group
             
-            # Obter membros do grupo
-            try:
-                members = await self.client.get_subitems("Group", group_id, "Group_User")
-                group["members"] = members
-            except Exception:
-                group["members"] = []
+            group["members"] = _subitems_or_empty(members)
             
             return group
             
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get group {group_id}: {e}")
+            logger.error("Failed to get group %s: %s", group_id, e)
             raise GLPIError(500, f"Failed to get group: {str(e)}")
     
     async def create_group(
@@ -524,7 +815,8 @@ class AdminService:
         is_technical_group: bool = False,
         is_requester: bool = True,
         is_assign: bool = True,
-        is_notify: bool = True
+        is_notify: bool = True,
+        expand: bool = False
     ) -> Dict[str, Any]:
         """
         Cria um novo grupo.
@@ -538,107 +830,138 @@ class AdminService:
             is_requester: Pode ser solicitante
             is_assign: Pode ser responsável
             is_notify: Recebe notificações
+            expand: Se True, relê o grupo do GLPI após criar
         
         Returns:
-            Grupo criado
+            Grupo criado (payload enviado + ID; completo se expand=True)
         """
-        if not name or len(name.strip()) < 2:
-            raise ValidationError("Group name must be at least 2 characters", "name")
+        name = _clean_name(name, "Group name must be at least 2 characters")
         
         payload = {
-            "name": name.strip(),
+            "name": name,
             "entities_id": entity_id or 0,
             "is_user_group": int(is_user_group),
             "is_technician_group": int(is_technical_group),
             "is_requester": int(is_requester),
             "is_assign": int(is_assign),
-            "is_notify": int(is_notify)
+            "is_notify": int(is_notify),
+            **_present_fields((("comment", comment),))
         }
         
-        if comment:
-            payload["comment"] = comment.strip()
-        
         try:
-            logger.info(f"Creating group: {name}")
-            result = await self.client.post("/apirest.php/Group", payload)
+            logger.info("Creating group: %s", name)
+            result = await self._call(self.client.post("/apirest.php/Group", payload))
             
             if "id" not in result:
                 raise GLPIError(500, "Failed to create group - no ID returned")
+            self.sync_group(result["id"])
             
-            created_group = await self.get_group(result["id"])
+            if expand:
+                created_group = await self.get_group(result["id"])
+            else:
+                created_group = {**payload, "id": result["id"], "members": []}
             
-            logger.info(f"Group created successfully: ID {result['id']}")
+            logger.info("Group created successfully: ID %s", result["id"])
             return created_group
             
         except Exception as e:
-            logger.error(f"Failed to create group: {e}")
+            logger.error("Failed to create group: %s", e)
             raise GLPIError(500, f"Failed to create group: {str(e)}")
     
-    async def update_group(self, group_id: int, **kwargs) -> Dict[str, Any]:
+    async def update_group(
+        self,
+        group_id: int,
+        expand: bool = False,
+        strict: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
         """
         Atualiza um grupo existente.
         
         Args:
             group_id: ID do grupo
+            expand: Se True, relê o grupo do GLPI após atualizar
+            strict: Se True, valida a existência do grupo antes do PUT
             **kwargs: Campos para atualizar
         
         Returns:
-            Grupo atualizado
+            Grupo atualizado (dados conhecidos mesclados com os campos enviados)
+        
+        Raises:
+            NotFoundError: Se o grupo não existir
         """
-        await self.get_group(group_id)
+        if strict:
+            existing = await self.get_group(group_id)
+        else:
+            existing = self._peek_cached("Group", "get_group", group_id) or {"id": group_id}
         
-        protected_fields = ["id", "date_creation", "date_mod"]
-        update_payload = {k: v for k, v in kwargs.items() if k not in protected_fields}
+        update_payload = {k: v for k, v in kwargs.items() if k not in PROTECTED_FIELDS}
         
         if not update_payload:
             raise ValidationError("No valid fields to update", "payload")
         
         try:
-            logger.info(f"Updating group {group_id} with fields: {list(update_payload.keys())}")
-            await self.client.put(f"/apirest.php/Group/{group_id}", update_payload)
+            logger.info("Updating group %s with fields: %s", group_id, update_payload.keys())
+            await self._call(self.client.put(f"/apirest.php/Group/{group_id}", update_payload))
+            self.sync_group(group_id)
             
-            updated_group = await self.get_group(group_id)
+            if expand:
+                updated_group = await self.get_group(group_id)
+            else:
+                updated_group = {**existing, **update_payload}
             
-            logger.info(f"Group {group_id} updated successfully")
+            logger.info("Group %s updated successfully", group_id)
             return updated_group
             
         except Exception as e:
-            logger.error(f"Failed to update group {group_id}: {e}")
+            self._raise_if_not_found(e, "Group", group_id)
+            logger.error("Failed to update group %s: %s", group_id, e)
             raise GLPIError(500, f"Failed to update group: {str(e)}")
     
-    async def delete_group(self, group_id: int) -> bool:
+    async def delete_group(self, group_id: int, strict: bool = False) -> bool:
         """
         Deleta um grupo.
         
         Args:
             group_id: ID do grupo
+            strict: Se True, valida a existência do grupo antes do DELETE
         
         Returns:
             True se deletado com sucesso
+        
+        Raises:
+            NotFoundError: Se o grupo não existir
         """
-        await self.get_group(group_id)
+        if strict:
+            await self.get_group(group_id)
         
         try:
-            logger.info(f"Deleting group {group_id}")
-            await self.client.delete(f"/apirest.php/Group/{group_id}")
+            logger.info("Deleting group %s", group_id)
+            await self._call(self.client.delete(f"/apirest.php/Group/{group_id}"))
+            self.sync_group(group_id)
+            self.invalidate("User")  # grupos aparecem em get_user
             
-            logger.info(f"Group {group_id} deleted successfully")
+            logger.info("Group %s deleted successfully", group_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to delete group {group_id}: {e}")
+            self._raise_if_not_found(e, "Group", group_id)
+            logger.error("Failed to delete group %s: %s", group_id, e)
             raise GLPIError(500, f"Failed to delete group: {str(e)}")
     
     # ============= ENTIDADES =============
     
+    @_cached("Entity", "long", paginated=True, stale_fallback=True)
     async def list_entities(
         self,
         parent_entity_id: Optional[int] = None,
         is_recursive: Optional[bool] = None,
         limit: int = 250,
         offset: int = 0,
-        use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+        use_cache: bool = True,
+        prefetch_next: bool = True,
+        stale_ok: bool = True
+    ) -> Dict[str, Any]:
         """
         Lista entidades com filtros avançados.
         
@@ -648,66 +971,32 @@ class AdminService:
             limit: Limite de resultados
             offset: Offset para paginação
             use_cache: Usar cache
+            prefetch_next: Buscar a próxima página em segundo plano
+            stale_ok: Em falha do GLPI, devolver a última listagem em cache
         
         Returns:
-            Lista de entidades
+            Dict com "items" (entidades) e "pagination"
         """
-        filters = {}
-        
-        if parent_entity_id:
-            filters["entities_id"] = parent_entity_id
-        
-        if is_recursive is not None:
-            filters["is_recursive"] = int(is_recursive)
-        
-        criteria = []
-        
-        if filters:
-            for field, value in filters.items():
-                criteria.append({
-                    "field": field,
-                    "searchtype": "equals",
-                    "value": value
-                })
-        
-        params = {
-            "range": f"{offset}-{offset + limit - 1}",
-            "forcedisplay": [
-                "id", "name", "comment", "entities_id", "level",
-                "completename", "is_recursive", "address", "postcode",
-                "town", "state", "country", "website", "phonenumber",
-                "fax", "email", "notification", "admin_email",
-                "admin_email_name", "date_creation", "date_mod"
-            ]
-        }
+        criteria = self._build_criteria(self._ENTITY_FILTER_SPEC, locals())
         
-        if criteria:
-            params["criteria"] = criteria
+        params = self._build_params(
+            offset,
+            limit,
+            forcedisplay=ENTITY_FIELDS,
+            criteria=criteria
+        )
         
         try:
-            logger.info(f"Listing entities with filters: {filters}")
-            result = await self.client.get("/apirest.php/Entity", params, use_cache)
-            
-            # API pode retornar lista diretamente ou dict com "data"
-            if isinstance(result, list):
-                entities = result
-            elif isinstance(result, dict) and "data" in result:
-                entities = result["data"]
-            else:
-                return []
+            logger.info("Listing entities with criteria: %s", criteria)
+            result = await self._call(self.client.get("/apirest.php/Entity", params, use_cache))
             
-            # Adicionar metadados de paginação
-            if isinstance(result, dict) and "count" in result and result["count"] > limit:
-                entities.append({
-                    "pagination_hint": f"Found {result['count']} total entities. Use pagination to get more."
-                })
-            
-            return entities
+            return self._paginated(result, offset, limit)
                 
         except Exception as e:
-            logger.error(f"Failed to list entities: {e}")
+            logger.error("Failed to list entities: %s", e)
             raise GLPIError(500, f"Failed to list entities: {str(e)}")
     
+    @_cached("Entity", "long")
     async def get_entity(self, entity_id: int) -> Dict[str, Any]:
         """
         Obtém detalhes completos de uma entidade.
@@ -719,38 +1008,35 @@ class AdminService:
             Dados completos da entidade
         """
         try:
-            logger.info(f"Getting entity {entity_id}")
+            logger.info("Getting entity %s", entity_id)
             
-            entity = await self.client.get_item(
+            entity = await self._call(self.client.get_item(
                 "Entity",
                 entity_id,
-                forcedisplay=[
-                    "id", "name", "comment", "entities_id", "level",
-                    "completename", "is_recursive", "address", "postcode",
-                    "town", "state", "country", "website", "phonenumber",
-                    "fax", "email", "notification", "admin_email",
-                    "admin_email_name", "date_creation", "date_mod"
-                ]
-            )
+                forcedisplay=ENTITY_FIELDS
+            ))
             
             return entity
             
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get entity {entity_id}: {e}")
+            logger.error("Failed to get entity %s: %s", entity_id, e)
             raise GLPIError(500, f"Failed to get entity: {str(e)}")
     
     # ============= LOCALIZAÇÕES =============
     
+    @_cached("Location", "long", paginated=True, stale_fallback=True)
     async def list_locations(
         self,
         parent_location_id: Optional[int] = None,
         entity_id: Optional[int] = None,
         limit: int = 250,
         offset: int = 0,
-        use_cache: bool = True
-    ) -> List[Dict[str, Any]]:
+        use_cache: bool = True,
+        prefetch_next: bool = True,
+        stale_ok: bool = True
+    ) -> Dict[str, Any]:
         """
         Lista localizações com filtros avançados.
         
@@ -760,66 +1046,32 @@ class AdminService:
             limit: Limite de resultados
             offset: Offset para paginação
             use_cache: Usar cache
+            prefetch_next: Buscar a próxima página em segundo plano
+            stale_ok: Em falha do GLPI, devolver a última listagem em cache
         
         Returns:
-            Lista de localizações
+            Dict com "items" (localizações) e "pagination"
         """
-        filters = {}
-        
-        if parent_location_id:
-            filters["locations_id"] = parent_location_id
-        
-        if entity_id:
-            filters["entities_id"] = entity_id
-        
-        criteria = []
-        
-        if filters:
-            for field, value in filters.items():
-                criteria.append({
-                    "field": field,
-                    "searchtype": "equals",
-                    "value": value
-                })
-        
-        params = {
-            "range": f"{offset}-{offset + limit - 1}",
-            "forcedisplay": [
-                "id", "name", "comment", "locations_id", "level",
-                "completename", "building", "room", "place",
-                "town", "postcode", "address", "latitude",
-                "longitude", "altitude", "entities_id",
-                "date_creation", "date_mod"
-            ]
-        }
+        criteria = self._build_criteria(self._LOCATION_FILTER_SPEC, locals())
         
-        if criteria:
-            params["criteria"] = criteria
+        params = self._build_params(
+            offset,
+            limit,
+            forcedisplay=LOCATION_FIELDS,
+            criteria=criteria
+        )
         
         try:
-            logger.info(f"Listing locations with filters: {filters}")
-            result = await self.client.get("/apirest.php/Location", params, use_cache)
-            
-            # API pode retornar lista diretamente ou dict com "data"
-            if isinstance(result, list):
-                locations = result
-            elif isinstance(result, dict) and "data" in result:
-                locations = result["data"]
-            else:
-                return []
+            logger.info("Listing locations with criteria: %s", criteria)
+            result = await self._call(self.client.get("/apirest.php/Location", params, use_cache))
             
-            # Adicionar metadados de paginação
-            if isinstance(result, dict) and "count" in result and result["count"] > limit:
-                locations.append({
-                    "pagination_hint": f"Found {result['count']} total locations. Use pagination to get more."
-                })
-            
-            return locations
+            return self._paginated(result, offset, limit)
                 
         except Exception as e:
-            logger.error(f"Failed to list locations: {e}")
+            logger.error("Failed to list locations: %s", e)
             raise GLPIError(500, f"Failed to list locations: {str(e)}")
     
+    @_cached("Location", "long")
     async def get_location(self, location_id: int) -> Dict[str, Any]:
         """
         Obtém detalhes completos de uma localização.
@@ -831,26 +1083,20 @@ class AdminService:
             Dados completos da localização
         """
         try:
-            logger.info(f"Getting location {location_id}")
+            logger.info("Getting location %s", location_id)
             
-            location = await self.client.get_item(
+            location = await self._call(self.client.get_item(
                 "Location",
                 location_id,
-                forcedisplay=[
-                    "id", "name", "comment", "locations_id", "level",
-                    "completename", "building", "room", "place",
-                    "town", "postcode", "address", "latitude",
-                    "longitude", "altitude", "entities_id",
-                    "date_creation", "date_mod"
-                ]
-            )
+                forcedisplay=LOCATION_FIELDS
+            ))
             
             return location
             
         except NotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get location {location_id}: {e}")
+            logger.error("Failed to get location %s: %s", location_id, e)
             raise GLPIError(500, f"Failed to get location: {str(e)}")
     
     async def create_location(
@@ -880,48 +1126,171 @@ class AdminService:
         Returns:
             Localização criada
         """
-        if not name or len(name.strip()) < 2:
-            raise ValidationError("Location name must be at least 2 characters", "name")
+        name = _clean_name(name, "Location name must be at least 2 characters")
         
         payload = {
-            "name": name.strip(),
-            "entities_id": entity_id or 0
+            "name": name,
+            "entities_id": entity_id or 0,
+            **_present_fields((
+                ("locations_id", parent_location_id),
+                ("building", building),
+                ("room", room),
+                ("town", town),
+                ("address", address),
+                ("comment", comment),
+            ))
         }
         
-        if parent_location_id:
-            payload["locations_id"] = parent_location_id
-        
-        if building:
-            payload["building"] = building.strip()
-        
-        if room:
-            payload["room"] = room.strip()
-        
-        if town:
-            payload["town"] = town.strip()
-        
-        if address:
-            payload["address"] = address.strip()
-        
-        if comment:
-            payload["comment"] = comment.strip()
-        
         try:
-            logger.info(f"Creating location: {name}")
-            result = await self.client.post("/apirest.php/Location", payload)
+            logger.info("Creating location: %s", name)
+            result = await self._call(self.client.post("/apirest.php/Location", payload))
             
             if "id" not in result:
                 raise GLPIError(500, "Failed to create location - no ID returned")
+            self.invalidate("Location")
             
             created_location = await self.get_location(result["id"])
             
-            logger.info(f"Location created successfully: ID {result['id']}")
+            logger.info("Location created successfully: ID %s", result["id"])
             return created_location
             
         except Exception as e:
-            logger.error(f"Failed to create location: {e}")
+            logger.error("Failed to create location: %s", e)
             raise GLPIError(500, f"Failed to create location: {str(e)}")
     
+    # ============= OPERAÇÕES EM LOTE =============
+    
+    async def _run_bulk(
+        self,
+        operation: Callable[..., Any],
+        items: List[Any],
+        concurrency: int
+    ) -> List[Any]:
+        """
+        Executa uma operação por item com concorrência limitada.
+        
+        Falhas não interrompem o lote: o item vira {"error": ..., "input": item}.
+        O limite deve acompanhar o pool de conexões com o GLPI (MAX_CONNECTIONS);
+        valores muito acima dele só enfileiram requisições até o timeout.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def run_one(item: Any) -> Any:
+            async with semaphore:
+                try:
+                    if isinstance(item, dict):
+                        return await operation(**item)
+                    return await operation(item)
+                except Exception as e:
+                    return {"error": str(e), "input": item}
+        
+        return await asyncio.gather(*(run_one(item) for item in items))
+    
+    async def bulk_create_users(self, items: List[Dict[str, Any]], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Cria vários usuários em paralelo.
+        
+        Args:
+            items: Argumentos de create_user para cada usuário
+            concurrency: Máximo de criações simultâneas
+        
+        Returns:
+            Resultado por item, na ordem de entrada (usuário ou {"error", "input"})
+        """
+        return await self._run_bulk(self.create_user, items, concurrency)
+    
+    async def bulk_delete_users(
+        self,
+        user_ids: List[int],
+        purge: bool = False,
+        concurrency: int = 16
+    ) -> List[Any]:
+        """
+        Deleta ou desativa vários usuários em paralelo.
+        
+        Args:
+            user_ids: IDs dos usuários
+            purge: Se True, deleta permanentemente; se False, apenas desativa
+            concurrency: Máximo de operações simultâneas
+        
+        Returns:
+            Resultado por item, na ordem de entrada (True ou {"error", "input"})
+        """
+        async def delete_one(user_id: int) -> bool:
+            return await self.delete_user(user_id, purge=purge)
+        
+        return await self._run_bulk(delete_one, user_ids, concurrency)
+    
+    async def bulk_create_groups(self, items: List[Dict[str, Any]], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Cria vários grupos em paralelo.
+        
+        Args:
+            items: Argumentos de create_group para cada grupo
+            concurrency: Máximo de criações simultâneas
+        
+        Returns:
+            Resultado por item, na ordem de entrada (grupo ou {"error", "input"})
+        """
+        return await self._run_bulk(self.create_group, items, concurrency)
+    
+    async def bulk_create_locations(self, items: List[Dict[str, Any]], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """
+        Cria várias localizações em paralelo.
+        
+        Args:
+            items: Argumentos de create_location para cada localização
+            concurrency: Máximo de criações simultâneas
+        
+        Returns:
+            Resultado por item, na ordem de entrada (localização ou {"error", "input"})
+        """
+        return await self._run_bulk(self.create_location, items, concurrency)
+    
+    # ============= VISÃO CONSOLIDADA =============
+    
+    async def list_admin_bundle(
+        self,
+        entity_id: Optional[int] = None,
+        limit: int = 250,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Lista usuários, grupos, entidades e localizações em paralelo.
+        
+        Args:
+            entity_id: Filtrar usuários, grupos e localizações por entidade
+            limit: Limite de resultados por seção
+            use_cache: Usar cache
+        
+        Returns:
+            Dict com as seções users, groups, entities e locations (mesmo
+            formato dos métodos list_*); seções que falharem ficam vazias e
+            o erro é reportado em "errors"
+        """
+        sections = ("users", "groups", "entities", "locations")
+        results = await asyncio.gather(
+            self.list_users(entity_id=entity_id, limit=limit, use_cache=use_cache, prefetch_next=False),
+            self.list_groups(entity_id=entity_id, limit=limit, use_cache=use_cache, prefetch_next=False),
+            self.list_entities(limit=limit, use_cache=use_cache, prefetch_next=False),
+            self.list_locations(entity_id=entity_id, limit=limit, use_cache=use_cache, prefetch_next=False),
+            return_exceptions=True
+        )
+        
+        bundle: Dict[str, Any] = {}
+        errors: Dict[str, str] = {}
+        for section, result in zip(sections, results):
+            if isinstance(result, Exception):
+                logger.warning("Admin bundle section %s failed: %s", section, result)
+                bundle[section] = self._paginated([], 0, limit)
+                errors[section] = str(result)
+            else:
+                bundle[section] = result
+        
+        if errors:
+            bundle["errors"] = errors
+        return bundle
+    
     async def get_admin_stats(self, entity_id: Optional[int] = None) -> Dict[str, Any]:
         """
         Obtém estatísticas administrativas.
@@ -930,44 +1299,44 @@ class AdminService:
             entity_id: Filtrar por entidade
         
         Returns:
-            Estatísticas detalhadas
+            Estatísticas detalhadas (seções que falharem são reportadas em "errors")
         """
-        try:
-            # Buscar dados em paralelo para performance
-            users = await self.list_users(entity_id=entity_id, limit=1000, use_cache=False)
-            groups = await self.list_groups(entity_id=entity_id, limit=1000, use_cache=False)
-            entities = await self.list_entities(limit=1000, use_cache=False)
-            locations = await self.list_locations(entity_id=entity_id, limit=1000, use_cache=False)
-            
-            stats = {
-                "total_users": len(users) if isinstance(users, list) else 0,
-                "total_groups": len(groups) if isinstance(groups, list) else 0,
-                "total_entities": len(entities) if isinstance(entities, list) else 0,
-                "total_locations": len(locations) if isinstance(locations, list) else 0,
-                "filters": {
-                    "entity_id": entity_id
-                }
+        # Buscar dados em paralelo para performance; seção que falhar conta como vazia
+        bundle = await self.list_admin_bundle(entity_id=entity_id, limit=1000, use_cache=False)
+        
+        users, groups = bundle["users"]["items"], bundle["groups"]["items"]
+        stats = {
+            "total_users": len(users),
+            "total_groups": len(groups),
+            "total_entities": len(bundle["entities"]["items"]),
+            "total_locations": len(bundle["locations"]["items"]),
+            "filters": {
+                "entity_id": entity_id
             }
-            
-            # Estatísticas de usuários
-            if isinstance(users, list):
-                active_users = sum(1 for u in users if u.get("is_active"))
-                stats["active_users"] = active_users
-                stats["inactive_users"] = stats["total_users"] - active_users
-            
-            # Estatísticas de grupos
-            if isinstance(groups, list):
-                user_groups = sum(1 for g in groups if g.get("is_user_group"))
-                tech_groups = sum(1 for g in groups if g.get("is_technician_group"))
-                stats["user_groups"] = user_groups
-                stats["technical_groups"] = tech_groups
-            
-            logger.info(f"Generated admin stats for entity {entity_id or 'all'}")
-            return stats
-            
-        except Exception as e:
-            logger.error(f"Failed to get admin stats: {e}")
-            raise GLPIError(500, f"Failed to get admin stats: {str(e)}")
+        }
+        if "errors" in bundle:
+            stats["errors"] = bundle["errors"]
+        
+        # Estatísticas de usuários
+        active_users = 0
+        for user in users:
+            if user.get("is_active"):
+                active_users += 1
+        stats["active_users"] = active_users
+        stats["inactive_users"] = stats["total_users"] - active_users
+        
+        # Estatísticas de grupos (uma passada para os dois tipos)
+        user_groups = tech_groups = 0
+        for group in groups:
+            if group.get("is_user_group"):
+                user_groups += 1
+            if group.get("is_technician_group"):
+                tech_groups += 1
+        stats["user_groups"] = user_groups
+        stats["technical_groups"] = tech_groups
+        
+        logger.info("Generated admin stats for entity %s", entity_id or "all")
+        return stats
 
 
 # Instância global do serviço de administração
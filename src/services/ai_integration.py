@@ -3,64 +3,142 @@ AI Integration Service - Conforme auditoria GAP-CRIT-01
 Implementa AIJobStore com TTL e interfaces para integração IA.
 """
 
+import asyncio
+import secrets
 import time
-import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from src.logger import logger
 
 
+@dataclass(slots=True)
+class AIJob:
+    """Job de análise IA de um ticket."""
+
+    ticket_id: int
+    status: str
+    created_at: float
+    result: Optional[dict] = None
+    completed_at: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte para o dicionário retornado às tools (completed_at só se concluído)."""
+        data = {
+            "ticket_id": self.ticket_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "result": self.result
+        }
+        if self.completed_at is not None:
+            data["completed_at"] = self.completed_at
+        return data
+
+
+class _Entry:
+    """Entrada do AIJobStore: job e seu instante de expiração (time.monotonic)."""
+
+    __slots__ = ("expires_at", "job")
+
+    def __init__(self, expires_at: float, job: AIJob):
+        self.expires_at = expires_at
+        self.job = job
+
+
 class AIJobStore:
     """
     Armazena jobs de análise IA com TTL.
     Conforme auditoria GAP-CRIT-01: AIJobStore com TTL.
+    
+    Os métodos são síncronos e não cedem o controle ao event loop, então
+    cada operação é atômica entre corrotinas sem precisar de lock. O store
+    não deve ser acessado a partir de outras threads.
     """
     
-    def __init__(self, ttl_seconds: int = 3600):
-        """Inicializa o job store com TTL configurável."""
-        self._jobs: Dict[str, tuple] = {}
+    def __init__(self, ttl_seconds: int = 3600, maxsize: int = 10000):
+        """Inicializa o job store com TTL e tamanho máximo configuráveis."""
+        # job_id -> _Entry. Com TTL único, a ordem de gravação (set move o job
+        # para o fim) é a ordem de expiração. expires_at usa time.monotonic(),
+        # imune a ajustes do relógio; created_at/completed_at do job seguem em
+        # time.time() para exibição.
+        self._jobs: "OrderedDict[str, _Entry]" = OrderedDict()
         self._ttl = ttl_seconds
-        logger.info(f"AIJobStore initialized with TTL={ttl_seconds}s")
+        self._maxsize = maxsize
+        logger.info(f"AIJobStore initialized with TTL={ttl_seconds}s, maxsize={maxsize}")
+    
+    @property
+    def ttl(self) -> float:
+        """Validade de cada job em segundos."""
+        return self._ttl
+    
+    def _evict_oldest_expired(self, now: float) -> None:
+        """Remove o job mais antigo se já expirou (limpeza amortizada em get/set)."""
+        if self._jobs:
+            job_id, entry = next(iter(self._jobs.items()))
+            if entry.expires_at <= now:
+                del self._jobs[job_id]
     
-    def set(self, job_id: str, data: dict):
+    def set(self, job_id: str, data: AIJob):
         """Armazena um job com timestamp."""
-        self._jobs[job_id] = (time.time(), data)
-        logger.debug(f"Job stored: {job_id}")
+        now = time.monotonic()
+        self._evict_oldest_expired(now)
+        if job_id not in self._jobs and len(self._jobs) >= self._maxsize:
+            # Cheio: descarta o job mais antigo (o próximo a expirar)
+            self._jobs.popitem(last=False)
+        self._jobs[job_id] = _Entry(now + self._ttl, data)
+        self._jobs.move_to_end(job_id)
+        logger.debug("Job stored: %s", job_id)
     
-    def get(self, job_id: str) -> Optional[dict]:
+    def get(self, job_id: str) -> Optional[AIJob]:
         """Obtém um job se ainda válido (não expirado)."""
-        if job_id not in self._jobs:
+        now = time.monotonic()
+        self._evict_oldest_expired(now)
+        entry = self._jobs.get(job_id)
+        if entry is None:
             return None
         
-        ts, data = self._jobs[job_id]
-        if time.time() - ts > self._ttl:
+        if entry.expires_at <= now:
             # Job expirado, remover
-            self._jobs.pop(job_id, None)
-            logger.debug(f"Job expired and removed: {job_id}")
+            del self._jobs[job_id]
+            logger.debug("Job expired and removed: %s", job_id)
             return None
         
-        return data
+        return entry.job
+    
+    def update_data(self, job_id: str, patch: dict) -> bool:
+        """Atualiza campos de um job válido sem renovar o TTL."""
+        job = self.get(job_id)
+        if job is None:
+            return False
+        for field, value in patch.items():
+            setattr(job, field, value)
+        return True
     
     def delete(self, job_id: str) -> bool:
         """Remove um job."""
-        if job_id in self._jobs:
-            del self._jobs[job_id]
-            logger.debug(f"Job deleted: {job_id}")
-            return True
-        return False
+        if self._jobs.pop(job_id, None) is None:
+            return False
+        logger.debug("Job deleted: %s", job_id)
+        return True
     
     def cleanup_expired(self) -> int:
-        """Remove todos os jobs expirados."""
-        now = time.time()
-        expired = [
-            job_id for job_id, (ts, _) in self._jobs.items()
-            if now - ts > self._ttl
-        ]
-        for job_id in expired:
-            del self._jobs[job_id]
+        """Remove todos os jobs expirados (apenas os do início da fila)."""
+        now = time.monotonic()
+        if self._jobs and next(reversed(self._jobs.values())).expires_at <= now:
+            # Até o job mais recente expirou (fim de rajada): descarta tudo de uma vez
+            count = len(self._jobs)
+            self._jobs.clear()
+        else:
+            count = 0
+        while self._jobs:
+            if next(iter(self._jobs.values())).expires_at > now:
+                break
+            self._jobs.popitem(last=False)
+            count += 1
         
-        if expired:
-            logger.info(f"Cleaned up {len(expired)} expired jobs")
-        return len(expired)
+        if count:
+            logger.info(f"Cleaned up {count} expired jobs")
+        return count
 
 
 class AIIntegrationService:
@@ -73,52 +151,64 @@ class AIIntegrationService:
         """Inicializa o serviço de integração IA."""
         self.job_store = AIJobStore(ttl_seconds=3600)
         self._agents_configured = False
+        # Limpeza periódica; criada no primeiro trigger (exige loop em execução)
+        self._cleanup_task: Optional[asyncio.Task] = None
         logger.info("AIIntegrationService initialized")
     
+    def _ensure_cleanup_task(self):
+        """Inicia a limpeza periódica do job store, se ainda não estiver ativa."""
+        if self._cleanup_task is None or self._cleanup_task.done():
+            self._cleanup_task = asyncio.create_task(self._cleanup_loop())
+    
+    async def _cleanup_loop(self):
+        """Remove jobs expirados a cada 1/4 do TTL."""
+        interval = self.job_store.ttl / 4
+        while True:
+            await asyncio.sleep(interval)
+            self.job_store.cleanup_expired()
+    
+    async def close(self):
+        """Encerra a limpeza periódica."""
+        if self._cleanup_task is not None:
+            self._cleanup_task.cancel()
+            try:
+                await self._cleanup_task
+            except asyncio.CancelledError:
+                pass
+            self._cleanup_task = None
+    
     async def trigger_analysis(self, ticket_id: int) -> str:
         """
         Dispara análise IA para um ticket.
         Retorna job_id para consulta posterior.
         """
-        job_id = f"ai_job_{uuid.uuid4().hex[:12]}"
+        self._ensure_cleanup_task()
+        job_id = f"ai_job_{secrets.token_hex(6)}"
         
-        # Armazenar job com status inicial
-        self.job_store.set(job_id, {
-            "ticket_id": ticket_id,
-            "status": "queued",
-            "created_at": time.time(),
-            "result": None
-        })
+        # Armazenar job com status inicial (sem agentes configurados, marcar como tal)
+        status = "queued" if self._agents_configured else "no_agents_configured"
+        self.job_store.set(job_id, AIJob(ticket_id=ticket_id, status=status, created_at=time.time()))
         
         logger.info(f"AI analysis triggered for ticket {ticket_id}: {job_id}")
         
-        # Se não há agentes configurados, marcar como tal
-        if not self._agents_configured:
-            self.job_store.set(job_id, {
-                "ticket_id": ticket_id,
-                "status": "no_agents_configured",
-                "created_at": time.time(),
-                "result": None
-            })
-        
         return job_id
     
     async def get_analysis_result(self, job_id: str) -> Optional[dict]:
         """Obtém resultado de uma análise IA."""
-        return self.job_store.get(job_id)
+        job = self.job_store.get(job_id)
+        return job.to_dict() if job is not None else None
     
     async def publish_ai_response(self, job_id: str, response: dict) -> bool:
         """Publica resposta de análise IA."""
-        job = self.job_store.get(job_id)
-        if not job:
+        published = self.job_store.update_data(job_id, {
+            "status": "completed",
+            "result": response,
+            "completed_at": time.time()
+        })
+        if not published:
             logger.warning(f"Job not found for publishing: {job_id}")
             return False
         
-        job["status"] = "completed"
-        job["result"] = response
-        job["completed_at"] = time.time()
-        self.job_store.set(job_id, job)
-        
         logger.info(f"AI response published for job: {job_id}")
         return True
     
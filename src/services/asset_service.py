@@ -4,10 +4,13 @@ Migrado e expandido de glpi_service.py existente
 Implementa operações CRUD de assets + reservas + validação
 """
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Hashable, Tuple
+from datetime import datetime
+from collections import Counter, OrderedDict
 import asyncio
+import time
 
+from src.config import settings
 from src.services.glpi_client import glpi_client
 from src.logger import logger
 from src.models.exceptions import (
@@ -17,6 +20,248 @@ from src.models.exceptions import (
 )
 
 
+# Tipos de assets suportados pelo GLPI (frozenset: validação O(1) por chamada)
+ASSET_TYPES: frozenset = frozenset((
+    "Computer", "Monitor", "Printer", "NetworkEquipment",
+    "Peripheral", "Software", "Phone", "PassiveDCEquipment", "Rack",
+    "Enclosure", "PDU", "Server", "Storage", "Appliance", "Cable",
+    "Plug", "Line", "Certificate", "Database", "Domain", "Entity",
+    "Group", "Location", "Profile", "User", "Ticket", "Problem",
+    "Change", "Project", "ProjectTask", "Cost", "Budget", "Supplier",
+    "Contact", "Contract", "Document", "KnowbaseItem",
+    "KnowbaseCategory", "Reminder", "RSSFeed", "Tool", "Cluster",
+    "CartridgeItem", "ConsumableItem", "Link", "SoftwareLicense",
+    "SoftwareVersion", "OperatingSystem", "VirtualMachine", "Rule",
+    "ImportExternal", "AuthLDAP", "AuthMail", "SLA", "OLA",
+    "LevelAgreement", "LevelAgreementLevel", "ITILCategory",
+    "ITILFollowup", "ITILSolution", "ITILTask", "ITILTaskCategory",
+    "ITILActor", "Calendar", "Holiday", "CalendarSegment",
+    "CalendarHoliday", "Notification", "NotificationTemplate",
+    "NotificationEvent", "QueuedNotification", "CronTask",
+    "CronTaskLog", "Plugin", "Fieldblacklist", "Fieldunicity",
+    "SsoVariable", "Lockedfield", "Device", "DeviceMemory",
+    "DeviceProcessor", "DeviceHardDrive", "DeviceNetworkCard",
+    "DeviceDrive", "DeviceGraphicCard", "DeviceSoundCard",
+    "DeviceMotherboard", "DeviceControl", "DeviceCase",
+    "DevicePowerSupply", "DevicePci", "DeviceFirmware",
+    "DeviceSimcard", "DeviceSimcardType", "DeviceBattery",
+    "DeviceCamera", "DeviceSpeaker", "DeviceHeadphone",
+    "DeviceMicrophone", "DeviceRemote", "DeviceKeyboard",
+    "DeviceMouse", "DeviceJoypad", "DeviceGamepad", "DeviceOther",
+    "DeviceGeneric", "DeviceSpecific", "DeviceVirtual",
+    "DevicePhysical", "DeviceLogical", "DeviceInternal",
+    "DeviceExternal", "DeviceEmbedded", "DeviceRemovable",
+    "DeviceFixed", "DeviceHotpluggable", "DeviceNonHotpluggable",
+    "DeviceWired", "DeviceWireless", "DeviceBluetooth", "DeviceWifi",
+    "DeviceCellular", "DeviceSatellite", "DeviceMicrowave",
+    "DeviceRadio", "DeviceInfrared", "DeviceLaser",
+    "DeviceUltrasonic", "DeviceMagnetic", "DeviceOptical",
+    "DeviceElectrical", "DeviceMechanical", "DeviceChemical",
+    "DeviceBiological", "DeviceNuclear"
+))
+# Amostra exibida nas mensagens de validação
+ASSET_TYPES_SAMPLE = (
+    "Computer", "Monitor", "Printer", "NetworkEquipment", "Peripheral",
+    "Software", "Phone", "PassiveDCEquipment", "Rack", "Enclosure"
+)
+
+
+# Aspectos do enriquecimento de computadores (list_assets enrich_fields)
+ENRICH_FIELDS: frozenset = frozenset(("user", "anydesk", "cpu", "memory"))
+
+# Tradução Search API -> nomes de campo: (ID numérico, nome alternativo, saída)
+SEARCH_FIELD_MAP: tuple[tuple[str, str, str], ...] = (
+    ("2", "id", "id"),
+    ("1", "name", "name"),
+    ("5", "serial", "serial"),
+    ("6", "otherserial", "otherserial"),
+    ("31", "states_id", "states_id"),
+    ("3", "locations_id", "locations_id"),
+    ("80", "entities_id", "entities_id"),
+    ("70", "users_id", "users_id"),
+    ("71", "groups_id", "groups_id"),
+    ("23", "manufacturers_id", "manufacturers_id"),
+    ("40", "models_id", "models_id"),
+    ("19", "date_mod", "date_mod"),
+    ("16", "comment", "comment"),
+    ("4", "types_id", "types_id"),
+)
+
+
+# Campos a exibir na Search API: os traduzidos por SEARCH_FIELD_MAP
+SEARCH_FORCEDISPLAY: tuple[int, ...] = tuple(int(num) for num, _, _ in SEARCH_FIELD_MAP)
+
+# Campos agregados por get_asset_stats: (ID na Search API, chave da estatística)
+_STATS_FIELDS = (("31", "by_status"), ("3", "by_location"), ("23", "by_manufacturer"))
+_STATS_FORCEDISPLAY = (2,) + tuple(int(field) for field, _ in _STATS_FIELDS)
+
+# Filtros de list_assets na Search API: (argumento, campo, searchtype)
+# Referência campos: https://glpi-user-documentation.readthedocs.io/
+FILTER_SPECS: tuple[tuple[str, int, str], ...] = (
+    ("entity_id", 80, "under"),  # "under" busca na entidade E todas as sub-entidades (filhos)
+    ("location_id", 3, "equals"),
+    ("manufacturer_id", 23, "equals"),
+    ("model_id", 40, "equals"),
+    ("status", 31, "equals"),
+    ("user_id", 70, "equals"),
+)
+
+
+# Tradução usada por search_assets (inclui contact; states_id sai como "status")
+SMART_SEARCH_FIELD_MAP: tuple[tuple[str, str, str], ...] = (
+    ("2", "id", "id"),
+    ("1", "name", "name"),
+    ("5", "serial", "serial"),
+    ("6", "otherserial", "otherserial"),
+    ("7", "contact", "contact"),  # Nome Alternativo do Usuário
+    ("8", "contact_num", "contact_num"),
+    ("31", "states_id", "status"),
+    ("3", "locations_id", "locations_id"),
+    ("23", "manufacturers_id", "manufacturers_id"),
+    ("40", "models_id", "models_id"),
+    ("80", "entities_id", "entities_id"),
+    ("70", "users_id", "users_id"),
+    ("71", "groups_id", "groups_id"),
+    ("19", "date_mod", "date_mod"),
+    ("16", "comment", "comment"),
+    ("4", "types_id", "types_id"),
+)
+
+
+def _normalize_search_row(
+    asset: Dict[str, Any],
+    item_type: str,
+    numeric: bool = True,
+    field_map: tuple[tuple[str, str, str], ...] = SEARCH_FIELD_MAP
+) -> Dict[str, Any]:
+    """
+    Normaliza uma linha numa única passada, omitindo campos None.
+
+    numeric indica a origem do lote (Search API = IDs numéricos, senão nomes),
+    definida uma vez por resultado: um único acesso ao dict por campo.
+    """
+    source = 0 if numeric else 1
+    normalized = {
+        field[2]: value
+        for field in field_map
+        if (value := asset.get(field[source])) is not None
+    }
+    normalized["asset_type"] = item_type
+    return normalized
+
+
+def _int_id(value: Any) -> Optional[int]:
+    """ID numérico (a Search API pode devolver IDs como texto); None se inválido."""
+    return int(value) if str(value).isdigit() else None
+
+
+def _index_by_id(result: Any, label: str) -> Dict[int, Dict[str, Any]]:
+    """Indexa por ID os itens de uma busca em lote (vazio se a busca falhou)."""
+    if isinstance(result, Exception):
+        logger.warning(f"Batch fetch of {label} failed: {result}")
+        return {}
+    return {
+        _int_id(item.get("id")): item
+        for item in result or []
+        if isinstance(item, dict) and _int_id(item.get("id")) is not None
+    }
+
+
+def _device_rows(details: Dict[str, Any], link_type: str) -> List[Dict[str, Any]]:
+    """Vínculos de dispositivo (ex: Item_DeviceMemory) de um item buscado com with_devices."""
+    rows = (details.get("_devices") or {}).get(link_type) or []
+    if isinstance(rows, dict):
+        rows = rows.values()
+    return [row for row in rows if isinstance(row, dict)]
+
+
+# Componentes de um Computer em get_asset: (chave na resposta, subitem GLPI)
+_COMPUTER_SUBITEMS = (
+    ("memory", "Item_DeviceMemory"),
+    ("processors", "Item_DeviceProcessor"),
+    ("disks", "Item_DeviceHardDrive"),
+    ("network_cards", "Item_DeviceNetworkCard"),
+    ("operating_system", "Item_OperatingSystem"),
+    ("software", "Item_SoftwareVersion"),
+    ("remote_management", "Item_RemoteManagement"),
+)
+
+# Campos que update_asset nunca envia ao GLPI
+_PROTECTED_FIELDS: frozenset = frozenset(("id", "asset_type", "date_creation", "date_mod"))
+
+# IDs por requisição getMultipleItems (cada item ocupa ~40 caracteres na URL)
+_BATCH_SIZE = 50
+
+# Resultado de _single_flight quando a leitura compartilhada foi cancelada
+_FETCH_CANCELLED = object()
+
+# Dados do usuário anexados a cada reserva
+_RESERVATION_USER_FIELDS = ("id", "name", "realname", "email")
+
+# Validade (s) dos usuários em cache: perfis e buscas do Smart Search
+_USER_CACHE_TTL = 60
+# Validade (s) das queries do Smart Search que não encontraram usuário
+_EMPTY_USER_QUERY_TTL = 120
+
+# Logins resolvidos mantidos por AssetService._resolve_username
+_USERNAME_CACHE_SIZE = 4096
+
+# Ferramentas de acesso remoto, em ordem de prioridade para anydesk_id
+_REMOTE_PRIORITY = ("anydesk", "teamviewer")
+
+# Campos gravados em um computador pelo enriquecimento
+_ENRICHED_KEYS = (
+    "last_inventory_update", "contact", "users_id", "user_info", "user_warning",
+    "anydesk_id", "cpu_info", "memory_info"
+)
+
+
+class EnrichmentCache:
+    """
+    Cache LRU com TTL dos dados de enriquecimento (computadores e usuários).
+
+    Para computadores a chave inclui o date_mod: qualquer edição no GLPI gera
+    uma chave nova, e o TTL cobre o que muda fora do computador (usuário).
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 2048):
+        """
+        Args:
+            ttl: Validade de cada entrada em segundos
+            maxsize: Máximo de computadores mantidos (descarta o menos recente)
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # chave -> (expira_em, campos enriquecidos)
+        self._entries: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Dict[str, Any]]:
+        """Campos enriquecidos ainda válidos para a chave, ou None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Tuple[Hashable, ...], value: Dict[str, Any]) -> None:
+        """Armazena os campos enriquecidos de um computador."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Tuple[Hashable, ...]) -> None:
+        """Remove uma entrada específica, se existir."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Descarta todas as entradas."""
+        self._entries.clear()
+
+
 class AssetService:
     """
     Serviço de gerenciamento de assets GLPI.
@@ -32,49 +277,18 @@ class AssetService:
     def __init__(self):
         """Inicializa o serviço de assets."""
         self.client = glpi_client
-        
-        # Tipos de assets suportados pelo GLPI
-        self.asset_types = [
-            "Computer", "Monitor", "Printer", "NetworkEquipment",
-            "Peripheral", "Software", "Phone", "PassiveDCEquipment",
-            "Rack", "Enclosure", "PDU", "Server", "Storage",
-            "Appliance", "Cable", "Plug", "Line", "Certificate",
-            "Database", "Domain", "Entity", "Group", "Location",
-            "Profile", "User", "Ticket", "Problem", "Change",
-            "Project", "ProjectTask", "Cost", "Budget", "Supplier",
-            "Contact", "Contract", "Document", "KnowbaseItem",
-            "KnowbaseCategory", "Reminder", "RSSFeed", "Tool",
-            "Cluster", "CartridgeItem", "ConsumableItem", "Link",
-            "SoftwareLicense", "SoftwareVersion", "OperatingSystem",
-            "VirtualMachine", "Rule", "ImportExternal", "AuthLDAP",
-            "AuthMail", "Entity", "Profile", "User", "Group",
-            "SLA", "OLA", "LevelAgreement", "LevelAgreementLevel",
-            "ITILCategory", "ITILFollowup", "ITILSolution", "ITILTask",
-            "ITILTaskCategory", "ITILActor", "Calendar", "Holiday",
-            "CalendarSegment", "CalendarHoliday", "Notification",
-            "NotificationTemplate", "NotificationEvent", "QueuedNotification",
-            "CronTask", "CronTaskLog", "Plugin", "Fieldblacklist",
-            "Fieldunicity", "SsoVariable", "Lockedfield", "Device",
-            "DeviceMemory", "DeviceProcessor", "DeviceHardDrive",
-            "DeviceNetworkCard", "DeviceDrive", "DeviceGraphicCard",
-            "DeviceSoundCard", "DeviceMotherboard", "DeviceControl",
-            "DeviceCase", "DevicePowerSupply", "DevicePci",
-            "DeviceFirmware", "DeviceSimcard", "DeviceSimcardType",
-            "DeviceBattery", "DeviceCamera", "DeviceSpeaker",
-            "DeviceHeadphone", "DeviceMicrophone", "DeviceRemote",
-            "DeviceKeyboard", "DeviceMouse", "DeviceJoypad",
-            "DeviceGamepad", "DeviceOther", "DeviceGeneric",
-            "DeviceSpecific", "DeviceVirtual", "DevicePhysical",
-            "DeviceLogical", "DeviceInternal", "DeviceExternal",
-            "DeviceEmbedded", "DeviceRemovable", "DeviceFixed",
-            "DeviceHotpluggable", "DeviceNonHotpluggable",
-            "DeviceWired", "DeviceWireless", "DeviceBluetooth",
-            "DeviceWifi", "DeviceCellular", "DeviceSatellite",
-            "DeviceMicrowave", "DeviceRadio", "DeviceInfrared",
-            "DeviceLaser", "DeviceUltrasonic", "DeviceMagnetic",
-            "DeviceOptical", "DeviceElectrical", "DeviceMechanical",
-            "DeviceChemical", "DeviceBiological", "DeviceNuclear"
-        ]
+        # Limita as buscas por computador no enriquecimento (evita saturar o GLPI)
+        self._enrich_sem = asyncio.Semaphore(settings.enrich_concurrency)
+        self._enrich_cache = EnrichmentCache(settings.cache_ttl_seconds)
+        # Leituras idênticas em andamento (single-flight): chave -> futuro compartilhado
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        # Perfis de usuário por ID e resultados da busca de usuários do Smart Search
+        self._user_cache = EnrichmentCache(_USER_CACHE_TTL, maxsize=1024)
+        self._user_search_cache = EnrichmentCache(_USER_CACHE_TTL, maxsize=512)
+        # Queries sem nenhum usuário (ativo ou deletado): evita as duas buscas ao repetir
+        self._empty_user_queries = EnrichmentCache(_EMPTY_USER_QUERY_TTL, maxsize=2048)
+        # Login -> ID de usuário (LRU); só logins encontrados são memorizados
+        self._username_cache: "OrderedDict[str, int]" = OrderedDict()
         
         logger.info("AssetService initialized")
     
@@ -91,7 +305,9 @@ class AssetService:
         is_template: Optional[bool] = None,
         limit: int = 250,
         offset: int = 0,
-        use_cache: bool = True
+        use_cache: bool = True,
+        enrich_computers: bool = False,
+        enrich_fields: Optional[set[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Lista assets com filtros avançados.
@@ -108,83 +324,59 @@ class AssetService:
             model_id: Filtrar por modelo
             status: Filtrar por status
             user_id: Filtrar por ID do usuário responsável
-            username: Filtrar por nome do usuário (requer resolução para ID)
+            username: Filtrar por nome do usuário (login; resolvido para o ID com cache; inexistente = nenhum asset)
             is_template: Filtrar templates
             limit: Limite de resultados
             offset: Offset para paginação
             use_cache: Usar cache
+            enrich_computers: Enriquecer computadores com CPU, RAM, AnyDesk e
+                usuário. Desligado por padrão: listagens simples (nomes, IDs)
+                não pagam as buscas extras, que dominam o tempo de resposta
+            enrich_fields: Subconjunto de ENRICH_FIELDS a enriquecer (None = todos);
+                aspectos fora do conjunto não são buscados no GLPI
 
         Returns:
             Lista de assets
         """
         # Validar tipo de asset
         item_type = asset_type or "Computer"
-        if item_type not in self.asset_types:
+        if item_type not in ASSET_TYPES:
             raise ValidationError(
-                f"Asset type must be one of: {self.asset_types[:10]}...",
+                f"Asset type must be one of: {list(ASSET_TYPES_SAMPLE)}...",
                 "asset_type"
             )
+        if enrich_fields is not None and not set(enrich_fields) <= ENRICH_FIELDS:
+            raise ValidationError(
+                f"enrich_fields must be a subset of: {sorted(ENRICH_FIELDS)}",
+                "enrich_fields"
+            )
+        enrich = enrich_computers and item_type == "Computer"
 
-        # Construir critérios de busca no formato GLPI Search API
-        # Referência campos: https://glpi-user-documentation.readthedocs.io/
-        # Campo 80 = entities_id (Entity)
-        # Campo 3 = locations_id (Location)
-        # Campo 23 = manufacturers_id (Manufacturer)
-        # Campo 40 = models_id (Model)
-        # Campo 31 = states_id (Status)
-        # Campo 70 = users_id (User)
-        criteria = []
-
-        if entity_id:
-            criteria.append({
-                "field": 80,  # Entity field ID na Search API
-                "searchtype": "under",  # "under" busca na entidade E todas as sub-entidades (filhos)
-                "value": entity_id
-            })
-
-        if location_id:
-            criteria.append({
-                "field": 3,  # Location field ID
-                "searchtype": "equals",
-                "value": location_id
-            })
-
-        if manufacturer_id:
-            criteria.append({
-                "field": 23,  # Manufacturer field ID
-                "searchtype": "equals",
-                "value": manufacturer_id
-            })
-
-        if model_id:
-            criteria.append({
-                "field": 40,  # Model field ID
-                "searchtype": "equals",
-                "value": model_id
-            })
-
-        if status:
-            criteria.append({
-                "field": 31,  # Status field ID
-                "searchtype": "equals",
-                "value": status
-            })
-            
         # Filtro por usuário
         target_user_id = user_id
         
-        # Tentar resolver username se fornecido e user_id não
+        # Resolver username se fornecido e user_id não
         if username and not target_user_id:
-            # TODO: Implementar resolução de username via serviço de usuários
-            # Por enquanto, logamos aviso. O ideal é o caller passar user_id.
-            logger.warning(f"Filtering by username '{username}' requires resolving to ID first. Please provide user_id.")
-            
-        if target_user_id:
-            criteria.append({
-                "field": 70,  # User field ID
-                "searchtype": "equals",
-                "value": target_user_id
-            })
+            target_user_id = await self._resolve_username(username)
+            if target_user_id is None:
+                # Filtro por usuário inexistente: nenhum asset, em vez de ignorar o filtro
+                logger.warning(f"list_assets: username '{username}' not found")
+                return []
+
+        # Critérios no formato GLPI Search API, só para filtros informados
+        filter_values = {
+            "entity_id": entity_id,
+            "location_id": location_id,
+            "manufacturer_id": manufacturer_id,
+            "model_id": model_id,
+            "status": status,
+            "user_id": target_user_id,
+        }
+        criteria = [
+            {"field": field, "searchtype": searchtype, "value": filter_values[name]}
+            for name, field, searchtype in FILTER_SPECS
+            if filter_values[name]
+        ]
 
         if is_template is not None:
             criteria.append({
@@ -193,11 +385,6 @@ class AssetService:
                 "value": 1 if is_template else 0
             })
 
-        # Campos a exibir (IDs numéricos para Search API)
-        # 1=name, 2=id, 5=serial, 6=otherserial, 31=states_id, 3=locations_id
-        # 80=entities_id, 70=users_id, 71=groups_id, 23=manufacturers_id, 40=models_id
-        forcedisplay_ids = [1, 2, 5, 6, 31, 3, 80, 70, 71, 23, 40, 19, 16, 4]
-
         try:
             # Se há filtros, usar Search API que suporta criteria
             if criteria:
@@ -205,7 +392,7 @@ class AssetService:
                 result = await self.client.search(
                     item_type=item_type,
                     criteria=criteria,
-                    forcedisplay=forcedisplay_ids,
+                    forcedisplay=SEARCH_FORCEDISPLAY,
                     range_limit=limit,
                     range_offset=offset,
                     is_recursive=entity_id is not None  # Buscar em sub-entidades quando filtrar por entity
@@ -228,30 +415,12 @@ class AssetService:
                 return []
 
             # Normalizar nomes de campos (Search API usa IDs numéricos)
+            use_numeric = bool(criteria)
             normalized_assets = []
             for asset in assets:
                 # Se veio da Search API, os campos são numéricos
-                if criteria and isinstance(asset, dict):
-                    normalized = {
-                        "id": asset.get("2") or asset.get("id"),
-                        "name": asset.get("1") or asset.get("name"),
-                        "serial": asset.get("5") or asset.get("serial"),
-                        "otherserial": asset.get("6") or asset.get("otherserial"),
-                        "states_id": asset.get("31") or asset.get("states_id"),
-                        "locations_id": asset.get("3") or asset.get("locations_id"),
-                        "entities_id": asset.get("80") or asset.get("entities_id"),
-                        "users_id": asset.get("70") or asset.get("users_id"),
-                        "groups_id": asset.get("71") or asset.get("groups_id"),
-                        "manufacturers_id": asset.get("23") or asset.get("manufacturers_id"),
-                        "models_id": asset.get("40") or asset.get("models_id"),
-                        "date_mod": asset.get("19") or asset.get("date_mod"),
-                        "comment": asset.get("16") or asset.get("comment"),
-                        "types_id": asset.get("4") or asset.get("types_id"),
-                        "asset_type": item_type
-                    }
-                    # Remover campos None
-                    normalized = {k: v for k, v in normalized.items() if v is not None}
-                    normalized_assets.append(normalized)
+                if use_numeric and isinstance(asset, dict):
+                    normalized_assets.append(_normalize_search_row(asset, item_type))
                 else:
                     asset["asset_type"] = item_type
                     normalized_assets.append(asset)
@@ -261,14 +430,11 @@ class AssetService:
                 total_count = result["totalcount"]
                 has_more = offset + limit < total_count
                 next_offset = offset + limit if has_more else None
-                
-                # Se for computador, enriquecer com dados detalhados (CPU, RAM, AnyDesk)
-                if item_type == "Computer" and normalized_assets:
-                    logger.info(f"Enriching {len(normalized_assets)} computers with detailed info...")
-                    normalized_assets = await self._enrich_computers(normalized_assets)
 
                 # Retornar assets com metadados se houver muitos
                 if total_count > limit:
+                    if enrich and normalized_assets:
+                        normalized_assets = await self._enrich_computers(normalized_assets, enrich_fields)
                     return {
                         "assets": normalized_assets,
                         "pagination": {
@@ -287,10 +453,9 @@ class AssetService:
                         "hint": f"Use offset parameter to get more assets. Total: {total_count}"
                     }
             
-            # Se for lista simples e for computador, também enriquecer
-            if item_type == "Computer" and normalized_assets:
-                logger.info(f"Enriching {len(normalized_assets)} computers with detailed info...")
-                normalized_assets = await self._enrich_computers(normalized_assets)
+            # Se for computador e o enriquecimento foi pedido, buscar dados detalhados
+            if enrich and normalized_assets:
+                normalized_assets = await self._enrich_computers(normalized_assets, enrich_fields)
 
             return normalized_assets
 
@@ -298,157 +463,456 @@ class AssetService:
             logger.error(f"Failed to list {item_type} assets: {e}")
             raise GLPIError(500, f"Failed to list assets: {str(e)}")
 
-    async def _enrich_computers(self, computers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def iter_assets(self, page_size: int = 50, **filters) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera assets página a página, buscando a próxima só quando necessária.
+        
+        Com enrich_computers, cada página é enriquecida ao ser buscada, então
+        apenas uma página de computadores enriquecidos fica em memória.
+        Interromper a iteração (``break``) evita as requisições restantes.
+        
+        Args:
+            page_size: Assets por requisição
+            **filters: Filtros aceitos por list_assets (asset_type, entity_id, ...)
+        
+        Yields:
+            Assets normalizados, na ordem retornada pelo GLPI
+        """
+        offset = 0
+        while True:
+            page = await self.list_assets(limit=page_size, offset=offset, **filters)
+            assets = page["assets"] if isinstance(page, dict) else page
+            for asset in assets:
+                yield asset
+            if len(assets) < page_size:
+                return
+            offset += page_size
+
+    async def _enrich_computers(
+        self,
+        computers: List[Dict[str, Any]],
+        fields: Optional[set[str]] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Enriquece lista de computadores com dados de subitens em paralelo.
-        Busca: CPU, RAM, AnyDesk, Last Inventory.
+        Enriquece lista de computadores com dados detalhados.
+        Busca: CPU, RAM, AnyDesk, Last Inventory e usuário responsável;
+        com fields, apenas os aspectos de ENRICH_FIELDS pedidos.
+        
+        Detalhes e dispositivos de todos os computadores vêm de uma única
+        chamada getMultipleItems (with_devices); usuários e modelos de
+        processador, de mais uma chamada em lote cada. Apenas o gerenciamento
+        remoto, sem equivalente em lote, é buscado por computador, em paralelo
+        e limitado por settings.enrich_concurrency.
+
+        Computadores com (id, date_mod) já enriquecidos recentemente vêm do
+        cache e não geram nenhuma busca.
         """
-        tasks = []
+        fields = ENRICH_FIELDS if fields is None else frozenset(fields)
+        pending = []
         for comp in computers:
-            tasks.append(self._enrich_single_computer(comp))
+            cid = _int_id(comp.get("id"))
+            if cid is None:
+                continue
+            cached = self._enrich_cache.get((cid, comp.get("date_mod"), fields))
+            if cached is not None:
+                comp.update(cached)
+            else:
+                pending.append(comp)
+        ids = [_int_id(comp["id"]) for comp in pending]
+        if not ids:
+            return computers
+        logger.info(f"Enriching {len(ids)} computers with {sorted(fields)}...")
         
-        # Executar todas as buscas em paralelo
-        enriched_results = await asyncio.gather(*tasks, return_exceptions=True)
+        details_list, remote_lists = await asyncio.gather(
+            self._get_batch(
+                "Computer", ids,
+                params={"with_devices": "true"} if fields & {"cpu", "memory"} else None
+            ),
+            asyncio.gather(
+                *(self._get_remote_management(cid) for cid in ids if "anydesk" in fields),
+                return_exceptions=True
+            ),
+            return_exceptions=True
+        )
+        details_by_id = _index_by_id(details_list, "computer details")
+        remote_by_id = dict(zip(ids, remote_lists)) if isinstance(remote_lists, list) else {}
         
-        # Filtrar resultados (ignorar falhas silenciosamente para não quebrar a lista)
-        final_list = []
-        for res in enriched_results:
-            if isinstance(res, dict):
-                final_list.append(res)
-            else:
-                # Se falhou, retorna o original (não perdemos o item) ou loga erro
-                logger.warning(f"Enrichment failed for one item: {res}")
+        # Usuários e modelos de processador distintos, resolvidos em lote
+        user_ids = set()
+        processor_ids = set()
+        for comp in pending:
+            details = details_by_id.get(_int_id(comp.get("id")), {})
+            user_id = comp.get("users_id") or details.get("users_id")
+            if "user" in fields and user_id and str(user_id).isdigit():
+                user_ids.add(int(user_id))
+            cpus = _device_rows(details, "Item_DeviceProcessor") if "cpu" in fields else None
+            if cpus and str(cpus[0].get("deviceprocessors_id", "")).isdigit():
+                processor_ids.add(int(cpus[0]["deviceprocessors_id"]))
+        
+        users_by_id, processors = await asyncio.gather(
+            self._bulk_get_users(user_ids),
+            self._get_batch("DeviceProcessor", sorted(processor_ids)),
+            return_exceptions=True
+        )
+        cpu_names = {
+            pid: processor.get("designation")
+            for pid, processor in _index_by_id(processors, "processor models").items()
+        }
+        
+        # Só resultados completos vão para o cache (falhas parciais são refeitas na próxima listagem)
+        lookups_ok = not isinstance(users_by_id, Exception) and not isinstance(processors, Exception)
+        if isinstance(users_by_id, Exception):
+            logger.warning(f"Batch fetch of users failed: {users_by_id}")
+            users_by_id = {}
+        
+        for comp in pending:
+            cid = _int_id(comp["id"])
+            try:
+                self._enrich_single_computer(
+                    comp, details_by_id.get(cid), remote_by_id.get(cid), users_by_id, cpu_names, fields
+                )
+            except Exception as e:
+                # Falha em um item não derruba a lista; o computador segue sem enriquecimento
+                logger.warning(f"Error enriching computer {cid}: {e}")
+                continue
+            if (
+                lookups_ok and comp.get("date_mod") and cid in details_by_id
+                and not isinstance(remote_by_id.get(cid), Exception)
+            ):
+                self._enrich_cache.set(
+                    (cid, comp["date_mod"], fields),
+                    {key: comp[key] for key in _ENRICHED_KEYS if key in comp}
+                )
+        
+        return computers
+
+    async def _resolve_username(self, username: str) -> Optional[int]:
+        """ID do usuário com o login informado (cache LRU), ou None se não existir."""
+        username = username.strip()
+        user_id = self._username_cache.get(username)
+        if user_id is not None:
+            self._username_cache.move_to_end(username)
+            return user_id
+        
+        result = await self.client.search(
+            item_type="User",
+            criteria=[{"field": 1, "searchtype": "equals", "value": username}],
+            forcedisplay=[2],  # Apenas ID
+            range_limit=1
+        )
+        rows = result.get("data", []) if isinstance(result, dict) else result or []
+        user_id = next((_int_id(row.get("2") or row.get("id")) for row in rows if isinstance(row, dict)), None)
+        if user_id is None:
+            return None
         
-        # Se algo deu muito errado e a lista ficou vazia (improvável), retorne a original
-        return final_list if final_list else computers
+        self._username_cache[username] = user_id
+        if len(self._username_cache) > _USERNAME_CACHE_SIZE:
+            self._username_cache.popitem(last=False)
+        return user_id
 
-    async def _enrich_single_computer(self, comp: Dict[str, Any]) -> Dict[str, Any]:
-        """Busca detalhes para um único computador, incluindo dados do usuário."""
+    async def _smart_search_users(self, query: str) -> Tuple[List[Any], List[Any]]:
+        """
+        IDs de usuários cujo login, nome ou sobrenome contém a query.
+
+        Retorna (ids_encontrados, ids_deletados): sem usuários ativos, busca nos
+        deletados e usa esses IDs. Resultados com usuários ficam em cache por
+        _USER_CACHE_TTL segundos; queries sem nenhum, por _EMPTY_USER_QUERY_TTL.
+        """
+        cache_key = (query.casefold(),)
+        if self._empty_user_queries.get(cache_key) is not None:
+            return [], []
+        cached = self._user_search_cache.get(cache_key)
+        if cached is not None:
+            return cached["found"], cached["deleted"]
+        
+        found_user_ids = []
+        deleted_user_ids = []
+        
+        # Busca ampla de usuários (GLOBAL) - Removemos o filtro de entidade aqui
+        # Motivo: O usuário pode estar em uma sub-entidade profunda.
+        # Achamos TODOS os usuários "Werles" do sistema, pegamos seus IDs.
+        # O filtro de entidade será aplicado na busca final dos computadores (assets).
+        user_criteria = [
+            {"field": 1, "searchtype": "contains", "value": query}, # Login
+            {"link": "OR", "field": 9, "searchtype": "contains", "value": query}, # Firstname
+            {"link": "OR", "field": 34, "searchtype": "contains", "value": query} # Realname
+        ]
+
+        user_results = await self.client.search(
+            item_type="User",
+            search_text=None,
+            criteria=user_criteria,
+            range_limit=50,
+            forcedisplay=[2] # Apenas ID
+        )
+
+        if isinstance(user_results, list):
+            for u in user_results:
+                uid = u.get("2") or u.get("id")
+                if uid: found_user_ids.append(uid)
+        elif isinstance(user_results, dict) and "data" in user_results:
+            for u in user_results["data"]:
+                uid = u.get("2") or u.get("id")
+                if uid: found_user_ids.append(uid)
+
+        if found_user_ids:
+            logger.info(f"Smart Search: Found {len(found_user_ids)} ACTIVE users matching '{query}': {found_user_ids}")
+
+        # ============ FALLBACK: BUSCAR USUÁRIOS DELETADOS ============
+        # Se não encontrou nenhum usuário ativo, buscar nos deletados
+        # NOTA: GLPI usa ?is_deleted=1 como parâmetro, não como critério de busca
+        if not found_user_ids:
+            logger.info(f"Smart Search: Nenhum usuário ativo encontrado para '{query}', buscando nos deletados...")
+
+            # Montar parâmetros manualmente para incluir is_deleted=1
+            deleted_params = {"is_deleted": 1, "range": "0-49"}
+            for i, crit in enumerate(user_criteria):
+                for key, value in crit.items():
+                    deleted_params[f"criteria[{i}][{key}]"] = value
+            deleted_params["forcedisplay[0]"] = 2
+
+            deleted_results = await self.client.get("/apirest.php/search/User", deleted_params, use_cache=False)
+
+            if isinstance(deleted_results, list):
+                for u in deleted_results:
+                    uid = u.get("2") or u.get("id")
+                    if uid: deleted_user_ids.append(uid)
+            elif isinstance(deleted_results, dict) and "data" in deleted_results:
+                for u in deleted_results["data"]:
+                    uid = u.get("2") or u.get("id")
+                    if uid: deleted_user_ids.append(uid)
+
+            if deleted_user_ids:
+                logger.info(f"Smart Search: Found {len(deleted_user_ids)} DELETED users matching '{query}': {deleted_user_ids}")
+                # Usar os IDs deletados como se fossem ativos para a busca de assets
+                found_user_ids = deleted_user_ids
+
+        if found_user_ids:
+            self._user_search_cache.set(cache_key, {"found": found_user_ids, "deleted": deleted_user_ids})
+        else:
+            self._empty_user_queries.set(cache_key, {})
+        return found_user_ids, deleted_user_ids
+
+    def sync_user(self, user_id: Optional[int] = None) -> None:
+        """
+        Descarta usuários em cache após mutações: o usuário (e os logins que
+        apontam para ele, já que o login pode ter mudado) e todas as buscas
+        Smart Search.
+        """
+        if user_id is None:
+            self._user_cache.clear()
+            self._username_cache.clear()
+        else:
+            self._user_cache.discard((user_id,))
+            for login in [k for k, v in self._username_cache.items() if v == user_id]:
+                del self._username_cache[login]
+        self._user_search_cache.clear()
+        self._empty_user_queries.clear()
+
+    async def _single_flight(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa fetch uma única vez por chave entre chamadas concorrentes.
+
+        Quem chega enquanto a mesma leitura está em andamento aguarda o
+        resultado (ou a exceção) da primeira, sem nova requisição ao GLPI.
+        Se a primeira chamada for cancelada, só ela vê o cancelamento: quem
+        aguardava refaz a leitura.
+        """
+        while True:
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            result = await asyncio.shield(future)
+            if result is not _FETCH_CANCELLED:
+                return result
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            cid = comp.get("id")
-            if not cid:
-                return comp
-
-            # Disparar chamadas em paralelo para este computador
-            # 1. Detalhes gerais (para pegar last_inventory_update)
-            # 2. Remote Management (AnyDesk)
-            # 3. CPU
-            # 4. Memória
-
-            # OBS: get_item já retorna alguns dados, mas precisamos de subitens para CPU/RAM/AnyDesk
-            # Para otimizar, não vamos chamar get_asset completo (que é muito pesado),
-            # mas sim endpoints específicos ou reutilizar get_item leve.
-
-            # Buscar item principal leve para pegar last_inventory_update e users_id
-            task_details = self.client.get_item("Computer", cid, forcedisplay=["last_inventory_update", "contact", "contact_num", "users_id"])
-            task_remote = self.client.get_subitems("Computer", cid, "Item_RemoteManagement")
-            # Solicitar expansão de dropdowns para pegar o nome do processador
-            task_cpu = self.client.get_subitems("Computer", cid, "Item_DeviceProcessor", params={"expand_dropdowns": "true"})
-            task_mem = self.client.get_subitems("Computer", cid, "Item_DeviceMemory")
-
-            # Await all
-            details, remote_list, cpu_list, mem_list = await asyncio.gather(
-                task_details, task_remote, task_cpu, task_mem, return_exceptions=True
-            )
-            
-            # Processar Detalhes
-            if isinstance(details, dict):
-                comp["last_inventory_update"] = details.get("last_inventory_update")
-                # Se o contato não veio na busca inicial, pega agora
-                if "contact" not in comp and details.get("contact"):
-                    comp["contact"] = details.get("contact")
-                # Pegar users_id para enriquecer com dados do usuário
-                if "users_id" not in comp and details.get("users_id"):
-                    comp["users_id"] = details.get("users_id")
-
-            # ============ ENRIQUECIMENTO DO USUÁRIO ============
-            # Se temos users_id, buscar dados do usuário (nome, email, status deletado)
-            user_id = comp.get("users_id")
-            if user_id and str(user_id).isdigit():
-                try:
-                    user_data = await self.client.get_item("User", int(user_id),
-                        forcedisplay=["id", "name", "firstname", "realname", "email", "is_active", "is_deleted"])
-
-                    if isinstance(user_data, dict):
-                        # Criar objeto user_info com dados enriquecidos
-                        user_info = {
-                            "id": user_data.get("id"),
-                            "login": user_data.get("name"),
-                            "firstname": user_data.get("firstname"),
-                            "realname": user_data.get("realname"),
-                            "fullname": f"{user_data.get('firstname', '')} {user_data.get('realname', '')}".strip(),
-                            "email": user_data.get("email"),
-                            "is_active": user_data.get("is_active", 1) == 1,
-                            "is_deleted": user_data.get("is_deleted", 0) == 1
-                        }
-                        comp["user_info"] = user_info
+            result = await fetch()
+        except asyncio.CancelledError:
+            future.set_result(_FETCH_CANCELLED)
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Evita aviso de exceção não recuperada quando ninguém aguardava
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[key]
 
-                        # Alerta se usuário deletado
-                        if user_info["is_deleted"]:
-                            comp["user_warning"] = "USUÁRIO DELETADO - Este usuário foi removido do sistema (possivelmente sync LDAP)"
+    async def _get_batch(
+        self,
+        item_type: str,
+        ids: List[int],
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        getMultipleItems de um único tipo, em lotes de _BATCH_SIZE (mantém a URL
+        curta) buscados em paralelo e compartilhados entre chamadas concorrentes.
+        """
+        if not ids:
+            return []
+        chunks = [ids[i:i + _BATCH_SIZE] for i in range(0, len(ids), _BATCH_SIZE)]
+        pages = await asyncio.gather(*(self._get_batch_chunk(item_type, chunk, params) for chunk in chunks))
+        return [item for page in pages for item in page]
 
-                except Exception as e:
-                    logger.warning(f"Could not enrich user {user_id} for computer {cid}: {e}")
-                    comp["user_info"] = {"id": user_id, "error": "Não foi possível obter dados do usuário"}
+    async def _get_batch_chunk(
+        self,
+        item_type: str,
+        ids: List[int],
+        params: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Um lote de getMultipleItems (single-flight)."""
+        key = ("getMultipleItems", item_type, tuple(ids), frozenset((params or {}).items()))
+        return await self._single_flight(
+            key, lambda: self.client.get_multiple_items([(item_type, i) for i in ids], params=params)
+        )
+
+    async def _bulk_get_users(self, ids: set[int]) -> Dict[int, Dict[str, Any]]:
+        """Usuários por ID: do cache quando válidos, os demais em lotes de _BATCH_SIZE."""
+        users = {}
+        for uid in ids:
+            user = self._user_cache.get((uid,))
+            if user is not None:
+                users[uid] = user
+        missing = sorted(ids - users.keys())
+        if missing:
+            fetched = _index_by_id(await self._get_batch("User", missing), "users")
+            for uid, user in fetched.items():
+                self._user_cache.set((uid,), user)
+            users.update(fetched)
+        return users
+
+    async def _get_limited_item(self, item_type: str, item_id: Any) -> Dict[str, Any]:
+        """get_item respeitando o limite de concorrência do enriquecimento."""
+        async with self._enrich_sem:
+            return await self.client.get_item(item_type, item_id)
+
+    async def _get_remote_management(self, computer_id: int) -> Any:
+        """Busca o gerenciamento remoto de um computador respeitando o limite de concorrência."""
+        async def fetch() -> Any:
+            async with self._enrich_sem:
+                return await self.client.get_subitems("Computer", computer_id, "Item_RemoteManagement")
+        
+        return await self._single_flight(("Item_RemoteManagement", computer_id), fetch)
+
+    def _enrich_single_computer(
+        self,
+        comp: Dict[str, Any],
+        details: Optional[Dict[str, Any]],
+        remote_list: Any,
+        users_by_id: Dict[int, Dict[str, Any]],
+        cpu_names: Dict[int, Any],
+        fields: frozenset = ENRICH_FIELDS
+    ) -> Dict[str, Any]:
+        """Aplica a um computador os dados já buscados em lote (apenas os aspectos em fields)."""
+        cid = comp.get("id")
+        details = details or {}
+        
+        # Processar Detalhes
+        if details:
+            comp["last_inventory_update"] = details.get("last_inventory_update")
+            # Se o contato não veio na busca inicial, pega agora
+            if "contact" not in comp and details.get("contact"):
+                comp["contact"] = details.get("contact")
+            # Pegar users_id para enriquecer com dados do usuário
+            if "users_id" not in comp and details.get("users_id"):
+                comp["users_id"] = details.get("users_id")
+
+        # ============ ENRIQUECIMENTO DO USUÁRIO ============
+        # Se temos users_id, usar dados do usuário (nome, email, status deletado)
+        user_id = comp.get("users_id")
+        if "user" in fields and user_id and str(user_id).isdigit():
+            user_data = users_by_id.get(int(user_id))
+            if isinstance(user_data, dict):
+                # Criar objeto user_info com dados enriquecidos
+                user_info = {
+                    "id": user_data.get("id"),
+                    "login": user_data.get("name"),
+                    "firstname": user_data.get("firstname"),
+                    "realname": user_data.get("realname"),
+                    "fullname": f"{user_data.get('firstname', '')} {user_data.get('realname', '')}".strip(),
+                    "email": user_data.get("email"),
+                    "is_active": user_data.get("is_active", 1) == 1,
+                    "is_deleted": user_data.get("is_deleted", 0) == 1
+                }
+                comp["user_info"] = user_info
+
+                # Alerta se usuário deletado
+                if user_info["is_deleted"]:
+                    comp["user_warning"] = "USUÁRIO DELETADO - Este usuário foi removido do sistema (possivelmente sync LDAP)"
+            else:
+                logger.warning(f"Could not enrich user {user_id} for computer {cid}")
+                comp["user_info"] = {"id": user_id, "error": "Não foi possível obter dados do usuário"}
+        
+        # AnyDesk (Remote Management), CPU e memória, conforme pedido
+        if "anydesk" in fields:
+            self._apply_anydesk(comp, remote_list)
+        if "cpu" in fields:
+            self._apply_cpu(comp, details, cpu_names)
+        if "memory" in fields:
+            self._apply_memory(comp, details)
+
+        return comp
+
+    @staticmethod
+    def _apply_anydesk(comp: Dict[str, Any], remote_list: Any) -> None:
+        """Define anydesk_id: AnyDesk, senão TeamViewer, senão o primeiro ID remoto."""
+        remotes = [rm for rm in remote_list if isinstance(rm, dict)] if isinstance(remote_list, list) else []
+        # O campo 'type' pode ser 'anydesk' ou similar; normalizado uma vez por linha
+        types = [str(rm.get("type", "")).casefold() for rm in remotes]
+        chosen = next(
+            (rm for marker in _REMOTE_PRIORITY for rm, r_type in zip(remotes, types) if marker in r_type),
+            None
+        ) or next((rm for rm in remotes if rm.get("remoteid")), None)
+        comp["anydesk_id"] = (chosen or {}).get("remoteid") or "N/A"
+
+    @staticmethod
+    def _apply_cpu(comp: Dict[str, Any], details: Dict[str, Any], cpu_names: Dict[int, Any]) -> None:
+        """Define cpu_info com o modelo do primeiro processador e a contagem."""
+        # Processar CPU (Pegar o modelo do primeiro processador e a contagem)
+        cpu_info = "N/A"
+        cpu_list = _device_rows(details, "Item_DeviceProcessor")
+        if cpu_list:
+            count = len(cpu_list)
+            first_cpu = cpu_list[0]
+            cpu_model = "Processor"
             
-            # Processar AnyDesk (Remote Management)
-            anydesk_id = "N/A"
-            if isinstance(remote_list, list):
-                for rm in remote_list:
-                    # Tentar identificar AnyDesk pelo tipo ou assumir o ID remoto
-                    # O campo 'type' pode ser 'anydesk' ou similar
-                    r_type = str(rm.get("type", "")).lower()
-                    if "anydesk" in r_type or "teamviewer" in r_type or rm.get("remoteid"):
-                        anydesk_id = rm.get("remoteid")
-                        if "anydesk" in r_type: # Prioridade para anydesk se houver múltiplos
-                            break 
-            comp["anydesk_id"] = anydesk_id
+            # Nome do modelo resolvido em lote pelo ID do DeviceProcessor
+            proc_id_val = first_cpu.get("deviceprocessors_id")
+            if str(proc_id_val).isdigit() and cpu_names.get(int(proc_id_val)):
+                cpu_model = cpu_names[int(proc_id_val)]
+            elif first_cpu.get("designation"):
+                cpu_model = first_cpu.get("designation")
             
-            # Processar CPU (Pegar o modelo do primeiro processador e a contagem)
-            cpu_info = "N/A"
-            if isinstance(cpu_list, list) and cpu_list:
-                count = len(cpu_list)
-                first_cpu = cpu_list[0]
-                cpu_model = "Processor"
-                
-                # Com expand_dropdowns, o ID vira o nome (str)
-                proc_id_val = first_cpu.get("deviceprocessors_id")
-                if isinstance(proc_id_val, str):
-                    cpu_model = proc_id_val
-                elif first_cpu.get("designation"):
-                    cpu_model = first_cpu.get("designation")
-                
-                freq = first_cpu.get('frequency', '')
-                freq_str = f" @ {freq}MHz" if freq else ""
-                
-                cpu_info = f"{count}x {cpu_model}{freq_str}"
-                
-            comp["cpu_info"] = cpu_info
-
-            # Processar Memória (Somar tamanho)
-            total_mem = 0
-            if isinstance(mem_list, list):
-                for mem in mem_list:
-                    try:
-                        size = int(mem.get("size", 0))
-                        total_mem += size
-                    except:
-                        pass
+            freq = first_cpu.get('frequency', '')
+            freq_str = f" @ {freq}MHz" if freq else ""
             
-            # Converter MB para GB se > 1024
-            if total_mem > 0:
-                if total_mem >= 1024:
-                    comp["memory_info"] = f"{total_mem/1024:.1f} GB"
-                else:
-                    comp["memory_info"] = f"{total_mem} MB"
+            cpu_info = f"{count}x {cpu_model}{freq_str}"
+            
+        comp["cpu_info"] = cpu_info
+
+    @staticmethod
+    def _apply_memory(comp: Dict[str, Any], details: Dict[str, Any]) -> None:
+        """Define memory_info com a soma dos módulos de memória."""
+        # Processar Memória (Somar tamanho; tamanhos não numéricos são ignorados)
+        total_mem = sum(
+            int(mem["size"])
+            for mem in _device_rows(details, "Item_DeviceMemory")
+            if str(mem.get("size", "")).isdigit()
+        )
+        
+        # Converter MB para GB se > 1024
+        if total_mem > 0:
+            if total_mem >= 1024:
+                comp["memory_info"] = f"{total_mem/1024:.1f} GB"
             else:
-                comp["memory_info"] = "N/A"
-
-            return comp
-
-        except Exception as e:
-            logger.warning(f"Error enriching computer {comp.get('id')}: {e}")
-            return comp
+                comp["memory_info"] = f"{total_mem} MB"
+        else:
+            comp["memory_info"] = "N/A"
 
     
     async def get_asset(self, asset_type: str, asset_id: int) -> Dict[str, Any]:
@@ -463,9 +927,9 @@ class AssetService:
             Dados completos do asset
         """
         # Validar tipo de asset
-        if asset_type not in self.asset_types:
+        if asset_type not in ASSET_TYPES:
             raise ValidationError(
-                f"Asset type must be one of: {self.asset_types[:10]}...", 
+                f"Asset type must be one of: {list(ASSET_TYPES_SAMPLE)}...",
                 "asset_type"
             )
         
@@ -491,53 +955,18 @@ class AssetService:
             # Adicionar tipo do asset
             asset["asset_type"] = asset_type
             
-            # Obter componentes relacionados se for Computer
-            if asset_type == "Computer":
-                try:
-                    # Obter memória
-                    memory_items = await self.client.get_subitems("Computer", asset_id, "Item_DeviceMemory")
-                    asset["memory"] = memory_items
-                    
-                    # Obter processadores
-                    cpu_items = await self.client.get_subitems("Computer", asset_id, "Item_DeviceProcessor")
-                    asset["processors"] = cpu_items
-                    
-                    # Obter discos
-                    disk_items = await self.client.get_subitems("Computer", asset_id, "Item_DeviceHardDrive")
-                    asset["disks"] = disk_items
-                    
-                    # Obter placas de rede
-                    network_items = await self.client.get_subitems("Computer", asset_id, "Item_DeviceNetworkCard")
-                    asset["network_cards"] = network_items
-
-                    # Obter sistema operacional
-                    os_items = await self.client.get_subitems("Computer", asset_id, "Item_OperatingSystem")
-                    asset["operating_system"] = os_items
-
-                    # Obter software instalado
-                    software_items = await self.client.get_subitems("Computer", asset_id, "Item_SoftwareVersion")
-                    asset["software"] = software_items
-
-                    # Obter gerenciamento remoto (ex: AnyDesk, TeamViewer)
-                    remote_management_items = await self.client.get_subitems("Computer", asset_id, "Item_RemoteManagement")
-                    asset["remote_management"] = remote_management_items
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to get components for {asset_type} {asset_id}: {e}")
-                    asset["memory"] = []
-                    asset["processors"] = []
-                    asset["disks"] = []
-                    asset["network_cards"] = []
-                    asset["operating_system"] = []
-                    asset["software"] = []
-                    asset["remote_management"] = []
-            
-            # Obter histórico de alterações
-            try:
-                logs = await self.client.get_subitems(asset_type, asset_id, "Log")
-                asset["history"] = logs
-            except Exception:
-                asset["history"] = []
+            # Componentes (se for Computer) e histórico, buscados em paralelo
+            subitems = (_COMPUTER_SUBITEMS if asset_type == "Computer" else ()) + (("history", "Log"),)
+            results = await asyncio.gather(
+                *(self.client.get_subitems(asset_type, asset_id, subtype) for _, subtype in subitems),
+                return_exceptions=True
+            )
+            for (key, subtype), items in zip(subitems, results):
+                if isinstance(items, Exception):
+                    # Falha em um componente não impede os demais
+                    logger.warning(f"Failed to get {subtype} for {asset_type} {asset_id}: {items}")
+                    items = []
+                asset[key] = items
             
             return asset
             
@@ -561,6 +990,7 @@ class AssetService:
         user_id: Optional[int] = None,
         group_id: Optional[int] = None,
         comment: Optional[str] = None,
+        return_full: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -579,15 +1009,18 @@ class AssetService:
             user_id: ID do usuário responsável
             group_id: ID do grupo responsável
             comment: Comentários
+            return_full: Rebuscar o asset completo (componentes e histórico) via
+                get_asset; por padrão retorna os campos enviados mais o ID, sem
+                nenhuma requisição extra
             **kwargs: Campos adicionais específicos do tipo
         
         Returns:
             Asset criado
         """
         # Validações conforme SPEC.md
-        if asset_type not in self.asset_types:
+        if asset_type not in ASSET_TYPES:
             raise ValidationError(
-                f"Asset type must be one of: {self.asset_types[:10]}...", 
+                f"Asset type must be one of: {list(ASSET_TYPES_SAMPLE)}...",
                 "asset_type"
             )
         
@@ -638,8 +1071,10 @@ class AssetService:
             if "id" not in result:
                 raise GLPIError(500, f"Failed to create {asset_type} - no ID returned")
             
-            # Retornar asset completo
-            created_asset = await self.get_asset(asset_type, result["id"])
+            if return_full:
+                created_asset = await self.get_asset(asset_type, result["id"])
+            else:
+                created_asset = {**payload, "id": result["id"], "asset_type": asset_type}
             
             logger.info(f"{asset_type} created successfully: ID {result['id']}")
             return created_asset
@@ -652,6 +1087,7 @@ class AssetService:
         self,
         asset_type: str,
         asset_id: int,
+        return_full: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -660,17 +1096,18 @@ class AssetService:
         Args:
             asset_type: Tipo de asset
             asset_id: ID do asset
+            return_full: Rebuscar o asset após a atualização; por padrão
+                retorna o asset lido na validação com os campos alterados
             **kwargs: Campos para atualizar
         
         Returns:
             Asset atualizado
         """
         # Validar asset existe
-        await self.get_asset(asset_type, asset_id)
+        current_asset = await self.get_asset(asset_type, asset_id)
         
         # Remover campos que não devem ser atualizados diretamente
-        protected_fields = ["id", "asset_type", "date_creation", "date_mod"]
-        update_payload = {k: v for k, v in kwargs.items() if k not in protected_fields}
+        update_payload = {k: v for k, v in kwargs.items() if k not in _PROTECTED_FIELDS}
         
         if not update_payload:
             raise ValidationError("No valid fields to update", "payload")
@@ -679,8 +1116,10 @@ class AssetService:
             logger.info(f"Updating {asset_type} {asset_id} with fields: {list(update_payload.keys())}")
             await self.client.put(f"/apirest.php/{asset_type}/{asset_id}", update_payload)
             
-            # Retornar asset atualizado
-            updated_asset = await self.get_asset(asset_type, asset_id)
+            if return_full:
+                updated_asset = await self.get_asset(asset_type, asset_id)
+            else:
+                updated_asset = {**current_asset, **update_payload}
             
             logger.info(f"{asset_type} {asset_id} updated successfully")
             return updated_asset
@@ -722,7 +1161,7 @@ class AssetService:
         fields: Optional[List[str]] = None,
         limit: int = 250,
         offset: int = 0
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
         Busca assets por texto livre com Smart Search otimizado.
 
@@ -751,213 +1190,198 @@ class AssetService:
             offset: Offset para paginação
 
         Returns:
-            Assets que correspondem à busca (sempre incluindo ID)
+            Dict sempre com "assets" (sempre incluindo ID) e "pagination" (None
+            quando o GLPI não informa o total). "smart_search_warning" e
+            "deleted_user_ids" aparecem só quando o match veio de usuário
+            deletado. Para ler tudo, use iter_search_assets
         """
         try:
             logger.info(f"Smart Searching {asset_type or 'all'} assets with query: {query}, entity_id: {entity_id}")
-
-            # 1. SMART SEARCH: Buscar IDs de usuários que dão match com a query
-            # Inclui busca em ATIVOS e DELETADOS para cobrir usuários removidos via LDAP sync
-            found_user_ids = []
-            deleted_user_ids = []
-            if len(query) > 2:
-                try:
-                    # Busca ampla de usuários (GLOBAL) - Removemos o filtro de entidade aqui
-                    # Motivo: O usuário pode estar em uma sub-entidade profunda.
-                    # Achamos TODOS os usuários "Werles" do sistema, pegamos seus IDs.
-                    # O filtro de entidade será aplicado na busca final dos computadores (assets).
-                    user_criteria = [
-                        {"field": 1, "searchtype": "contains", "value": query}, # Login
-                        {"link": "OR", "field": 9, "searchtype": "contains", "value": query}, # Firstname
-                        {"link": "OR", "field": 34, "searchtype": "contains", "value": query} # Realname
-                    ]
-
-                    # Removido propositalmente: filtro de entidade na busca de USER.
-                    # if entity_id: ...
-
-                    user_results = await self.client.search(
-                        item_type="User",
-                        search_text=None,
-                        criteria=user_criteria,
-                        range_limit=50,
-                        forcedisplay=[2] # Apenas ID
-                    )
-
-                    if isinstance(user_results, list):
-                        for u in user_results:
-                            uid = u.get("2") or u.get("id")
-                            if uid: found_user_ids.append(uid)
-                    elif isinstance(user_results, dict) and "data" in user_results:
-                        for u in user_results["data"]:
-                            uid = u.get("2") or u.get("id")
-                            if uid: found_user_ids.append(uid)
-
-                    if found_user_ids:
-                        logger.info(f"Smart Search: Found {len(found_user_ids)} ACTIVE users matching '{query}': {found_user_ids}")
-
-                    # ============ FALLBACK: BUSCAR USUÁRIOS DELETADOS ============
-                    # Se não encontrou nenhum usuário ativo, buscar nos deletados
-                    # NOTA: GLPI usa ?is_deleted=1 como parâmetro, não como critério de busca
-                    if not found_user_ids:
-                        logger.info(f"Smart Search: Nenhum usuário ativo encontrado para '{query}', buscando nos deletados...")
-
-                        # Montar parâmetros manualmente para incluir is_deleted=1
-                        deleted_params = {"is_deleted": 1, "range": "0-49"}
-                        for i, crit in enumerate(user_criteria):
-                            for key, value in crit.items():
-                                deleted_params[f"criteria[{i}][{key}]"] = value
-                        deleted_params["forcedisplay[0]"] = 2
-
-                        deleted_results = await self.client.get("/apirest.php/search/User", deleted_params, use_cache=False)
-
-                        if isinstance(deleted_results, list):
-                            for u in deleted_results:
-                                uid = u.get("2") or u.get("id")
-                                if uid: deleted_user_ids.append(uid)
-                        elif isinstance(deleted_results, dict) and "data" in deleted_results:
-                            for u in deleted_results["data"]:
-                                uid = u.get("2") or u.get("id")
-                                if uid: deleted_user_ids.append(uid)
-
-                        if deleted_user_ids:
-                            logger.info(f"Smart Search: Found {len(deleted_user_ids)} DELETED users matching '{query}': {deleted_user_ids}")
-                            # Usar os IDs deletados como se fossem ativos para a busca de assets
-                            found_user_ids = deleted_user_ids
-
-                except Exception as e:
-                    logger.warning(f"Smart Search user lookup failed (ignoring): {e}")
-
-            # 2. Construir Critérios do Asset
-            criteria = []
             
-            # Filtro de entidade (AND mandatório)
-            if entity_id:
-                criteria.append({
-                    "field": 80, # Entity
-                    "searchtype": "under", # Recursivo
-                    "value": entity_id,
-                    "link": "AND"
-                })
+            item_type = asset_type or "Computer"
+            criteria, deleted_user_ids = await self._smart_search_criteria(query, entity_id)
+            normalized_assets, total_count = await self._search_assets_page(
+                item_type, criteria, fields, limit, offset
+            )
+            
+            pagination = None
+            if total_count is not None:
+                has_more = offset + limit < total_count
+                pagination = {
+                    "total": total_count,
+                    "offset": offset,
+                    "limit": limit,
+                    "has_more": has_more,
+                    "next_offset": offset + limit if has_more else None
+                }
+            
+            response: Dict[str, Any] = {"assets": normalized_assets, "pagination": pagination}
+            # Aviso se a busca foi feita via usuário deletado
+            if deleted_user_ids and normalized_assets:
+                response["smart_search_warning"] = (
+                    f"Assets encontrados via USUÁRIO DELETADO (IDs: {deleted_user_ids}). "
+                    "O usuário foi removido do sistema (possivelmente sync LDAP)."
+                )
+                response["deleted_user_ids"] = deleted_user_ids
+            return response
+                
+        except Exception as e:
+            logger.error(f"Failed to search assets: {e}")
+            raise GLPIError(500, f"Failed to search assets: {str(e)}")
 
-            # ============ GRUPO OR PRINCIPAL - BUSCA MULTI-CAMPO ============
-            # Busca com OR para máxima cobertura - não para ao encontrar parciais
+    async def iter_search_assets(
+        self,
+        query: str,
+        asset_type: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        fields: Optional[List[str]] = None,
+        page_size: int = 250
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera todos os resultados do Smart Search, página a página.
+        
+        Os usuários correspondentes são resolvidos uma única vez; cada página é
+        buscada só quando a anterior foi consumida (``break`` evita as restantes).
+        
+        Args:
+            query: Texto para buscar (Nome, Serial, Contact ou Nome do Usuário)
+            asset_type: Tipo de asset específico
+            entity_id: Filtrar por entidade/cliente
+            fields: Campos específicos para retornar
+            page_size: Assets por requisição
+        
+        Yields:
+            Assets normalizados, na ordem retornada pelo GLPI
+        """
+        item_type = asset_type or "Computer"
+        criteria, _ = await self._smart_search_criteria(query, entity_id)
+        offset = 0
+        while True:
+            assets, _ = await self._search_assets_page(item_type, criteria, fields, page_size, offset)
+            for asset in assets:
+                yield asset
+            if len(assets) < page_size:
+                return
+            offset += page_size
 
-            # Name (Field 1) - Nome do Computador
-            criteria.append({
-                "link": "AND" if entity_id else "",
-                "field": 1,
-                "searchtype": "contains",
-                "value": query
-            })
+    async def _smart_search_criteria(
+        self,
+        query: str,
+        entity_id: Optional[int]
+    ) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """
+        Critérios do Smart Search e IDs de usuários deletados usados neles.
+        
+        A busca de usuários (ATIVOS e DELETADOS, para cobrir usuários removidos
+        via LDAP sync) roda em segundo plano enquanto os demais critérios são montados.
+        """
+        user_task = asyncio.create_task(self._smart_search_users(query)) if len(query) > 2 else None
+        criteria = self._build_asset_criteria(query, entity_id)
+        
+        found_user_ids = []
+        deleted_user_ids = []
+        if user_task is not None:
+            try:
+                found_user_ids, deleted_user_ids = await user_task
+            except Exception as e:
+                logger.warning(f"Smart Search user lookup failed (ignoring): {e}")
+        
+        # ============ SMART LINK: IDs de Usuários Encontrados ============
+        # Adiciona busca por users_id (Field 70) para cada usuário encontrado
+        # NOTA: Isso é ADICIONAL ao campo contact - ambos são pesquisados
+        criteria.extend(
+            {"link": "OR", "field": 70, "searchtype": "equals", "value": uid}  # User ID (SELECT/FK)
+            for uid in found_user_ids
+        )
+        return criteria, deleted_user_ids
 
-            # Serial (Field 5) - Número de Série
+    @staticmethod
+    def _build_asset_criteria(query: str, entity_id: Optional[int]) -> List[Dict[str, Any]]:
+        """Critérios do Smart Search por entidade, nome, serial, contact e ID."""
+        criteria = []
+        
+        # Filtro de entidade (AND mandatório)
+        if entity_id:
             criteria.append({
-                "link": "OR",
-                "field": 5,
-                "searchtype": "contains",
-                "value": query
+                "field": 80, # Entity
+                "searchtype": "under", # Recursivo
+                "value": entity_id,
+                "link": "AND"
             })
 
-            # ============ NOVO: Contact (Field 7) - Nome Alternativo do Usuário ============
-            # Campo de texto livre que pode conter: "joana.rodrigues@GRUPOWINK"
-            # CRÍTICO: Permite encontrar computadores mesmo sem users_id vinculado
+        # ============ GRUPO OR PRINCIPAL - BUSCA MULTI-CAMPO ============
+        # Busca com OR para máxima cobertura - não para ao encontrar parciais
+
+        # Name (Field 1) - Nome do Computador
+        criteria.append({
+            "link": "AND" if entity_id else "",
+            "field": 1,
+            "searchtype": "contains",
+            "value": query
+        })
+
+        # Serial (Field 5) - Número de Série
+        criteria.append({
+            "link": "OR",
+            "field": 5,
+            "searchtype": "contains",
+            "value": query
+        })
+
+        # ============ NOVO: Contact (Field 7) - Nome Alternativo do Usuário ============
+        # Campo de texto livre que pode conter: "joana.rodrigues@GRUPOWINK"
+        # CRÍTICO: Permite encontrar computadores mesmo sem users_id vinculado
+        criteria.append({
+            "link": "OR",
+            "field": 7,  # Contact = Nome Alternativo do Usuário (TEXTO)
+            "searchtype": "contains",
+            "value": query
+        })
+
+        # Se a query for numérica, tentar ID do ativo
+        if query.isdigit():
             criteria.append({
                 "link": "OR",
-                "field": 7,  # Contact = Nome Alternativo do Usuário (TEXTO)
-                "searchtype": "contains",
+                "field": 2, # ID
+                "searchtype": "equals",
                 "value": query
             })
+        
+        return criteria
 
-            # Se a query for numérica, tentar ID do ativo
-            if query.isdigit():
-                criteria.append({
-                    "link": "OR",
-                    "field": 2, # ID
-                    "searchtype": "equals",
-                    "value": query
-                })
-
-            # ============ SMART LINK: IDs de Usuários Encontrados ============
-            # Adiciona busca por users_id (Field 70) para cada usuário encontrado
-            # NOTA: Isso é ADICIONAL ao campo contact - ambos são pesquisados
-            for uid in found_user_ids:
-                criteria.append({
-                    "link": "OR",
-                    "field": 70, # User ID (SELECT/FK)
-                    "searchtype": "equals",
-                    "value": uid
-                })
-
-            # Executar busca final
-            # forcedisplay inclui Field 7 (contact) e Field 8 (contact_num)
-            result = await self.client.search(
-                item_type=asset_type or "Computer",
-                search_text=None,
-                range_limit=limit,
-                range_offset=offset,
-                criteria=criteria,
-                forcedisplay=fields or [1, 2, 5, 6, 7, 8, 31, 3, 80, 70, 71, 23, 40, 19, 16, 4]
-                #                        ^name ^id ^serial ^other ^contact ^contact_num ...
-            )
-
-            # Processar resultados
-            if isinstance(result, list):
-                assets = result
-            elif isinstance(result, dict) and "data" in result:
-                assets = result["data"]
-            else:
-                return []
-
-            # Normalizar resultados
-            normalized_assets = []
-            for asset in assets:
-                # Extrair valores com fallback para ambos os formatos (Field ID ou nome)
-                user_val = asset.get("70") or asset.get("users_id")
-                contact_val = asset.get("7") or asset.get("contact")
-                contact_num_val = asset.get("8") or asset.get("contact_num")
-
-                normalized = {
-                    "id": asset.get("2") or asset.get("id"),
-                    "name": asset.get("1") or asset.get("name"),
-                    "serial": asset.get("5") or asset.get("serial"),
-                    "otherserial": asset.get("6") or asset.get("otherserial"),
-                    # NOVO: Contact (Nome Alternativo do Usuário)
-                    "contact": contact_val,
-                    "contact_num": contact_num_val,
-                    "status": asset.get("31") or asset.get("states_id"),
-                    "locations_id": asset.get("3") or asset.get("locations_id"),
-                    "manufacturers_id": asset.get("23") or asset.get("manufacturers_id"),
-                    "models_id": asset.get("40") or asset.get("models_id"),
-                    "entities_id": asset.get("80") or asset.get("entities_id"),
-                    "users_id": user_val,
-                    "groups_id": asset.get("71") or asset.get("groups_id"),
-                    "date_mod": asset.get("19") or asset.get("date_mod"),
-                    "comment": asset.get("16") or asset.get("comment"),
-                    "types_id": asset.get("4") or asset.get("types_id"),
-                    "asset_type": asset_type or "Computer"
-                }
-                # Remover chaves nulas para limpar o JSON
-                normalized = {k: v for k, v in normalized.items() if v is not None}
-                normalized_assets.append(normalized)
-            
-            # Hint de paginação
-            if isinstance(result, dict) and "totalcount" in result and result["totalcount"] > limit:
-                normalized_assets.append({
-                    "search_hint": f"Found {result['totalcount']} total results. Use pagination to get more."
-                })
-
-            # Adicionar aviso se a busca foi feita via usuário deletado
-            if deleted_user_ids and normalized_assets:
-                normalized_assets.insert(0, {
-                    "smart_search_warning": f"Assets encontrados via USUÁRIO DELETADO (IDs: {deleted_user_ids}). O usuário foi removido do sistema (possivelmente sync LDAP).",
-                    "deleted_user_ids": deleted_user_ids
-                })
+    async def _search_assets_page(
+        self,
+        item_type: str,
+        criteria: List[Dict[str, Any]],
+        fields: Optional[List[str]],
+        limit: int,
+        offset: int
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """Uma página do Smart Search: (assets normalizados, total no GLPI ou None)."""
+        # forcedisplay inclui Field 7 (contact) e Field 8 (contact_num)
+        result = await self.client.search(
+            item_type=item_type,
+            search_text=None,
+            range_limit=limit,
+            range_offset=offset,
+            criteria=criteria,
+            forcedisplay=fields or [1, 2, 5, 6, 7, 8, 31, 3, 80, 70, 71, 23, 40, 19, 16, 4]
+            #                        ^name ^id ^serial ^other ^contact ^contact_num ...
+        )
 
-            return normalized_assets
-                
-        except Exception as e:
-            logger.error(f"Failed to search assets: {e}")
-            raise GLPIError(500, f"Failed to search assets: {str(e)}")
+        # Processar resultados
+        if isinstance(result, list):
+            assets, total_count = result, None
+        elif isinstance(result, dict) and "data" in result:
+            assets, total_count = result["data"], result.get("totalcount")
+        else:
+            return [], None
+
+        # Normalizar resultados (Search API: campos por ID numérico, nulos omitidos)
+        return [
+            _normalize_search_row(asset, item_type, field_map=SMART_SEARCH_FIELD_MAP)
+            for asset in assets
+        ], total_count
     
     async def get_asset_reservations(
         self,
@@ -1027,15 +1451,20 @@ class AssetService:
             else:
                 return []
             
-            # Enriquecer com dados dos usuários
+            # Enriquecer com dados dos usuários (todos os usuários distintos em lote)
+            user_ids = {_int_id(r["users_id"]) for r in reservations if r.get("users_id")} - {None}
+            try:
+                users_by_id = await self._bulk_get_users(user_ids)
+            except Exception as e:
+                logger.warning(f"Failed to get reservation users: {e}")
+                users_by_id = {}
             for reservation in reservations:
-                try:
-                    user_id = reservation.get("users_id")
-                    if user_id:
-                        user = await self.client.get_item("User", user_id, ["name", "realname", "email"])
-                        reservation["user"] = user
-                except Exception:
-                    reservation["user"] = {"name": "Unknown"}
+                if reservation.get("users_id"):
+                    user = users_by_id.get(_int_id(reservation["users_id"]))
+                    reservation["user"] = (
+                        {field: user.get(field) for field in _RESERVATION_USER_FIELDS}
+                        if user else {"name": "Unknown"}
+                    )
             
             return reservations
                 
@@ -1113,28 +1542,30 @@ class AssetService:
             else:
                 items = []
             
-            # Enriquecer com informações do item real
+            # Enriquecer com informações do item real (em paralelo, limitado por ENRICH_CONCURRENCY)
+            linked = [item for item in items if item.get("itemtype") and item.get("items_id")]
+            details = await asyncio.gather(
+                *(self._get_limited_item(item["itemtype"], item["items_id"]) for item in linked),
+                return_exceptions=True
+            )
+            details_iter = iter(details)  # Mesma ordem de linked
+            
             enriched_items = []
             for item in items:
                 enriched = dict(item)
-                
-                # Buscar informações do item associado
-                try:
-                    item_type = item.get("itemtype")
-                    items_id = item.get("items_id")
-                    if item_type and items_id:
-                        real_item = await self.client.get_item(item_type, items_id)
+                if item.get("itemtype") and item.get("items_id"):
+                    real_item = next(details_iter)
+                    if isinstance(real_item, Exception):
+                        logger.warning(f"Failed to get details for {item.get('itemtype')} {item.get('items_id')}: {real_item}")
+                        enriched["item_details"] = None
+                    else:
                         enriched["item_details"] = {
                             "id": real_item.get("id"),
                             "name": real_item.get("name"),
                             "serial": real_item.get("serial"),
                             "otherserial": real_item.get("otherserial"),
-                            "itemtype": item_type
+                            "itemtype": item["itemtype"]
                         }
-                except Exception as e:
-                    logger.warning(f"Failed to get details for {item.get('itemtype')} {item.get('items_id')}: {e}")
-                    enriched["item_details"] = None
-                
                 enriched_items.append(enriched)
             
             logger.info(f"Found {len(enriched_items)} reservable items")
@@ -1259,6 +1690,36 @@ class AssetService:
             logger.error(f"Failed to create reservation: {e}")
             raise GLPIError(500, f"Failed to create reservation: {str(e)}")
     
+    async def _iter_assets_min(
+        self,
+        item_type: str,
+        entity_id: Optional[int] = None,
+        page_size: int = 500
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Itera linhas mínimas da Search API (apenas _STATS_FIELDS), sem cache.
+        
+        Uma página por vez em memória; usado nas estatísticas.
+        """
+        criteria = [{"field": 80, "searchtype": "under", "value": entity_id}] if entity_id else None
+        offset = 0
+        while True:
+            result = await self.client.search(
+                item_type=item_type,
+                criteria=criteria,
+                forcedisplay=_STATS_FORCEDISPLAY,
+                range_limit=page_size,
+                range_offset=offset,
+                is_recursive=entity_id is not None,
+                use_cache=False
+            )
+            rows = result.get("data", []) if isinstance(result, dict) else result or []
+            for row in rows:
+                yield row
+            if len(rows) < page_size:
+                return
+            offset += page_size
+
     async def get_asset_stats(
         self,
         asset_type: Optional[str] = None,
@@ -1274,58 +1735,33 @@ class AssetService:
         Returns:
             Estatísticas detalhadas
         """
-        try:
-            # Buscar todos os assets
-            assets = await self.list_assets(
-                asset_type=asset_type,
-                entity_id=entity_id,
-                limit=1000,  # Limite alto para estatísticas
-                use_cache=False
+        item_type = asset_type or "Computer"
+        if item_type not in ASSET_TYPES:
+            raise ValidationError(
+                f"Asset type must be one of: {list(ASSET_TYPES_SAMPLE)}...",
+                "asset_type"
             )
+        
+        try:
+            # Contagem em fluxo: só os campos agregados, página a página
+            total = 0
+            counters = {key: Counter() for _, key in _STATS_FIELDS}
+            async for row in self._iter_assets_min(item_type, entity_id):
+                total += 1
+                for field, key in _STATS_FIELDS:
+                    value = row.get(field)
+                    counters[key]["unknown" if value is None else value] += 1
             
-            if not assets:
-                return {
-                    "total_assets": 0,
-                    "by_type": {},
-                    "by_status": {},
-                    "by_location": {},
-                    "by_manufacturer": {},
-                    "filters": {
-                        "asset_type": asset_type,
-                        "entity_id": entity_id
-                    }
-                }
-            
-            # Calcular estatísticas
             stats = {
-                "total_assets": len(assets),
-                "by_type": {},
-                "by_status": {},
-                "by_location": {},
-                "by_manufacturer": {},
+                "total_assets": total,
+                "by_type": {item_type: total} if total else {},
+                **{key: dict(counter) for key, counter in counters.items()},
                 "filters": {
                     "asset_type": asset_type,
                     "entity_id": entity_id
                 }
             }
             
-            for asset in assets:
-                # Por tipo
-                asset_type_name = asset.get("asset_type", "unknown")
-                stats["by_type"][asset_type_name] = stats["by_type"].get(asset_type_name, 0) + 1
-                
-                # Por status
-                status = asset.get("status", "unknown")
-                stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-                
-                # Por localização
-                location = asset.get("locations_id", "unknown")
-                stats["by_location"][location] = stats["by_location"].get(location, 0) + 1
-                
-                # Por fabricante
-                manufacturer = asset.get("manufacturers_id", "unknown")
-                stats["by_manufacturer"][manufacturer] = stats["by_manufacturer"].get(manufacturer, 0) + 1
-            
             logger.info(f"Generated asset stats: {stats['total_assets']} assets analyzed")
             return stats
             
@@ -253,7 +253,8 @@ class GLPIClient:
         forcedisplay: Optional[List[str]] = None,
         range_limit: Optional[int] = None,
         range_offset: int = 0,
-        is_recursive: bool = False
+        is_recursive: bool = False,
+        use_cache: bool = True
     ) -> Any:
         """
         Busca avançada GLPI com filtros múltiplos.
@@ -268,6 +269,7 @@ class GLPIClient:
             range_limit: Limite de resultados
             range_offset: Offset para paginação
             is_recursive: Se True, busca também nas sub-entidades (filhos)
+            use_cache: Se deve usar cache
 
         Returns:
             Resultados da busca
@@ -318,7 +320,7 @@ class GLPIClient:
         endpoint = f"/apirest.php/search/{item_type}"
 
         try:
-            result = await self.get(endpoint, params)
+            result = await self.get(endpoint, params, use_cache)
             return result
 
         except Exception as e:
@@ -392,6 +394,37 @@ class GLPIClient:
             logger.error(f"Get subitems failed for {item_type}/{item_id}/{subitem_type}: {e}")
             raise
     
+    async def get_multiple_items(
+        self,
+        items: List[tuple],
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém vários itens em uma única requisição (endpoint getMultipleItems).
+        
+        Args:
+            items: Pares (tipo, ID) a buscar
+            params: Parâmetros do getItem aplicados a todos (ex: with_devices)
+        
+        Returns:
+            Lista de itens encontrados
+        """
+        if not items:
+            return []
+        
+        query = dict(params or {})
+        for i, (item_type, item_id) in enumerate(items):
+            query[f"items[{i}][itemtype]"] = item_type
+            query[f"items[{i}][items_id]"] = item_id
+        
+        try:
+            result = await self.get("/apirest.php/getMultipleItems", query)
+            return result if isinstance(result, list) else []
+            
+        except Exception as e:
+            logger.error(f"Get multiple items failed for {len(items)} items: {e}")
+            raise
+    
     async def get_health_status(self) -> Dict[str, Any]:
         """
         Verifica status de saúde da conexão GLPI.
@@ -90,13 +90,10 @@ class AdminTools:
                 use_cache=True
             )
             
-            # Truncar resposta se necessário
-            if isinstance(users, dict) and "users" in users:
-                users["users"] = response_truncator.truncate_json_response(users["users"])
-            else:
-                users = response_truncator.truncate_json_response(users)
+            # Truncar resposta se necessário (cópia rasa: o dict pode estar no cache do serviço)
+            users = {**users, "items": response_truncator.truncate_json_response(users["items"])}
             
-            logger.info(f"list_users completed: {len(users) if isinstance(users, list) else 'paginated'} users")
+            logger.info(f"list_users completed: {len(users['items'])} users")
             return users
             
         except ValidationError as e:
@@ -449,10 +446,10 @@ class AdminTools:
                 use_cache=True
             )
             
-            # Truncar resposta se necessário
-            groups = response_truncator.truncate_json_response(groups)
+            # Truncar resposta se necessário (cópia rasa: o dict pode estar no cache do serviço)
+            groups = {**groups, "items": response_truncator.truncate_json_response(groups["items"])}
             
-            logger.info(f"list_groups completed: {len(groups) if isinstance(groups, list) else 'paginated'} groups")
+            logger.info(f"list_groups completed: {len(groups['items'])} groups")
             return groups
             
         except Exception as e:
@@ -604,10 +601,10 @@ class AdminTools:
                 use_cache=True
             )
             
-            # Truncar resposta se necessário
-            entities = response_truncator.truncate_json_response(entities)
+            # Truncar resposta se necessário (cópia rasa: o dict pode estar no cache do serviço)
+            entities = {**entities, "items": response_truncator.truncate_json_response(entities["items"])}
             
-            logger.info(f"list_entities completed: {len(entities) if isinstance(entities, list) else 'paginated'} entities")
+            logger.info(f"list_entities completed: {len(entities['items'])} entities")
             return entities
             
         except Exception as e:
@@ -700,10 +697,10 @@ class AdminTools:
                 use_cache=True
             )
             
-            # Truncar resposta se necessário
-            locations = response_truncator.truncate_json_response(locations)
+            # Truncar resposta se necessário (cópia rasa: o dict pode estar no cache do serviço)
+            locations = {**locations, "items": response_truncator.truncate_json_response(locations["items"])}
             
-            logger.info(f"list_locations completed: {len(locations) if isinstance(locations, list) else 'paginated'} locations")
+            logger.info(f"list_locations completed: {len(locations['items'])} locations")
             return locations
             
         except Exception as e:
@@ -421,7 +421,8 @@ class AssetTools:
             offset: Offset para paginação
 
         Returns:
-            Assets que correspondem à busca
+            Dict com "assets" e "pagination" (e "smart_search_warning" quando
+            o match veio de usuário deletado)
 
         Note:
             Se entity_name for fornecido, será resolvido para entity_id automaticamente.
@@ -454,7 +455,7 @@ class AssetTools:
             # Validar paginação
             offset, limit = PaginationHelper.validate_pagination_params(offset, limit)
 
-            assets = await asset_service.search_assets(
+            result = await asset_service.search_assets(
                 query=query,
                 asset_type=asset_type,
                 entity_id=entity_id,
@@ -464,10 +465,10 @@ class AssetTools:
             )
             
             # Truncar resposta se necessário
-            assets = response_truncator.truncate_json_response(assets)
+            result["assets"] = response_truncator.truncate_json_response(result["assets"])
             
-            logger.info(f"search_assets completed: {len(assets) if isinstance(assets, list) else 'paginated'} assets")
-            return assets
+            logger.info(f"search_assets completed: {len(result['assets'])} assets")
+            return result
             
         except ValidationError as e:
             logger.error(f"search_assets validation error: {e.message}")
@@ -771,7 +772,7 @@ class AssetTools:
             location_id: Filtrar por localização
             manufacturer_id: Filtrar por fabricante
             user_id: Filtrar por ID do usuário responsável
-            username: Filtrar por nome do usuário (exige user_id preferencialmente)
+            username: Filtrar por nome do usuário (login GLPI, resolvido para o ID)
             limit: Limite de resultados
             offset: Offset para paginação
 
@@ -810,7 +811,8 @@ class AssetTools:
                 username=username,
                 limit=limit,
                 offset=offset,
-                use_cache=True
+                use_cache=True,
+                enrich_computers=True
             )
             
             # Truncar resposta se necessário
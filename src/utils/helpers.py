@@ -618,7 +618,7 @@ class EntityResolver:
 
         try:
             # Buscar todas entidades
-            entities = await admin_service.list_entities(limit=500, use_cache=True)
+            entities = (await admin_service.list_entities(limit=500, use_cache=True, prefetch_next=False))["items"]
 
             # Normalizar nome para busca
             search_name = entity_name.lower().strip()
@@ -685,7 +685,7 @@ class EntityResolver:
         from src.services.admin_service import admin_service
 
         try:
-            entities = await admin_service.list_entities(limit=500, use_cache=True)
+            entities = (await admin_service.list_entities(limit=500, use_cache=True, prefetch_next=False))["items"]
             return [
                 {"id": e.get("id"), "name": e.get("name"), "completename": e.get("completename")}
                 for e in entities if isinstance(e, dict) and e.get("id")
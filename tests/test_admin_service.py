@@ -0,0 +1,541 @@
+"""
+Testes para AdminService.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.services.admin_service import AdminService
+from src.models.exceptions import NotFoundError
+
+
+@pytest.fixture
+def service():
+    """Cria AdminService com cliente GLPI mockado."""
+    admin = AdminService()
+    admin.client = AsyncMock()
+    return admin
+
+
+class TestGetUser:
+    """Testes para get_user/get_group."""
+
+    @pytest.mark.asyncio
+    async def test_get_user_fetches_subitems_concurrently(self, service):
+        """Subitens devem ser buscados em paralelo com o usuário."""
+        in_flight = 0
+        peak = 0
+
+        async def track(result):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return result
+
+        async def get_item(*args, **kwargs):
+            return await track({"id": 5, "name": "maria"})
+
+        async def get_subitems(item_type, item_id, kind):
+            return await track([{"kind": kind}])
+
+        service.client.get_item.side_effect = get_item
+        service.client.get_subitems.side_effect = get_subitems
+
+        user = await service.get_user(5)
+
+        assert peak == 4
+        assert user["groups"] == [{"kind": "Group_User"}]
+        assert user["profiles"] == [{"kind": "Profile_User"}]
+        assert user["entities"] == [{"kind": "Entity_User"}]
+
+    @pytest.mark.asyncio
+    async def test_get_user_subitem_failure_is_empty(self, service):
+        """Falha em subitem não deve invalidar o usuário."""
+        service.client.get_item.return_value = {"id": 5}
+        service.client.get_subitems.side_effect = RuntimeError("timeout")
+
+        user = await service.get_user(5)
+
+        assert user["groups"] == [] and user["profiles"] == [] and user["entities"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_user_not_found(self, service):
+        """NotFoundError do item principal deve ser propagado."""
+        service.client.get_item.side_effect = NotFoundError("User", 99)
+        service.client.get_subitems.return_value = []
+
+        with pytest.raises(NotFoundError):
+            await service.get_user(99)
+
+    @pytest.mark.asyncio
+    async def test_get_group_members(self, service):
+        """Grupo deve trazer membros buscados junto com o item."""
+        service.client.get_item.return_value = {"id": 3, "name": "Suporte N1"}
+        service.client.get_subitems.return_value = [{"users_id": 5}]
+
+        group = await service.get_group(3)
+
+        assert group["members"] == [{"users_id": 5}]
+
+
+class TestAdminCache:
+    """Testes para o cache de leituras administrativas."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_reads_hit_cache(self, service):
+        """Leituras repetidas devem ir ao GLPI apenas uma vez."""
+        service.client.get_item.return_value = {"id": 1, "name": "Matriz"}
+
+        first = await service.get_entity(1)
+        second = await service.get_entity(1)
+
+        assert first == second
+        service.client.get_item.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_refetches(self, service):
+        """use_cache=False deve forçar nova busca."""
+        service.client.get.return_value = {"data": [{"id": 1}]}
+
+        await service.list_entities()
+        await service.list_entities(use_cache=False)
+
+        assert service.client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_on_failure(self, service):
+        """Com o GLPI fora do ar, a última resposta boa deve ser devolvida."""
+        service.client.get.return_value = {"data": [{"id": 1}]}
+        first = await service.list_locations()
+
+        service.client.get.side_effect = RuntimeError("GLPI indisponível")
+        second = await service.list_locations(use_cache=False)
+
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_stale_ok_false_raises(self, service):
+        """stale_ok=False deve propagar a falha mesmo com entrada em cache."""
+        from src.models.exceptions import GLPIError
+
+        service.client.get.return_value = {"data": [{"id": 1}]}
+        await service.list_entities()
+
+        service.client.get.side_effect = RuntimeError("GLPI indisponível")
+        with pytest.raises(GLPIError):
+            await service.list_entities(use_cache=False, stale_ok=False)
+
+    @pytest.mark.asyncio
+    async def test_stale_fallback_is_opt_in(self, service):
+        """Leituras sem stale_fallback (ex.: usuários) devem propagar a falha."""
+        from src.models.exceptions import GLPIError
+
+        service.client.get.return_value = {"data": [{"id": 1}]}
+        await service.list_users()
+
+        service.client.get.side_effect = RuntimeError("GLPI indisponível")
+        with pytest.raises(GLPIError):
+            await service.list_users(use_cache=False)
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_not_served_stale(self, service):
+        """Falha de permissão não deve ser mascarada por cache expirado."""
+        from src.models.exceptions import GLPIError
+
+        service.client.get.return_value = {"data": [{"id": 1}]}
+        await service.list_groups()
+
+        service.client.get.side_effect = GLPIError(403, "Permission denied")
+        with pytest.raises(GLPIError):
+            await service.list_groups(use_cache=False)
+
+    @pytest.mark.asyncio
+    async def test_failure_without_cache_raises(self, service):
+        """Sem entrada em cache, a falha deve ser propagada."""
+        from src.models.exceptions import GLPIError
+
+        service.client.get.side_effect = RuntimeError("GLPI indisponível")
+
+        with pytest.raises(GLPIError):
+            await service.list_locations()
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_user_reads(self, service):
+        """Atualização deve descartar leituras em cache do usuário."""
+        service.client.get_item.return_value = {"id": 5, "name": "maria"}
+        service.client.get_subitems.return_value = []
+
+        await service.get_user(5)
+        await service.update_user(5, phone="1234")
+        await service.get_user(5)
+
+        # Leitura inicial (reaproveitada pela validação do update) + releitura após invalidar
+        assert service.client.get_item.await_count == 2
+
+
+class TestWriteResponses:
+    """Testes para respostas de criação/atualização sem releitura."""
+
+    @pytest.mark.asyncio
+    async def test_create_user_returns_payload_without_refetch(self, service):
+        """Criação deve responder com o payload enviado, sem senha nem nova busca."""
+        service.client.post.return_value = {"id": 42}
+
+        user = await service.create_user(
+            name=" maria ", password="s3cret", email="maria@empresa.com.br", group_id=7
+        )
+
+        assert user["id"] == 42
+        assert user["name"] == "maria"
+        assert "password" not in user and "password2" not in user
+        assert user["groups"] == [{"users_id": 42, "groups_id": 7}]
+        service.client.get_item.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_user_expand_refetches(self, service):
+        """expand=True deve reler o usuário completo."""
+        service.client.post.return_value = {"id": 42}
+        service.client.get_item.return_value = {"id": 42, "name": "maria", "date_creation": "2024-05-02"}
+        service.client.get_subitems.return_value = []
+
+        user = await service.create_user(name="maria", expand=True)
+
+        assert user["date_creation"] == "2024-05-02"
+
+    @pytest.mark.asyncio
+    async def test_update_group_merges_cached_fields(self, service):
+        """Atualização deve mesclar os campos enviados ao grupo já em cache."""
+        service.client.get_item.return_value = {"id": 3, "name": "Suporte", "comment": "antigo"}
+        service.client.get_subitems.return_value = []
+        await service.get_group(3)
+
+        group = await service.update_group(3, comment="novo")
+
+        assert group["name"] == "Suporte"
+        assert group["comment"] == "novo"
+        service.client.get_item.assert_awaited_once()
+
+
+class TestOptimisticWrites:
+    """Testes para escrita sem verificação prévia de existência."""
+
+    @pytest.mark.asyncio
+    async def test_update_user_skips_precheck(self, service):
+        """Sem strict, update_user deve fazer apenas o PUT."""
+        user = await service.update_user(5, phone="1234")
+
+        assert user == {"id": 5, "phone": "1234"}
+        service.client.get_item.assert_not_called()
+        service.client.put.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_group_maps_404(self, service):
+        """404 do GLPI deve virar NotFoundError."""
+        from src.models.exceptions import GLPIError
+
+        service.client.delete.side_effect = GLPIError(404, "Endpoint not found")
+
+        with pytest.raises(NotFoundError):
+            await service.delete_group(99)
+
+    @pytest.mark.asyncio
+    async def test_strict_validates_first(self, service):
+        """strict=True deve manter a verificação prévia."""
+        service.client.get_item.side_effect = NotFoundError("User", 99)
+        service.client.get_subitems.return_value = []
+
+        with pytest.raises(NotFoundError):
+            await service.delete_user(99, strict=True)
+        service.client.put.assert_not_called()
+
+
+class TestAdminBundle:
+    """Testes para list_admin_bundle."""
+
+    @pytest.mark.asyncio
+    async def test_bundle_reports_section_errors(self, service):
+        """Falha em uma seção não deve derrubar as demais."""
+        async def get(endpoint, params, use_cache):
+            if endpoint.endswith("/Location"):
+                raise RuntimeError("timeout")
+            return {"data": [{"id": 1}]}
+
+        service.client.get.side_effect = get
+
+        bundle = await service.list_admin_bundle(entity_id=2)
+
+        assert bundle["groups"]["items"] == [{"id": 1}]
+        assert bundle["entities"]["items"] == [{"id": 1}]
+        assert bundle["locations"]["items"] == []
+        assert "locations" in bundle["errors"]
+        assert service.client.get.await_count == 4
+
+    def test_build_params_omits_empty_criteria(self):
+        """Sem filtros, params não deve conter criteria."""
+        criteria = AdminService._build_criteria(
+            AdminService._ENTITY_FILTER_SPEC, {"parent_entity_id": None, "is_recursive": None}
+        )
+        params = AdminService._build_params(0, 10, ("id",), criteria)
+
+        assert params == {"range": "0-9", "forcedisplay": ("id",)}
+
+    @pytest.mark.asyncio
+    async def test_list_users_criteria(self, service):
+        """IDs 0/None são ignorados; flags entram sempre que informadas."""
+        service.client.get.return_value = {"data": []}
+
+        await service.list_users(entity_id=0, group_id=4, is_active=True)
+
+        params = service.client.get.await_args.args[1]
+        assert params["criteria"] == [
+            {"field": "groups_id", "searchtype": "equals", "value": 4},
+            {"field": "is_active", "searchtype": "equals", "value": 1},
+            {"field": "is_deleted", "searchtype": "equals", "value": 0},
+        ]
+
+
+class TestListShape:
+    """Testes para o formato padrão das respostas list_*."""
+
+    @pytest.mark.asyncio
+    async def test_list_groups_uses_count(self, service):
+        """"count" do GLPI deve alimentar total e has_more, sem poluir os itens."""
+        service.client.get.return_value = {"data": [{"id": 1}, {"id": 2}], "count": 7}
+
+        groups = await service.list_groups(limit=2, offset=2, prefetch_next=False)
+
+        assert groups["items"] == [{"id": 1}, {"id": 2}]
+        assert groups["pagination"] == {"total": 7, "offset": 2, "limit": 2, "has_more": True}
+
+    def test_unwrap_plain_list(self):
+        """Resposta em lista não traz total."""
+        assert AdminService._unwrap([{"id": 1}]) == ([{"id": 1}], None)
+        assert AdminService._unwrap(None) == ([], None)
+
+    @pytest.mark.asyncio
+    async def test_admin_stats_counts_items(self, service):
+        """Estatísticas devem contar os itens das respostas paginadas."""
+        async def get(endpoint, params, use_cache):
+            if endpoint.endswith("/User"):
+                return {"data": [{"id": 1, "is_active": 1}, {"id": 2, "is_active": 0}]}
+            return {"data": [{"id": 1, "is_user_group": 1}]}
+
+        service.client.get.side_effect = get
+
+        stats = await service.get_admin_stats()
+
+        assert stats["total_users"] == 2
+        assert stats["active_users"] == 1
+        assert stats["user_groups"] == 1
+
+    @pytest.mark.asyncio
+    async def test_admin_stats_fetches_in_parallel(self, service):
+        """As quatro listagens devem sair juntas; falha parcial vira "errors"."""
+        in_flight = 0
+        peak = 0
+
+        async def get(endpoint, params, use_cache):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if endpoint.endswith("/Entity"):
+                raise RuntimeError("timeout")
+            return {"data": [{"id": 1}]}
+
+        service.client.get.side_effect = get
+
+        stats = await service.get_admin_stats(entity_id=2)
+
+        assert peak == 4
+        assert stats["total_entities"] == 0 and stats["total_locations"] == 1
+        assert "entities" in stats["errors"]
+
+
+class TestPrefetch:
+    """Testes para busca antecipada da próxima página."""
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_prefetched(self, service):
+        """Página cheia deve disparar a busca da seguinte, servida depois do cache."""
+        async def get(endpoint, params, use_cache):
+            return {"data": [{"id": 1}, {"id": 2}], "count": 10}
+
+        service.client.get.side_effect = get
+
+        await service.list_users(entity_id=3, limit=2)
+        await asyncio.gather(*service._prefetch_tasks)
+        await service.list_users(entity_id=3, limit=2, offset=2)
+        await asyncio.gather(*service._prefetch_tasks)
+
+        # Página 2 veio do cache e disparou a antecipação da página 3
+        ranges = [call.args[1]["range"] for call in service.client.get.await_args_list]
+        assert ranges == ["0-1", "2-3", "4-5"]
+
+    @pytest.mark.asyncio
+    async def test_last_page_is_not_prefetched(self, service):
+        """Sem mais páginas, nada deve ser agendado."""
+        service.client.get.return_value = {"data": [{"id": 1}], "count": 1}
+
+        await service.list_groups(limit=2)
+
+        assert not service._prefetch_tasks
+        service.client.get.assert_awaited_once()
+
+
+class TestBulkOperations:
+    """Testes para operações em lote."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_users_bounded_and_ordered(self, service):
+        """Lote deve respeitar o limite de concorrência e a ordem de entrada."""
+        in_flight = 0
+        peak = 0
+
+        async def post(endpoint, payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"id": len(payload["name"])}
+
+        service.client.post.side_effect = post
+        items = [{"name": "u" * n} for n in range(2, 8)]
+
+        results = await service.bulk_create_users(items, concurrency=2)
+
+        assert peak <= 2
+        assert [r["id"] for r in results] == list(range(2, 8))
+
+    @pytest.mark.asyncio
+    async def test_service_semaphore_caps_calls(self, service):
+        """O semáforo do serviço deve limitar chamadas mesmo com lote maior."""
+        in_flight = 0
+        peak = 0
+
+        async def post(endpoint, payload):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"id": 1}
+
+        service._sem = asyncio.Semaphore(3)
+        service.client.post.side_effect = post
+
+        await service.bulk_create_groups([{"name": f"g{n}"} for n in range(10)], concurrency=10)
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_failures_are_reported_per_item(self, service):
+        """Falha de um item não deve interromper o lote."""
+        service.client.post.return_value = {"id": 9}
+
+        results = await service.bulk_create_groups([{"name": "x"}, {"name": "Suporte"}])
+
+        assert results[0]["input"] == {"name": "x"}
+        assert "error" in results[0]
+        assert results[1]["name"] == "Suporte"
+
+    @pytest.mark.asyncio
+    async def test_bulk_delete_users(self, service):
+        """Exclusão em lote deve repassar purge para cada usuário."""
+        results = await service.bulk_delete_users([1, 2], purge=True)
+
+        assert results == [True, True]
+        assert service.client.delete.await_count == 2
+
+
+class TestCacheSync:
+    """Testes para descarte pontual de leituras em cache."""
+
+    @pytest.mark.asyncio
+    async def test_update_user_keeps_other_users_cached(self, service):
+        """Atualizar um usuário não deve descartar o cache de outros usuários."""
+        service.client.get_item.side_effect = lambda item_type, item_id, **kw: {"id": item_id}
+        service.client.get_subitems.return_value = []
+
+        await service.get_user(1)
+        await service.get_user(2)
+        await service.update_user(1, phone="1234")
+        await service.get_user(1)
+        await service.get_user(2)
+
+        fetched = [call.args[1] for call in service.client.get_item.await_args_list]
+        assert fetched == [1, 2, 1]
+
+
+class TestIterUsers:
+    """Testes para iteração paginada de usuários."""
+
+    @pytest.mark.asyncio
+    async def test_iter_users_pages_lazily(self, service):
+        """Páginas devem ser buscadas sob demanda e parar na última."""
+        pages = {"0-1": [{"id": 1}, {"id": 2}], "2-3": [{"id": 3}]}
+
+        async def get(endpoint, params, use_cache):
+            return {"data": pages.get(params["range"], [])}
+
+        service.client.get.side_effect = get
+
+        users = [u["id"] async for u in service.iter_users(page_size=2, entity_id=3)]
+
+        assert users == [1, 2, 3]
+        assert service.client.get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_users_early_exit(self, service):
+        """Interromper a iteração não deve buscar a próxima página."""
+        service.client.get.return_value = {"data": [{"id": 1}, {"id": 2}]}
+
+        async for user in service.iter_users(page_size=2):
+            break
+
+        service.client.get.assert_awaited_once()
+
+
+class TestCreatePayloads:
+    """Testes para montagem de payloads de criação."""
+
+    @pytest.mark.asyncio
+    async def test_create_location_payload(self, service):
+        """Textos devem ser aparados e campos vazios omitidos."""
+        service.client.post.return_value = {"id": 8}
+
+        await service.create_location(
+            name=" Sala 12 ", entity_id=2, parent_location_id=0, building=" Bloco A ", room=""
+        )
+
+        payload = service.client.post.await_args.args[1]
+        assert payload == {"name": "Sala 12", "entities_id": 2, "building": "Bloco A"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("email", ["maria", "maria@", "maria@empresa", "ma ria@empresa.com"])
+    async def test_create_user_rejects_malformed_email(self, service, email):
+        """E-mails sem domínio completo devem ser rejeitados antes do POST."""
+        from src.models.exceptions import ValidationError
+
+        with pytest.raises(ValidationError):
+            await service.create_user(name="maria", email=email)
+        service.client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_group_name_with_spaces(self, service):
+        """Nome curto após aparar é rejeitado; nomes compostos são aceitos."""
+        from src.models.exceptions import ValidationError
+
+        service.client.post.return_value = {"id": 3}
+
+        with pytest.raises(ValidationError):
+            await service.create_group(name="  x  ")
+        group = await service.create_group(name=" A Team ")
+
+        assert group["name"] == "A Team"
@@ -0,0 +1,198 @@
+"""
+Testes para AIJobStore e AIIntegrationService.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.services import ai_integration as ai_module
+from src.services.ai_integration import AIJob, AIJobStore, AIIntegrationService
+
+
+class FakeClock:
+    """Relógio controlável para testar expiração."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Substitui o relógio usado pelo job store."""
+    fake = FakeClock()
+    monkeypatch.setattr(ai_module.time, "monotonic", fake)
+    return fake
+
+
+@pytest_asyncio.fixture
+async def service():
+    """AIIntegrationService encerrado ao fim do teste."""
+    ai_service = AIIntegrationService()
+    yield ai_service
+    await ai_service.close()
+
+
+class TestAIJobStore:
+    """Testes para o armazenamento de jobs com TTL."""
+
+    def test_get_returns_valid_job(self, clock):
+        """Job dentro do TTL deve ser retornado."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {"status": "queued"})
+
+        clock.now += 59
+
+        assert store.get("a") == {"status": "queued"}
+
+    def test_get_expired_job(self, clock):
+        """Job após o TTL deve ser descartado."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {"status": "queued"})
+
+        clock.now += 61
+
+        assert store.get("a") is None
+        assert len(store._jobs) == 0
+
+    def test_cleanup_stops_at_first_valid(self, clock):
+        """Limpeza deve remover apenas os jobs expirados do início da fila."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {})
+        clock.now += 30
+        store.set("b", {})
+        clock.now += 40
+
+        assert store.cleanup_expired() == 1
+        assert list(store._jobs) == ["b"]
+
+    def test_cleanup_all_expired(self, clock):
+        """Com todos os jobs expirados, a limpeza deve esvaziar o store."""
+        store = AIJobStore(ttl_seconds=60)
+        for n in range(5):
+            store.set(str(n), {})
+        clock.now += 61
+
+        assert store.cleanup_expired() == 5
+        assert not store._jobs
+
+    def test_set_refreshes_expiry(self, clock):
+        """Regravar um job deve renovar o TTL e movê-lo para o fim da fila."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {})
+        store.set("b", {})
+        clock.now += 30
+        store.set("a", {"status": "done"})
+        clock.now += 40
+
+        assert store.cleanup_expired() == 1
+        assert store.get("a") == {"status": "done"}
+
+    def test_delete(self, clock):
+        """delete deve indicar se o job existia."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {})
+
+        assert store.delete("a")
+        assert not store.delete("a")
+
+    def test_maxsize_evicts_oldest(self, clock):
+        """Store cheio deve descartar o job mais antigo."""
+        store = AIJobStore(ttl_seconds=60, maxsize=2)
+        store.set("a", {})
+        store.set("b", {})
+        store.set("a", {"status": "done"})
+        store.set("c", {})
+
+        assert list(store._jobs) == ["a", "c"]
+
+    def test_update_data_keeps_expiry(self, clock):
+        """update_data não deve renovar o TTL do job."""
+        store = AIJobStore(ttl_seconds=60)
+        job = AIJob(ticket_id=1, status="queued", created_at=0.0)
+        store.set("a", job)
+        clock.now += 30
+
+        assert store.update_data("a", {"status": "completed"})
+        assert job.status == "completed"
+        clock.now += 31
+
+        assert store.get("a") is None
+        assert not store.update_data("a", {})
+
+    def test_wall_clock_jump_does_not_expire(self, clock, monkeypatch):
+        """Ajuste do relógio de parede não deve afetar o TTL."""
+        store = AIJobStore(ttl_seconds=60)
+        store.set("a", {})
+
+        monkeypatch.setattr(ai_module.time, "time", lambda: 10 ** 10)
+
+        assert store.get("a") == {}
+
+
+class TestAIIntegrationService:
+    """Testes para o fluxo de análise IA."""
+
+    @pytest.mark.asyncio
+    async def test_trigger_without_agents(self, service):
+        """Sem agentes, o job deve ficar como no_agents_configured."""
+
+        job_id = await service.trigger_analysis(10)
+        job = await service.get_analysis_result(job_id)
+
+        assert job_id.startswith("ai_job_") and len(job_id) == len("ai_job_") + 12
+        assert job == {
+            "ticket_id": 10,
+            "status": "no_agents_configured",
+            "created_at": job["created_at"],
+            "result": None
+        }
+
+    @pytest.mark.asyncio
+    async def test_trigger_with_agents_is_queued(self, service):
+        """Com agentes configurados, o job deve ser gravado uma vez como queued."""
+        service.configure_agents(["triage"])
+        writes = []
+        original_set = service.job_store.set
+        service.job_store.set = lambda job_id, data: (writes.append(job_id), original_set(job_id, data))
+
+        job_id = await service.trigger_analysis(10)
+
+        assert writes == [job_id]
+        assert (await service.get_analysis_result(job_id))["status"] == "queued"
+
+    @pytest.mark.asyncio
+    async def test_publish_response(self, service):
+        """Publicar resposta deve completar o job."""
+        job_id = await service.trigger_analysis(10)
+
+        assert await service.publish_ai_response(job_id, {"summary": "ok"})
+        job = await service.get_analysis_result(job_id)
+
+        assert job["status"] == "completed"
+        assert job["result"] == {"summary": "ok"}
+        assert "completed_at" in job
+
+    @pytest.mark.asyncio
+    async def test_publish_unknown_job(self, service):
+        """Job inexistente não deve ser publicado."""
+
+        assert not await service.publish_ai_response("ai_job_missing", {})
+
+    @pytest.mark.asyncio
+    async def test_cleanup_task_lifecycle(self, service):
+        """Limpeza periódica deve iniciar no trigger e parar no close."""
+        service.job_store = AIJobStore(ttl_seconds=0.004)
+        service.job_store.set("velho", {})
+
+        await service.trigger_analysis(10)
+        task = service._cleanup_task
+        await asyncio.sleep(0.02)
+
+        assert "velho" not in service.job_store._jobs
+        await service.close()
+        assert task.cancelled() and service._cleanup_task is None
@@ -0,0 +1,639 @@
+"""
+Testes para AssetService (listagem, enriquecimento e CRUD de assets).
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.models.exceptions import ValidationError
+from src.services.asset_service import AssetService, ASSET_TYPES, _normalize_search_row
+
+
+@pytest.fixture
+def service():
+    """Cria AssetService com cliente GLPI mockado."""
+    asset_service = AssetService()
+    asset_service.client = AsyncMock()
+    return asset_service
+
+
+def test_asset_types_is_frozen_lookup():
+    assert "Computer" in ASSET_TYPES
+    assert isinstance(ASSET_TYPES, frozenset)
+
+
+@pytest.mark.asyncio
+async def test_list_assets_rejects_unknown_type(service):
+    with pytest.raises(ValidationError) as exc:
+        await service.list_assets(asset_type="Spaceship")
+    assert "Computer" in exc.value.message
+    service.client.get.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_enrich_computers_batches_lookups(service):
+    async def get_multiple_items(items, params=None):
+        item_type = items[0][0] if items else None
+        if item_type == "Computer":
+            return [
+                {
+                    "id": cid,
+                    "users_id": 7,
+                    "last_inventory_update": "2024-05-02",
+                    "_devices": {
+                        "Item_DeviceProcessor": {"1": {"deviceprocessors_id": 3, "frequency": 2400}},
+                        "Item_DeviceMemory": {"1": {"size": 8192}, "2": {"size": 8192}},
+                    },
+                }
+                for _, cid in items
+            ]
+        if item_type == "User":
+            return [{"id": 7, "name": "maria", "firstname": "Maria", "realname": "Silva", "is_deleted": 0}]
+        if item_type == "DeviceProcessor":
+            return [{"id": 3, "designation": "Intel Core i5"}]
+        return []
+
+    service.client.get_multiple_items.side_effect = get_multiple_items
+    service.client.get_subitems.return_value = [{"type": "AnyDesk", "remoteid": "123 456"}]
+
+    computers = await service._enrich_computers([{"id": 1}, {"id": "2"}])
+
+    assert service.client.get_multiple_items.await_count == 3
+    assert service.client.get_subitems.await_count == 2
+    assert computers[1]["cpu_info"] == "1x Intel Core i5 @ 2400MHz"
+    assert computers[1]["memory_info"] == "16.0 GB"
+    assert computers[0]["anydesk_id"] == "123 456"
+    assert computers[0]["user_info"]["fullname"] == "Maria Silva"
+
+
+@pytest.mark.asyncio
+async def test_enrich_computers_survives_batch_failure(service):
+    service.client.get_multiple_items.side_effect = RuntimeError("timeout")
+    service.client.get_subitems.return_value = []
+
+    computers = await service._enrich_computers([{"id": 1, "name": "pc-01"}])
+
+    assert computers == [{"id": 1, "name": "pc-01", "anydesk_id": "N/A", "cpu_info": "N/A", "memory_info": "N/A"}]
+
+
+@pytest.mark.asyncio
+async def test_list_assets_normalizes_search_rows(service):
+    service.client.search.return_value = {
+        "totalcount": 1,
+        "data": [{"2": 10, "1": "mon-01", "5": "SN1", "3": None, "31": 0}],
+    }
+
+    assets = await service.list_assets(asset_type="Monitor", entity_id=1)
+
+    assert assets == [
+        {"id": 10, "name": "mon-01", "serial": "SN1", "states_id": 0, "asset_type": "Monitor"}
+    ]
+
+
+def test_normalize_row_by_field_name():
+    row = _normalize_search_row({"id": 3, "name": "pc-03", "2": 99}, "Computer", numeric=False)
+
+    assert row == {"id": 3, "name": "pc-03", "asset_type": "Computer"}
+
+
+@pytest.mark.asyncio
+async def test_enrich_computers_bounds_remote_fetches(service):
+    service._enrich_sem = asyncio.Semaphore(2)
+    in_flight = peak = 0
+
+    async def get_subitems(item_type, item_id, subtype, params=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return []
+
+    service.client.get_multiple_items.return_value = []
+    service.client.get_subitems.side_effect = get_subitems
+
+    await service._enrich_computers([{"id": cid} for cid in range(1, 9)])
+
+    assert service.client.get_subitems.await_count == 8
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_list_assets_skips_enrichment_by_default(service):
+    service.client.get.return_value = [{"id": 1, "name": "pc-01"}]
+
+    assets = await service.list_assets(asset_type="Computer")
+
+    assert assets == [{"id": 1, "name": "pc-01", "asset_type": "Computer"}]
+    service.client.get_multiple_items.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_list_assets_enriches_only_requested_fields(service):
+    service.client.get.return_value = [{"id": 1, "name": "pc-01"}]
+    service.client.get_multiple_items.return_value = [
+        {"id": 1, "_devices": {"Item_DeviceMemory": {"1": {"size": 4096}}}}
+    ]
+
+    assets = await service.list_assets(
+        asset_type="Computer", enrich_computers=True, enrich_fields={"memory"}
+    )
+
+    assert assets[0]["memory_info"] == "4.0 GB"
+    assert "anydesk_id" not in assets[0] and "cpu_info" not in assets[0]
+    service.client.get_subitems.assert_not_called()
+    requested = [c.args[0] for c in service.client.get_multiple_items.await_args_list if c.args[0]]
+    assert requested == [[("Computer", 1)]]
+
+
+@pytest.mark.asyncio
+async def test_list_assets_rejects_unknown_enrich_field(service):
+    with pytest.raises(ValidationError):
+        await service.list_assets(asset_type="Computer", enrich_computers=True, enrich_fields={"gpu"})
+
+
+@pytest.mark.asyncio
+async def test_enrich_computers_reuses_cache_until_date_mod_changes(service):
+    service.client.get_multiple_items.return_value = [
+        {"id": 1, "_devices": {"Item_DeviceMemory": {"1": {"size": 2048}}}}
+    ]
+    service.client.get_subitems.return_value = []
+
+    first = await service._enrich_computers([{"id": 1, "date_mod": "2024-05-01 10:00:00"}])
+    again = await service._enrich_computers([{"id": 1, "date_mod": "2024-05-01 10:00:00"}])
+
+    assert again == first
+    assert again[0]["memory_info"] == "2.0 GB"
+    assert service.client.get_subitems.await_count == 1
+
+    await service._enrich_computers([{"id": 1, "date_mod": "2024-05-02 08:00:00"}])
+
+    assert service.client.get_subitems.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_enrich_computers_does_not_cache_failed_lookups(service):
+    service.client.get_multiple_items.side_effect = RuntimeError("timeout")
+    service.client.get_subitems.return_value = []
+
+    await service._enrich_computers([{"id": 1, "date_mod": "2024-05-01 10:00:00"}])
+    await service._enrich_computers([{"id": 1, "date_mod": "2024-05-01 10:00:00"}])
+
+    assert service.client.get_subitems.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_enrichment_shares_inflight_requests(service):
+    release = asyncio.Event()
+
+    async def get_multiple_items(items, params=None):
+        await release.wait()
+        return []
+
+    async def get_subitems(item_type, item_id, subtype, params=None):
+        await release.wait()
+        return []
+
+    service.client.get_multiple_items.side_effect = get_multiple_items
+    service.client.get_subitems.side_effect = get_subitems
+
+    pending = asyncio.gather(
+        service._enrich_computers([{"id": 1}, {"id": 2}]),
+        service._enrich_computers([{"id": 1}, {"id": 2}]),
+    )
+    for _ in range(5):
+        await asyncio.sleep(0)
+    release.set()
+    await pending
+
+    assert service.client.get_multiple_items.await_count == 1
+    assert service.client.get_subitems.await_count == 2
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_waiters(service):
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    first = asyncio.ensure_future(service._single_flight("key", failing))
+    second = asyncio.ensure_future(service._single_flight("key", failing))
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(first, second, return_exceptions=True)
+
+    assert [str(r) for r in results] == ["boom", "boom"]
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_waiter_retries_after_leader_cancelled(service):
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await release.wait()
+        return len(calls)
+
+    first = asyncio.ensure_future(service._single_flight("key", fetch))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(service._single_flight("key", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second == 2
+    assert first.cancelled()
+    assert service._inflight == {}
+
+
+def test_apply_memory_skips_invalid_sizes():
+    comp = {}
+    details = {"_devices": {"Item_DeviceMemory": [{"size": "4096"}, {"size": None}, {"size": "n/a"}, {}, {"size": 512}]}}
+
+    AssetService._apply_memory(comp, details)
+
+    assert comp["memory_info"] == "4.5 GB"
+
+
+@pytest.mark.parametrize("remotes, expected", [
+    ([{"type": "TeamViewer", "remoteid": "tv"}, {"type": "AnyDesk", "remoteid": "ad"}], "ad"),
+    ([{"type": "RDP", "remoteid": "rdp"}, {"type": "TEAMVIEWER", "remoteid": "tv"}], "tv"),
+    ([{"type": "", "remoteid": "first"}, {"type": "", "remoteid": "second"}], "first"),
+    ([], "N/A"),
+    (RuntimeError("timeout"), "N/A"),
+])
+def test_apply_anydesk_priority(remotes, expected):
+    comp = {}
+
+    AssetService._apply_anydesk(comp, remotes)
+
+    assert comp["anydesk_id"] == expected
+
+
+@pytest.mark.asyncio
+async def test_get_asset_fetches_components_concurrently(service):
+    release = asyncio.Event()
+    started = []
+
+    async def get_subitems(item_type, item_id, subtype, params=None):
+        started.append(subtype)
+        await release.wait()
+        if subtype == "Item_DeviceHardDrive":
+            raise RuntimeError("timeout")
+        return [{"subtype": subtype}]
+
+    service.client.get_item.return_value = {"id": 5, "name": "pc-05"}
+    service.client.get_subitems.side_effect = get_subitems
+
+    task = asyncio.ensure_future(service.get_asset("Computer", 5))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert len(started) == 8
+    release.set()
+    asset = await task
+
+    assert asset["disks"] == []
+    assert asset["memory"] == [{"subtype": "Item_DeviceMemory"}]
+    assert asset["history"] == [{"subtype": "Log"}]
+
+
+@pytest.mark.asyncio
+async def test_get_asset_only_fetches_history_for_other_types(service):
+    service.client.get_item.return_value = {"id": 9}
+    service.client.get_subitems.return_value = []
+
+    asset = await service.get_asset("Monitor", 9)
+
+    assert asset == {"id": 9, "asset_type": "Monitor", "history": []}
+    service.client.get_subitems.assert_awaited_once_with("Monitor", 9, "Log")
+
+
+@pytest.mark.asyncio
+async def test_create_asset_returns_payload_without_refetch(service):
+    service.client.post.return_value = {"id": 42, "message": ""}
+
+    asset = await service.create_asset("Monitor", " mon-42 ", serial_number="SN42", location_id=3)
+
+    assert asset == {
+        "name": "mon-42", "entities_id": 0, "serial": "SN42", "locations_id": 3,
+        "id": 42, "asset_type": "Monitor",
+    }
+    service.client.get_item.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_asset_merges_changes_into_current_asset(service):
+    service.client.get_item.return_value = {"id": 9, "name": "old", "serial": "S9"}
+    service.client.get_subitems.return_value = []
+
+    asset = await service.update_asset("Monitor", 9, name="new", date_mod="ignored")
+
+    assert asset["name"] == "new" and asset["serial"] == "S9"
+    service.client.put.assert_awaited_once_with("/apirest.php/Monitor/9", {"name": "new"})
+    assert service.client.get_item.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_assets_pages_lazily(service):
+    service.client.search.side_effect = [
+        {"totalcount": 3, "data": [{"2": 1}, {"2": 2}]},
+        {"totalcount": 3, "data": [{"2": 3}]},
+    ]
+
+    ids = [asset["id"] async for asset in service.iter_assets(page_size=2, asset_type="Monitor", entity_id=4)]
+
+    assert ids == [1, 2, 3]
+    offsets = [c.kwargs["range_offset"] for c in service.client.search.await_args_list]
+    assert offsets == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_iter_assets_early_exit(service):
+    service.client.get.return_value = [{"id": 1}, {"id": 2}]
+
+    async for asset in service.iter_assets(page_size=2, asset_type="Monitor"):
+        break
+
+    assert service.client.get.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_list_assets_builds_criteria_for_given_filters(service):
+    service.client.search.return_value = {"totalcount": 0, "data": []}
+
+    await service.list_assets(asset_type="Monitor", entity_id=5, model_id=7, is_template=False)
+
+    criteria = service.client.search.await_args.kwargs["criteria"]
+    assert criteria == [
+        {"field": 80, "searchtype": "under", "value": 5},
+        {"field": 40, "searchtype": "equals", "value": 7},
+        {"field": 47, "searchtype": "equals", "value": 0},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_assets_resolves_username_once(service):
+    async def search(item_type, **kwargs):
+        if item_type == "User":
+            return {"totalcount": 1, "data": [{"2": "15"}]}
+        return {"totalcount": 1, "data": [{"2": 3, "70": 15}]}
+
+    service.client.search.side_effect = search
+
+    for _ in range(2):
+        assets = await service.list_assets(asset_type="Monitor", username="maria")
+
+    assert assets == [{"id": 3, "users_id": 15, "asset_type": "Monitor"}]
+    user_lookups = [c for c in service.client.search.await_args_list if c.kwargs["item_type"] == "User"]
+    assert len(user_lookups) == 1
+    assert service.client.search.await_args.kwargs["criteria"] == [{"field": 70, "searchtype": "equals", "value": 15}]
+
+
+@pytest.mark.asyncio
+async def test_list_assets_unknown_username_returns_nothing(service):
+    service.client.search.return_value = {"totalcount": 0, "data": []}
+
+    assert await service.list_assets(asset_type="Computer", username="ghost") == []
+    assert service._username_cache == {}
+
+
+@pytest.mark.asyncio
+async def test_get_asset_reservations_batches_users(service):
+    service.client.get.return_value = [
+        {"id": 1, "users_id": 7}, {"id": 2, "users_id": "7"}, {"id": 3, "users_id": 8}, {"id": 4, "users_id": 0},
+    ]
+    service.client.get_multiple_items.return_value = [
+        {"id": 7, "name": "maria", "realname": "Silva", "email": "m@x.com", "password": "x"}
+    ]
+
+    reservations = await service.get_asset_reservations("Computer", 5)
+
+    service.client.get_multiple_items.assert_awaited_once_with([("User", 7), ("User", 8)], params=None)
+    maria = {"id": 7, "name": "maria", "realname": "Silva", "email": "m@x.com"}
+    assert [r.get("user") for r in reservations] == [maria, maria, {"name": "Unknown"}, None]
+
+
+@pytest.mark.asyncio
+async def test_get_batch_splits_large_requests(service):
+    service.client.get_multiple_items.side_effect = lambda items, params=None: [
+        {"id": item_id} for _, item_id in items
+    ]
+
+    users = await service._bulk_get_users(set(range(1, 121)))
+
+    assert sorted(users) == list(range(1, 121))
+    sizes = [len(c.args[0]) for c in service.client.get_multiple_items.await_args_list]
+    assert sizes == [50, 50, 20]
+
+
+@pytest.mark.asyncio
+async def test_list_reservable_items_fetches_details_concurrently(service):
+    service._enrich_sem = asyncio.Semaphore(2)
+    in_flight = peak = 0
+    service.client.get.return_value = [
+        {"id": 1, "itemtype": "Computer", "items_id": 10},
+        {"id": 2, "itemtype": "Monitor", "items_id": 20},
+        {"id": 3, "itemtype": "Computer", "items_id": 30},
+        {"id": 4},
+    ]
+
+    async def get_item(item_type, item_id, forcedisplay=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if item_id == 20:
+            raise RuntimeError("gone")
+        return {"id": item_id, "name": f"item-{item_id}"}
+
+    service.client.get_item.side_effect = get_item
+
+    result = await service.list_reservable_items()
+
+    items = result["reservable_items"]
+    assert peak == 2
+    assert items[0]["item_details"]["name"] == "item-10"
+    assert items[1]["item_details"] is None
+    assert items[2]["item_details"]["itemtype"] == "Computer"
+    assert "item_details" not in items[3]
+
+
+@pytest.mark.asyncio
+async def test_bulk_get_users_reuses_cached_profiles(service):
+    service.client.get_multiple_items.side_effect = lambda items, params=None: [
+        {"id": item_id, "name": f"user-{item_id}"} for _, item_id in items
+    ]
+
+    await service._bulk_get_users({1, 2})
+    users = await service._bulk_get_users({2, 3})
+
+    assert users == {2: {"id": 2, "name": "user-2"}, 3: {"id": 3, "name": "user-3"}}
+    requested = [c.args[0] for c in service.client.get_multiple_items.await_args_list]
+    assert requested == [[("User", 1), ("User", 2)], [("User", 3)]]
+
+    service.sync_user(2)
+    await service._bulk_get_users({2})
+
+    assert service.client.get_multiple_items.await_args.args[0] == [("User", 2)]
+
+
+@pytest.mark.asyncio
+async def test_smart_search_users_caches_matches(service):
+    service.client.search.return_value = {"data": [{"2": 11}]}
+
+    first = await service._smart_search_users("Maria")
+    second = await service._smart_search_users("maria")
+
+    assert first == second == ([11], [])
+    assert service.client.search.await_count == 1
+
+    service.sync_user()
+    await service._smart_search_users("maria")
+
+    assert service.client.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_smart_search_users_memoizes_empty_queries(service):
+    service.client.search.return_value = {"data": []}
+    service.client.get.return_value = {"data": []}
+
+    assert await service._smart_search_users("zzzz") == ([], [])
+    assert await service._smart_search_users("ZZZZ") == ([], [])
+
+    assert service.client.search.await_count == 1
+    assert service.client.get.await_count == 1
+
+    service.sync_user(5)
+    await service._smart_search_users("zzzz")
+
+    assert service.client.search.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_assets_links_matching_users(service):
+    async def search(item_type, **kwargs):
+        if item_type == "User":
+            return {"data": [{"2": 11}]}
+        return {"totalcount": 1, "data": [{"2": 4, "1": "pc-04", "70": 11}]}
+
+    service.client.search.side_effect = search
+
+    result = await service.search_assets("maria", entity_id=2)
+
+    assert result["assets"] == [{"id": 4, "name": "pc-04", "users_id": 11, "asset_type": "Computer"}]
+    criteria = service.client.search.await_args.kwargs["criteria"]
+    assert criteria[0] == {"field": 80, "searchtype": "under", "value": 2, "link": "AND"}
+    assert criteria[-1] == {"link": "OR", "field": 70, "searchtype": "equals", "value": 11}
+
+
+@pytest.mark.asyncio
+async def test_search_assets_normalizes_contact_and_status(service):
+    service.client.search.return_value = {
+        "totalcount": 1,
+        "data": [{"2": 4, "1": "pc-04", "7": "joana@GRUPO", "31": 2, "16": None}],
+    }
+
+    result = await service.search_assets("pc", asset_type="Computer")
+
+    assert result["assets"] == [{"id": 4, "name": "pc-04", "contact": "joana@GRUPO", "status": 2, "asset_type": "Computer"}]
+    assert result["pagination"]["has_more"] is False
+    assert result["pagination"]["next_offset"] is None
+    assert "smart_search_warning" not in result
+
+
+@pytest.mark.asyncio
+async def test_get_asset_stats_counts_across_pages(service, monkeypatch):
+    pages = [
+        {"totalcount": 3, "data": [{"2": 1, "31": 1, "3": 5, "23": None}, {"2": 2, "31": 1, "3": 6}]},
+        {"totalcount": 3, "data": [{"2": 3, "31": 2, "3": 5, "23": 9}]},
+    ]
+    service.client.search.side_effect = pages
+
+    # Páginas de 2 linhas para exercitar a paginação
+    iter_assets_min = service._iter_assets_min
+    monkeypatch.setattr(
+        service, "_iter_assets_min",
+        lambda item_type, entity_id=None: iter_assets_min(item_type, entity_id, page_size=2)
+    )
+
+    stats = await service.get_asset_stats(asset_type="Monitor", entity_id=4)
+
+    assert stats["total_assets"] == 3
+    assert stats["by_type"] == {"Monitor": 3}
+    assert stats["by_status"] == {1: 2, 2: 1}
+    assert stats["by_location"] == {5: 2, 6: 1}
+    assert stats["by_manufacturer"] == {"unknown": 2, 9: 1}
+    first_call = service.client.search.await_args_list[0].kwargs
+    assert first_call["forcedisplay"] == (2, 31, 3, 23)
+    assert first_call["use_cache"] is False
+    assert first_call["criteria"] == [{"field": 80, "searchtype": "under", "value": 4}]
+
+
+
+@pytest.mark.asyncio
+async def test_search_assets_reports_pagination_outside_results(service):
+    service.client.search.return_value = {"totalcount": 5, "data": [{"2": 1}, {"2": 2}]}
+
+    result = await service.search_assets("pc", limit=2)
+
+    assert result["assets"] == [{"id": 1, "asset_type": "Computer"}, {"id": 2, "asset_type": "Computer"}]
+    assert result["pagination"] == {"total": 5, "offset": 0, "limit": 2, "has_more": True, "next_offset": 2}
+
+
+@pytest.mark.asyncio
+async def test_iter_search_assets_pages_until_exhausted(service):
+    service.client.search.side_effect = [
+        {"totalcount": 3, "data": [{"2": 1}, {"2": 2}]},
+        {"totalcount": 3, "data": [{"2": 3}]},
+    ]
+
+    ids = [asset["id"] async for asset in service.iter_search_assets("pc", page_size=2)]
+
+    assert ids == [1, 2, 3]
+    assert [c.kwargs["range_offset"] for c in service.client.search.await_args_list] == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_search_assets_flags_deleted_user_matches(service):
+    async def search(item_type, **kwargs):
+        if item_type == "User":
+            return {"data": []}
+        return {"totalcount": 1, "data": [{"2": 4, "70": 31}]}
+
+    service.client.search.side_effect = search
+    service.client.get.return_value = {"data": [{"2": 31}]}
+
+    result = await service.search_assets("joana")
+
+    assert result["assets"] == [{"id": 4, "users_id": 31, "asset_type": "Computer"}]
+    assert result["deleted_user_ids"] == [31]
+    assert result["pagination"]["has_more"] is False
+    assert "USUÁRIO DELETADO" in result["smart_search_warning"]
+
+
+@pytest.mark.asyncio
+async def test_sync_user_drops_cached_logins(service):
+    service.client.search.return_value = {"data": [{"2": 7}]}
+
+    assert await service._resolve_username("joana") == 7
+    await service._resolve_username("joana")
+    assert service.client.search.await_count == 1
+
+    # Login renomeado: o login antigo não pode continuar resolvendo
+    service.client.search.return_value = {"data": []}
+    service.sync_user(7)
+
+    assert await service._resolve_username("joana") is None
+    assert service.client.search.await_count == 2
@@ -3,6 +3,7 @@ Testes para o serviço GLPI.
 """
 
 import pytest
+from datetime import datetime
 from unittest.mock import AsyncMock, patch, MagicMock
 from src.glpi_service import GLPIService
 from src.models import (
@@ -146,6 +147,35 @@ class TestTickets:
         result = await glpi_service.assign_ticket(1, 5)
         assert result.id == 1
 
+    @pytest.mark.asyncio
+    async def test_list_ticket_category_ids(self, glpi_service):
+        """Testa listagem apenas dos IDs de categoria."""
+        glpi_service.client.get.return_value = {
+            "data": [
+                {"id": 1, "itilcategories_id": 7},
+                {"id": 2, "itilcategories_id": None},
+                {"id": 3}
+            ]
+        }
+
+        result = await glpi_service.list_ticket_category_ids()
+        assert result == [7, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_list_ticket_category_ids_filters_period_and_entity(self, glpi_service):
+        """Testa filtro por período de abertura e entidade."""
+        recent = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        glpi_service.client.get.return_value = {
+            "data": [
+                {"id": 1, "itilcategories_id": 7, "entities_id": 2, "date": recent},
+                {"id": 2, "itilcategories_id": 8, "entities_id": 3, "date": recent},
+                {"id": 3, "itilcategories_id": 9, "entities_id": 2, "date": "2000-01-01 00:00:00"}
+            ]
+        }
+
+        result = await glpi_service.list_ticket_category_ids(entity_id=2, period_days=30)
+        assert result == [7]
+
 
 class TestAssets:
     """Testes para operações de assets."""
@@ -170,6 +200,29 @@ class TestAssets:
         result = await glpi_service.list_assets("Computer")
         assert len(result) == 1
 
+    @pytest.mark.asyncio
+    async def test_find_first_asset_limits_range(self, glpi_service):
+        """Testa busca do primeiro asset com range 0-0."""
+        glpi_service.client.get.return_value = {
+            "data": [{"1": "PC-01", "2": 42, "5": "SN123", "70": "joana", "31": "Em uso"}]
+        }
+
+        result = await glpi_service.find_first_asset("PC")
+        assert result.id == 42
+        assert result.serial_number == "SN123"
+        assert result.user == "joana"
+        assert result.status == "Em uso"
+        assert result.location is None
+        params = glpi_service.client.get.call_args.kwargs["params"]
+        assert params["range"] == "0-0"
+
+    @pytest.mark.asyncio
+    async def test_find_first_asset_not_found(self, glpi_service):
+        """Testa busca de asset sem resultados."""
+        glpi_service.client.get.return_value = {"totalcount": 0}
+
+        assert await glpi_service.find_first_asset("inexistente") is None
+
     @pytest.mark.asyncio
     async def test_get_asset_success(self, glpi_service):
         """Testa obtenção de asset."""
@@ -202,6 +255,82 @@ class TestAssets:
         assert result.id == 1
 
 
+class TestTicketStats:
+    """Testes para agregação de estatísticas de SLA."""
+
+    def test_aggregate_ticket_stats(self):
+        """Agregação deve contar status, atrasos e compliance em uma passada."""
+        from src.glpi_service import _aggregate_ticket_stats
+
+        items = [
+            # Solucionado dentro do prazo
+            {"date": "2024-05-02 08:00:00", "status": 5, "time_to_resolve": "2024-05-03 08:00:00",
+             "solvedate": "2024-05-02 12:00:00", "takeintoaccount_delay_stat": 1800, "solve_delay_stat": 14400},
+            # Fechado fora do prazo
+            {"date": "2024-05-03 08:00:00", "status": 6, "time_to_resolve": "2024-05-03 10:00:00",
+             "solvedate": "2024-05-04 08:00:00", "takeintoaccount_delay_stat": 5400, "solve_delay_stat": 86400},
+            # Aberto e vencido
+            {"date": "2024-05-04 08:00:00", "status": 2, "time_to_resolve": "2024-05-05 08:00:00"},
+            # Fora da janela
+            {"date": "2024-04-01 08:00:00", "status": 1},
+        ]
+
+        stats = _aggregate_ticket_stats(items, "2024-05-01 00:00:00", "2024-05-10 00:00:00")
+
+        assert stats == {
+            "opened": 3,
+            "solved": 2,
+            "in_progress": 1,
+            "overdue": 1,
+            "avg_response_time": "1h 0min",
+            "avg_resolution_time": "14h 0min",
+            "sla_compliance": 50.0,
+        }
+
+    def test_aggregate_ticket_stats_without_deadlines(self):
+        """Sem tickets com prazo, compliance não deve ser reportado."""
+        from src.glpi_service import _aggregate_ticket_stats
+
+        stats = _aggregate_ticket_stats(
+            [{"date": "2024-05-02 08:00:00", "status": 1}], "2024-05-01 00:00:00", "2024-05-10 00:00:00"
+        )
+
+        assert stats["opened"] == 1
+        assert "sla_compliance" not in stats
+
+    def test_aggregate_ticket_stats_skips_solved_without_solvedate(self):
+        """Solucionado sem solvedate não deve contar como dentro do prazo."""
+        from src.glpi_service import _aggregate_ticket_stats
+
+        items = [
+            {"date": "2024-05-02 08:00:00", "status": 5, "time_to_resolve": "2024-05-03 08:00:00",
+             "solvedate": "2024-05-04 08:00:00"},
+            {"date": "2024-05-02 09:00:00", "status": 6, "time_to_resolve": "2024-05-03 08:00:00"},
+        ]
+
+        stats = _aggregate_ticket_stats(items, "2024-05-01 00:00:00", "2024-05-10 00:00:00")
+
+        assert stats["solved"] == 2
+        assert stats["sla_compliance"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_ticket_stats_filters_entity(self, glpi_service):
+        """Filtro de entidade deve considerar apenas a entidade exata."""
+        from datetime import datetime
+
+        today = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        glpi_service.client.get.return_value = {
+            "data": [
+                {"id": 1, "entities_id": 2, "date": today, "status": 1},
+                {"id": 2, "entities_id": 3, "date": today, "status": 1},
+            ]
+        }
+
+        stats = await glpi_service.get_ticket_stats(entity_id=2)
+
+        assert stats["opened"] == 1
+
+
 class TestUsers:
     """Testes para operações de usuários."""
 
@@ -213,6 +342,18 @@ class TestUsers:
         result = await glpi_service.list_users()
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_find_first_user(self, glpi_service):
+        """Testa busca do primeiro usuário."""
+        glpi_service.client.get.return_value = {
+            "data": [{"1": "maria.silva", "2": 7, "9": "Maria", "34": "Silva"}]
+        }
+
+        result = await glpi_service.find_first_user("maria")
+        assert result.id == 7
+        assert result.firstname == "Maria"
+        assert glpi_service.client.get.call_args.kwargs["params"]["range"] == "0-0"
+
     @pytest.mark.asyncio
     async def test_create_user_invalid_firstname(self, glpi_service):
         """Testa criação de usuário com primeiro nome inválido."""
@@ -589,5 +589,22 @@ class TestMCPHandlersIntegration:
                     assert close_response["result"]["data"]["status"] == "closed"
 
 
+
+class TestResultSerialization:
+    """Testes para serialização de resultados na fronteira MCP."""
+
+    def test_dumps_result_stdlib_fallback(self, monkeypatch):
+        """Sem orjson, deve usar json da stdlib preservando acentos e datetimes."""
+        import json
+        from datetime import datetime
+        from src import handlers
+
+        monkeypatch.setattr(handlers, "_HAS_ORJSON", False)
+        text = handlers._dumps_result({"nome": "Solicitação", "quando": datetime(2025, 1, 2, 3, 4)})
+
+        assert "Solicitação" in text
+        assert json.loads(text)["quando"] == "2025-01-02 03:04:00"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
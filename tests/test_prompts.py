@@ -0,0 +1,444 @@
+"""
+Testes para o sistema de prompts profissionais.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.prompts_handlers.prompts import (
+    PromptHandler,
+    PROMPTS_CATALOG,
+    VALIDATORS
+)
+from src.models import NotFoundError, ValidationError
+
+
+@pytest.fixture
+def handler():
+    """Cria PromptHandler com serviço mockado."""
+    return PromptHandler(service=AsyncMock())
+
+
+class TestPromptHandlerInit:
+    """Testes para inicialização do PromptHandler."""
+
+    def test_uses_shared_service_by_default(self):
+        """Sem injeção, deve reutilizar a instância global de GLPIService."""
+        from src.glpi_service import glpi_service
+        assert PromptHandler().service is glpi_service
+
+    def test_accepts_injected_service(self):
+        """Serviço injetado deve ser utilizado."""
+        service = AsyncMock()
+        assert PromptHandler(service=service).service is service
+
+    def test_dispatch_table_covers_catalog(self):
+        """Tabela de despacho deve ter um método vinculado por prompt."""
+        prompt_handler = PromptHandler(service=AsyncMock())
+
+        assert set(prompt_handler._dispatch) == {p["name"] for p in PROMPTS_CATALOG}
+        assert prompt_handler._dispatch["glpi_ticket_summary"] == prompt_handler._prompt_ticket_summary
+
+
+    def test_uses_slots(self):
+        """Instância não deve ter __dict__ (atributos fixos em __slots__)."""
+        assert not hasattr(PromptHandler(service=AsyncMock()), "__dict__")
+
+class TestValidators:
+    """Testes para validadores pré-compilados de argumentos."""
+
+    def test_validator_per_prompt(self):
+        """Cada prompt do catálogo deve ter um validador."""
+        assert set(VALIDATORS) == {p["name"] for p in PROMPTS_CATALOG}
+
+    def test_missing_required_argument(self):
+        """Argumento obrigatório ausente deve levantar ValidationError."""
+        with pytest.raises(ValidationError) as exc_info:
+            VALIDATORS["glpi_onboarding_checklist"]({"username": "Maria"})
+        assert exc_info.value.details["field"] == "entity_name"
+
+    def test_optional_arguments_only(self):
+        """Prompts sem argumentos obrigatórios aceitam dict vazio."""
+        VALIDATORS["glpi_sla_performance"]({})
+
+    @pytest.mark.asyncio
+    async def test_get_prompt_unknown_name(self, handler):
+        """Prompt inexistente deve levantar NotFoundError."""
+        with pytest.raises(NotFoundError):
+            await handler.get_prompt("glpi_inexistente", {})
+
+    @pytest.mark.asyncio
+    async def test_get_prompt_validates_before_dispatch(self, handler):
+        """Validação deve ocorrer antes de chamar o serviço."""
+        with pytest.raises(ValidationError):
+            await handler.get_prompt("glpi_ticket_summary", {})
+        handler.service.get_ticket.assert_not_called()
+
+
+class TestCatalogValidation:
+    """Testes para validação do catálogo na importação."""
+
+    def test_catalog_is_valid(self):
+        """Catálogo distribuído deve passar na validação."""
+        from src.prompts_handlers.prompts import _validate_catalog
+
+        _validate_catalog()
+
+    def test_rejects_prompt_without_handler(self, monkeypatch):
+        """Prompt sem handler mapeado deve falhar."""
+        from src.prompts_handlers import prompts
+
+        broken = PROMPTS_CATALOG + [{"name": "glpi_sem_handler", "arguments": []}]
+        monkeypatch.setattr(prompts, "PROMPTS_CATALOG", broken)
+
+        with pytest.raises(ValueError):
+            prompts._validate_catalog()
+
+    def test_rejects_unknown_argument_type(self, monkeypatch):
+        """Tipo de argumento desconhecido deve falhar."""
+        from src.prompts_handlers import prompts
+
+        broken = [{
+            "name": "glpi_ticket_summary",
+            "arguments": [{"name": "ticket_id", "type": "float", "required": True}]
+        }]
+        monkeypatch.setattr(prompts, "PROMPTS_CATALOG", broken)
+
+        with pytest.raises(ValueError):
+            prompts._validate_catalog()
+
+
+class TestListPrompts:
+    """Testes para listagem do catálogo."""
+
+    @pytest.mark.asyncio
+    async def test_handle_list_prompts_does_not_resolve_service(self):
+        """Listar prompts não deve resolver o serviço GLPI."""
+        from src.prompts_handlers.prompts import handle_list_prompts, prompt_handler
+
+        service_before = prompt_handler._service
+        result = await handle_list_prompts()
+
+        assert len(result["prompts"]) == len(PROMPTS_CATALOG)
+        assert prompt_handler._service is service_before
+
+    @pytest.mark.asyncio
+    async def test_prompts_list_tool_uses_preserialized_payload(self):
+        """Tool prompts_list deve devolver o JSON pré-serializado do catálogo."""
+        import json
+        from src.handlers import mcp_handler
+        from src.prompts_handlers.prompts import PROMPTS_LIST_JSON
+
+        result = await mcp_handler.handle_call_tool("prompts_list", {})
+        text = result["content"][0]["text"]
+
+        assert text is PROMPTS_LIST_JSON
+        assert len(json.loads(text)["prompts"]) == len(PROMPTS_CATALOG)
+
+    @pytest.mark.asyncio
+    async def test_prompts_list_method(self):
+        """Método prompts/list deve retornar o catálogo completo."""
+        from src.handlers import mcp_handler
+
+        response = await mcp_handler.handle_request(
+            {"jsonrpc": "2.0", "method": "prompts/list", "id": 1}
+        )
+        assert response["result"]["prompts"] == PROMPTS_CATALOG
+
+    @pytest.mark.asyncio
+    async def test_list_prompts_returns_cached_payload(self, handler):
+        """Listagens sucessivas devem devolver o mesmo objeto pré-montado."""
+        from src.prompts_handlers.prompts import handle_list_prompts
+
+        first = await handle_list_prompts()
+        second = await handler.list_prompts()
+
+        assert first is second
+
+
+class TestEntityLoader:
+    """Testes para coalescência de list_entities."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_single_fetch(self):
+        """Chamadas concorrentes devem gerar uma única requisição."""
+        import asyncio
+        from src.models import Entity
+        from src.prompts_handlers.prompts import EntityLoader
+
+        entities = [Entity(id=1, name="Cliente Alfa")]
+        fetch = AsyncMock(return_value=entities)
+        loader = EntityLoader(fetch)
+
+        results = await asyncio.gather(*(loader.get_all() for _ in range(5)))
+
+        assert all(r == entities for r in results)
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_resolve_entity_partial_match(self, handler):
+        """Resolução de entidade deve aceitar nome parcial."""
+        from src.models import Entity
+
+        handler.service.list_entities.return_value = [
+            Entity(id=1, name="Cliente Alfa"),
+            Entity(id=2, name="Cliente Beta")
+        ]
+
+        entity = await handler._resolve_entity("beta")
+        assert entity.id == 2
+
+
+class TestTicketCache:
+    """Testes para o cache de tickets da camada de prompts."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompts_fetch_ticket_once(self, handler):
+        """Prompts seguidos sobre o mesmo ticket devem buscar no GLPI uma vez."""
+        from src.models import Ticket
+
+        handler.service.get_ticket.return_value = Ticket(id=7, name="Falha VPN", title="Falha VPN")
+
+        await handler.get_prompt("glpi_incident_investigation", {"ticket_id": 7})
+        await handler.get_prompt("glpi_incident_investigation", {"ticket_id": 7})
+
+        handler.service.get_ticket.assert_awaited_once_with(7)
+
+    @pytest.mark.asyncio
+    async def test_expired_and_evicted_entries_are_refetched(self):
+        """Entradas expiradas ou descartadas pelo LRU devem ser buscadas de novo."""
+        from src.prompts_handlers.prompts import TicketCache
+
+        fetch = AsyncMock(side_effect=lambda ticket_id: ticket_id)
+        cache = TicketCache(fetch, maxsize=1, ttl=30)
+
+        await cache.get(1)
+        await cache.get(2)  # descarta 1
+        await cache.get(1)
+        assert fetch.await_count == 3
+
+        expired = TicketCache(fetch, ttl=0)
+        await expired.get(1)
+        await expired.get(1)
+        assert fetch.await_count == 5
+
+
+class TestManagementPrompts:
+    """Testes para prompts de gestão."""
+
+    @pytest.mark.asyncio
+    async def test_ticket_trends_counts_categories(self, handler):
+        """Tendências devem contar tickets por categoria."""
+        handler.service.list_ticket_category_ids.return_value = [3, 3, 5, 0]
+
+        result = await handler.get_prompt("glpi_ticket_trends", {})
+
+        assert "1. 3: 2 tickets" in result.compact
+        assert "Sem Categoria: 1 tickets" in result.compact
+        assert "**Total de Tickets:** 4" in result.detailed
+
+    @pytest.mark.asyncio
+    async def test_ticket_trends_filters_period_and_entity(self, handler):
+        """Tendências devem repassar período e entidade resolvida à busca."""
+        from src.models import Entity
+
+        handler.service.list_entities.return_value = [Entity(id=4, name="GSM Transportes")]
+        handler.service.list_ticket_category_ids.return_value = []
+
+        await handler.get_prompt("glpi_ticket_trends", {"entity_name": "gsm", "period_days": 7})
+
+        handler.service.list_ticket_category_ids.assert_awaited_once_with(
+            limit=500, entity_id=4, period_days=7
+        )
+
+    @pytest.mark.asyncio
+    async def test_handle_get_prompt_returns_dict(self):
+        """Na fronteira MCP o resultado deve ser convertido para dict."""
+        from src.prompts_handlers.prompts import handle_get_prompt
+
+        result = await handle_get_prompt("glpi_change_management", {"change_description": "Trocar switch"})
+
+        assert isinstance(result, dict)
+        assert result["prompt_name"] == "glpi_change_management"
+
+    @pytest.mark.asyncio
+    async def test_sla_performance_single_timestamp(self, handler):
+        """Cabeçalho e metadata devem usar o mesmo instante da requisição."""
+        from datetime import datetime
+
+        handler.service.get_ticket_stats.return_value = {"sla_compliance": 96}
+
+        result = await handler.get_prompt("glpi_sla_performance", {})
+
+        generated_at = datetime.fromisoformat(result.metadata["generated_at"])
+        assert f"**Gerado em:** {generated_at.strftime('%d/%m/%Y %H:%M')}" in result.detailed
+
+    @pytest.mark.asyncio
+    async def test_prompt_response_shape(self, handler):
+        """Resposta de prompt deve manter as chaves esperadas pelo MCP."""
+        result = await handler.get_prompt("glpi_cost_per_ticket", {"entity_name": "Alfa"})
+
+        assert set(result.to_dict()) == {"prompt_name", "compact", "detailed", "metadata"}
+        assert result.prompt_name == "glpi_cost_per_ticket"
+        assert result.metadata == {"period_days": 30, "entity_name": "Alfa"}
+
+
+class TestTemplateHelpers:
+    """Testes para helpers de template."""
+
+    def test_entity_label(self):
+        """Rótulo de cliente deve usar fallback quando não informado."""
+        from src.prompts_handlers.prompts import _entity_label
+
+        assert _entity_label("Alfa") == "Cliente: Alfa"
+        assert _entity_label(None) == "Todos os clientes"
+        assert _entity_label("", "Global") == "Global"
+
+
+    @pytest.mark.parametrize("compliance, expected", [
+        (79.9, "Ação urgente"),
+        (80, "Atenção necessária"),
+        (90, "Bom desempenho"),
+        (95, "Excelente desempenho"),
+    ])
+    def test_sla_analysis_thresholds(self, handler, compliance, expected):
+        """Faixas de SLA devem incluir o limite inferior de cada faixa."""
+        assert expected in handler._generate_sla_analysis({"sla_compliance": compliance})
+
+    def test_roi_recommendation(self, handler):
+        """Recomendação de ROI só aponta subutilização acima de 5 ativos."""
+        assert handler._generate_roi_recommendation({"underutilized": 5}).startswith("Utilização otimizada")
+        assert "Identificados 6 ativos" in handler._generate_roi_recommendation({"underutilized": 6})
+
+
+class TestSupportPrompts:
+    """Testes para prompts de suporte."""
+
+    @pytest.mark.asyncio
+    async def test_asset_lookup_not_found(self, handler):
+        """Busca sem resultado deve retornar mensagem de não encontrado."""
+        handler.service.find_first_asset.return_value = None
+
+        result = await handler.get_prompt("glpi_asset_lookup", {"search_term": "XYZ"})
+
+        assert "Nenhum ativo encontrado" in result.compact
+        handler.service.find_first_asset.assert_awaited_once_with("XYZ")
+
+    @pytest.mark.asyncio
+    async def test_asset_lookup_renders_fetched_fields(self, handler):
+        """Ativo encontrado deve exibir os campos trazidos do GLPI."""
+        from src.models import Asset
+
+        handler.service.find_first_asset.return_value = Asset(
+            id=42, name="PC-01", asset_type="Computer", serial_number="SN123",
+            otherserial="PAT-9", user="joana", location="Matriz > TI", status="Em uso"
+        )
+
+        result = await handler.get_prompt("glpi_asset_lookup", {"search_term": "PC"})
+
+        assert "Serial: SN123" in result.compact
+        assert "Usuário: joana" in result.compact
+        assert "Local: Matriz > TI" in result.compact
+        assert "Status: Em uso" in result.compact
+        assert "**Patrimônio:** PAT-9" in result.detailed
+        assert "**Tipo:** Computer" in result.detailed
+
+    @pytest.mark.asyncio
+    async def test_onboarding_checklist_fills_template(self, handler):
+        """Checklist deve preencher login e email derivados do nome."""
+        result = await handler.get_prompt(
+            "glpi_onboarding_checklist",
+            {"username": "Maria Silva", "entity_name": "Alfa"}
+        )
+
+        assert "Maria Silva - Alfa" in result.compact
+        assert "Email: maria.silva@empresa.com.br" in result.detailed
+
+    @pytest.mark.asyncio
+    async def test_incident_investigation_missing_fields(self, handler):
+        """Campos ausentes no ticket devem ser renderizados como N/A."""
+        from src.models import Ticket
+
+        handler.service.get_ticket.return_value = Ticket(id=9, name="Falha VPN", title="Falha VPN")
+
+        result = await handler.get_prompt("glpi_incident_investigation", {"ticket_id": 9})
+
+        assert "**Data do Incidente:** N/A" in result.detailed
+        assert "**Impacto:** 3" in result.detailed
+        assert "Sem descrição" in result.detailed
+        assert "**Técnico Responsável:** Não atribuído" in result.detailed
+
+    def test_render_templates_rejects_missing_fields(self):
+        """Campo do template ausente no ctx deve falhar, não virar N/A."""
+        from src.prompts_handlers.prompts import _render_templates
+
+        with pytest.raises(KeyError):
+            _render_templates("{ticket_id}", "{ticket_nme}", {"ticket_id": 1}, "both")
+
+    @pytest.mark.asyncio
+    async def test_ticket_summary_uses_glpi_fields(self, handler):
+        """Campos nativos do GLPI (date, content) devem chegar ao resumo."""
+        from src.models import Ticket
+
+        handler.service.get_ticket.return_value = Ticket(
+            id=4, name="Impressora", title="Impressora",
+            date="2024-05-02 08:00:00", content="Impressora offline no 2º andar"
+        )
+
+        result = await handler.get_prompt("glpi_ticket_summary", {"ticket_id": 4})
+
+        assert "📅 Aberto: 2024-05-02 08:00:00" in result.compact
+        assert "Impressora offline no 2º andar" in result.detailed
+        assert "Não atribuído" in result.detailed
+
+    @pytest.mark.asyncio
+    async def test_user_ticket_history_unknown_user(self, handler):
+        """Usuário inexistente deve levantar NotFoundError."""
+        handler.service.find_first_user.return_value = None
+
+        with pytest.raises(NotFoundError):
+            await handler.get_prompt("glpi_user_ticket_history", {"username": "ninguem"})
+
+
+    @pytest.mark.asyncio
+    async def test_knowledge_base_search_normalizes_query(self, handler):
+        """Termo de busca deve ter espaços e quebras de linha colapsados."""
+        result = await handler.get_prompt(
+            "glpi_knowledge_base_search", {"search_query": "  senha\n  expirada\t vpn "}
+        )
+
+        assert 'Termo: "senha expirada vpn"' in result.compact
+        assert result.metadata == {"search_query": "senha expirada vpn"}
+
+
+class TestOutputFormat:
+    """Testes para o argumento reservado _format."""
+
+    @pytest.mark.asyncio
+    async def test_compact_skips_detailed(self, handler):
+        """Formato compact não deve gerar o relatório detalhado."""
+        result = await handler.get_prompt(
+            "glpi_change_management",
+            {"change_description": "Migrar servidor", "_format": "compact"}
+        )
+
+        assert result.detailed is None
+        assert "Migrar servidor" in result.compact
+
+    @pytest.mark.asyncio
+    async def test_default_builds_both(self, handler):
+        """Sem _format, ambos os formatos devem ser gerados."""
+        result = await handler.get_prompt(
+            "glpi_change_management", {"change_description": "Migrar servidor"}
+        )
+
+        assert result.detailed.startswith("# Request for Change (RFC)")
+
+    @pytest.mark.asyncio
+    async def test_invalid_format(self, handler):
+        """Formato desconhecido deve levantar ValidationError."""
+        with pytest.raises(ValidationError):
+            await handler.get_prompt(
+                "glpi_change_management",
+                {"change_description": "Migrar servidor", "_format": "html"}
+            )
@@ -4,6 +4,7 @@ Testes adicionais para SessionManager cobrindo cache e rate limit.
 
 import asyncio
 import time
+import httpx
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -41,3 +42,55 @@ def test_rate_limit_blocks_when_exceeded():
     manager._rate_limits[key] = (manager._rate_limit_per_minute, time.time())
     with pytest.raises(RateLimitError):
         manager._check_rate_limit(key)
+
+
+def test_json_body_falls_back_to_httpx_json(monkeypatch):
+    """Sem orjson, o corpo deve ser repassado via json= do httpx."""
+    from src.auth import session_manager as sm
+
+    monkeypatch.setattr(sm, "_HAS_ORJSON", False)
+
+    assert sm._json_body({"input": {"name": "Maria"}}) == {"json": {"input": {"name": "Maria"}}}
+
+
+def test_json_body_preserializes_with_orjson():
+    """Com orjson, o corpo deve ir pré-serializado com Content-Type JSON."""
+    import json
+    pytest.importorskip("orjson")
+    from src.auth import session_manager as sm
+
+    body = sm._json_body({"input": {"name": "Conceição"}})
+
+    assert json.loads(body["content"]) == {"input": {"name": "Conceição"}}
+    assert body["headers"]["Content-Type"] == "application/json"
+
+
+def test_pooled_client_kwargs_uses_settings_limits(monkeypatch):
+    """Clientes por usuário devem usar o mesmo transporte com pool e timeouts."""
+    from src.auth import session_manager as sm
+
+    transport = MagicMock()
+    limits = MagicMock()
+    monkeypatch.setattr(sm.httpx, "AsyncHTTPTransport", transport)
+    monkeypatch.setattr(sm.httpx, "Limits", limits)
+
+    kwargs = sm.pooled_client_kwargs(20, 10)
+
+    limits.assert_called_once_with(max_keepalive_connections=10, max_connections=20)
+    transport.assert_called_once_with(http2=sm._HAS_H2, retries=1, limits=limits.return_value)
+    assert kwargs["transport"] is transport.return_value
+    assert kwargs["timeout"].connect == sm.settings.connection_timeout
+    assert kwargs["timeout"].read == sm.settings.request_timeout
+
+
+@pytest.mark.asyncio
+async def test_is_connected_tracks_client_lifecycle():
+    """is_connected reflete o cliente principal criado/fechado."""
+    manager = SessionManager()
+    assert manager.is_connected is False
+
+    manager._client = httpx.AsyncClient()
+    assert manager.is_connected is True
+
+    await manager._client.aclose()
+    assert manager.is_connected is False